@@ -0,0 +1,115 @@
+"""
+生成精简中文字体 (Noto Sans SC 子集)
+只保留 ASCII、常用标点和 GB2312 汉字，输出 NotoSansSC-Subset.otf 及其字符表 NotoSansSC-Subset.json
+应用优先加载子集字体，遇到子集中没有的字符时再切换到完整字体
+
+需要 fontTools: pip install fonttools
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from download_font import FONT_FILE, download_font
+
+SUBSET_FILE = "NotoSansSC-Subset.otf"
+COVERAGE_FILE = "NotoSansSC-Subset.json"
+
+# 西文、通用标点、全角符号
+RANGES = [
+    (0x0020, 0x007E),   # ASCII
+    (0x00A0, 0x00FF),   # Latin-1
+    (0x2000, 0x206F),   # 通用标点 (引号、破折号、省略号)
+    (0x2190, 0x21FF),   # 箭头
+    (0x2200, 0x22FF),   # 数学运算符
+    (0x3000, 0x303F),   # 中文标点
+    (0xFF00, 0xFFEF),   # 全角字符
+]
+
+
+def gb2312_chars(level=2):
+    """GB2312 字符: level 1 为 3755 个一级常用汉字, level 2 再加二级汉字和符号"""
+    rows = range(0xA1, 0xF8) if level >= 2 else range(0xB0, 0xD8)
+    chars = []
+    for hi in rows:
+        for lo in range(0xA1, 0xFF):
+            try:
+                chars.append(bytes([hi, lo]).decode('gb2312'))
+            except UnicodeDecodeError:
+                pass
+    return chars
+
+
+def collect_chars(level=2, extra_files=()):
+    chars = set()
+    for start, end in RANGES:
+        chars.update(chr(cp) for cp in range(start, end + 1))
+    chars.update(gb2312_chars(level))
+    # 术语表等文件中出现的字符也保留
+    for path in extra_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            chars.update(ch for ch in f.read() if not ch.isspace())
+    return chars
+
+
+def subset_font(font_path, out_path, chars):
+    """用 fontTools 生成子集，返回字体中实际存在的字符"""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        print("需要 fontTools: pip install fonttools")
+        return None
+
+    font = TTFont(font_path)
+    cmap = font.getBestCmap()
+    covered = sorted(ch for ch in chars if ord(ch) in cmap)
+
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    options.hinting = False
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes=[ord(ch) for ch in covered])
+    subsetter.subset(font)
+    font.save(out_path)
+    return covered
+
+
+def main(argv=None):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="生成精简中文字体")
+    parser.add_argument('--font', default=os.path.join(script_dir, FONT_FILE), help="完整字体路径")
+    parser.add_argument('--level', type=int, choices=(1, 2), default=2, help="GB2312 汉字级别 (1: 3755 字, 2: 6763 字)")
+    parser.add_argument('--extra', nargs='*', default=[], help="额外保留其中字符的文本文件 (如 glossary.tsv)")
+    args = parser.parse_args(argv)
+
+    font_path = args.font
+    if not os.path.exists(font_path):
+        font_path = download_font()
+    if not font_path:
+        return 1
+    with open(font_path, 'rb') as f:
+        if f.read(4) not in (b'\x00\x01\x00\x00', b'OTTO', b'true'):
+            print(f"不是有效的字体文件 (下载失败?): {font_path}")
+            return 1
+
+    out_path = os.path.join(script_dir, SUBSET_FILE)
+    covered = subset_font(font_path, out_path, collect_chars(args.level, args.extra))
+    if covered is None:
+        return 1
+
+    with open(os.path.join(script_dir, COVERAGE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'source': os.path.basename(font_path), 'chars': "".join(covered)}, f, ensure_ascii=False)
+
+    full_size = os.path.getsize(font_path)
+    out_size = os.path.getsize(out_path)
+    print(f"子集字体: {out_path}")
+    print(f"  {len(covered)} 个字符, {full_size / 1024:.0f} KB -> {out_size / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""
+Benchmark suite - mock API server and translation scenarios
+
+Run with: python -m benchmark --help
+"""
+
+from .mock_server import LatencyModel, MockConfig, MockServer
+from .scenarios import SCENARIOS, ScenarioResult, run_scenario
+
+__all__ = ['LatencyModel', 'MockConfig', 'MockServer', 'SCENARIOS', 'ScenarioResult', 'run_scenario']
@@ -0,0 +1,118 @@
+"""
+Benchmark runner
+
+Examples:
+    python -m benchmark
+    python -m benchmark --scenario burst --latency lognormal:0.2:0.5 --rate-429 0.1
+    python -m benchmark --json bench.json --baseline bench_baseline.json
+"""
+
+import argparse
+import json
+import sys
+
+from .mock_server import LatencyModel, MockConfig, MockServer
+from .scenarios import SCENARIOS, make_translator, run_scenario
+
+
+# Metrics where a larger value is a regression
+LOWER_IS_BETTER = ('p50_ms', 'p90_ms', 'p99_ms', 'peak_alloc_mb')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Translator benchmark suite")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable, default: all)")
+    parser.add_argument('--requests', type=int, default=None, help="Requests per scenario")
+    parser.add_argument('--workers', type=int, default=4, help="Workers for the concurrent scenario")
+    parser.add_argument('--doc-chars', type=int, default=20000, help="Document size for long_document")
+    parser.add_argument('--doc-requests', type=int, default=3, help="Requests for long_document")
+    parser.add_argument('--latency', default="fixed:0.05", help="kind:mean[:spread] (fixed/uniform/normal/lognormal)")
+    parser.add_argument('--tokens-per-sec', type=float, default=2000.0, help="Simulated generation speed")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Probability of HTTP 500")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="Probability of HTTP 429")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Server-side requests/sec limit (0 = off)")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument('--trace-memory', action='store_true', help="Measure peak Python allocations")
+    parser.add_argument('--json', dest='json_out', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against a previous --json output")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="Allowed regression ratio vs baseline")
+    return parser.parse_args(argv)
+
+
+def print_table(rows):
+    columns = ['scenario', 'requests', 'errors', 'rps', 'p50_ms', 'p90_ms', 'p99_ms', 'peak_alloc_mb', 'max_rss_mb']
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
+
+
+def compare(rows, baseline, tolerance):
+    """Print deltas against a baseline, return number of regressions"""
+    previous = {row['scenario']: row for row in baseline.get('results', [])}
+    regressions = 0
+    for row in rows:
+        old = previous.get(row['scenario'])
+        if not old:
+            continue
+        for key in ('rps',) + LOWER_IS_BETTER:
+            before, after = old.get(key, 0), row.get(key, 0)
+            if not before:
+                continue
+            change = (after - before) / before
+            worse = change < -tolerance if key == 'rps' else change > tolerance
+            if worse:
+                regressions += 1
+            marker = "REGRESSION" if worse else ""
+            print(f"  {row['scenario']:<14} {key:<14} {before:>10} -> {after:<10} ({change:+.1%}) {marker}")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = args.scenario or list(SCENARIOS)
+
+    config = MockConfig(
+        latency=LatencyModel.parse(args.latency, seed=args.seed),
+        tokens_per_sec=args.tokens_per_sec,
+        error_rate=args.error_rate,
+        rate_429=args.rate_429,
+        rate_limit_rps=args.rate_limit,
+        seed=args.seed,
+    )
+
+    rows = []
+    with MockServer(config) as server:
+        print(f"Mock server: {server.url}")
+        translator = make_translator(server.url)
+        for name in names:
+            kwargs = {'workers': args.workers, 'doc_chars': args.doc_chars}
+            if name == 'long_document':
+                kwargs['requests'] = args.doc_requests
+            elif args.requests:
+                kwargs['requests'] = args.requests
+            result = run_scenario(name, translator, trace_memory=args.trace_memory, **kwargs)
+            rows.append(result.to_dict())
+        server_stats = server.stats.snapshot()
+
+    print()
+    print_table(rows)
+    print(f"\nServer: {server_stats}")
+
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump({'config': vars(args), 'results': rows, 'server': server_stats}, f, indent=2)
+        print(f"Results written to {args.json_out}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.baseline}:")
+        if compare(rows, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Mock SiliconFlow Server - local OpenAI-compatible endpoint for benchmarks
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LatencyModel:
+    """Latency distribution for mock responses (seconds)"""
+
+    KINDS = ('fixed', 'uniform', 'normal', 'lognormal')
+
+    def __init__(self, kind="fixed", mean=0.05, spread=0.0, seed=None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency kind: {kind}")
+        self.kind = kind
+        self.mean = mean
+        self.spread = spread
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self):
+        """Draw one latency value"""
+        with self._lock:
+            if self.kind == 'fixed':
+                value = self.mean
+            elif self.kind == 'uniform':
+                value = self._random.uniform(self.mean - self.spread, self.mean + self.spread)
+            elif self.kind == 'normal':
+                value = self._random.gauss(self.mean, self.spread)
+            else:
+                # spread is the sigma of the underlying normal distribution
+                mu = math.log(max(self.mean, 1e-6)) - (self.spread ** 2) / 2
+                value = self._random.lognormvariate(mu, self.spread)
+        return max(0.0, value)
+
+    @classmethod
+    def parse(cls, spec, seed=None):
+        """Parse 'kind:mean[:spread]', e.g. 'lognormal:0.2:0.5'"""
+        parts = spec.split(':')
+        kind = parts[0]
+        mean = float(parts[1]) if len(parts) > 1 else 0.05
+        spread = float(parts[2]) if len(parts) > 2 else 0.0
+        return cls(kind, mean, spread, seed=seed)
+
+
+class MockConfig:
+    """Behaviour knobs of the mock server"""
+
+    def __init__(self, latency=None, tokens_per_sec=200.0, error_rate=0.0,
+                 rate_429=0.0, rate_limit_rps=0.0, seed=None):
+        self.latency = latency or LatencyModel()
+        self.tokens_per_sec = tokens_per_sec
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.rate_limit_rps = rate_limit_rps
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def roll(self, probability):
+        """Return True with the given probability"""
+        if probability <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < probability
+
+
+class MockStats:
+    """Counters collected by the server"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.streamed = 0
+        self.errors = 0
+        self.throttled = 0
+
+    def bump(self, name):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'streamed': self.streamed,
+                'errors': self.errors,
+                'throttled': self.throttled,
+            }
+
+
+def estimate_tokens(text):
+    """Rough token estimate: CJK chars count as one token, others as 1/4"""
+    cjk = sum(1 for ch in text if '一' <= ch <= '鿿')
+    return cjk + max(1, (len(text) - cjk) // 4) if text else 0
+
+
+def fake_translation(text):
+    """Produce a deterministic output roughly the size of the input"""
+    return "[mock] " + text
+
+
+class _TokenBucket:
+    """Simple token bucket used for server-side rate limiting"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Handler for /v1/chat/completions"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+    def do_POST(self):
+        server = self.server
+        config = server.config
+        server.stats.bump('requests')
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if self.path.rstrip('/') != '/v1/chat/completions':
+            self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+            return
+
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            self._send_json(401, {"error": {"message": "Missing API key"}})
+            return
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+            messages = payload.get('messages', [])
+        except Exception as e:
+            self._send_json(400, {"error": {"message": f"Invalid JSON: {e}"}})
+            return
+
+        if (server.bucket and not server.bucket.take()) or config.roll(config.rate_429):
+            server.stats.bump('throttled')
+            self._send_json(429, {"error": {"message": "Rate limit exceeded"}},
+                            extra_headers={"Retry-After": "1"})
+            return
+
+        time.sleep(config.latency.sample())
+
+        if config.roll(config.error_rate):
+            server.stats.bump('errors')
+            self._send_json(500, {"error": {"message": "Mock internal error"}})
+            return
+
+        user_text = ""
+        prompt_text = ""
+        system_text = ""
+        for message in messages:
+            content = message.get('content') or ""
+            prompt_text += content
+            if message.get('role') == 'user':
+                user_text = content
+            elif message.get('role') == 'system':
+                system_text = content
+
+        output = fake_translation(user_text)
+        usage = {
+            "prompt_tokens": estimate_tokens(prompt_text),
+            "completion_tokens": estimate_tokens(output),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        # Prefix caching: a system prompt seen before counts as cached prompt tokens
+        usage["prompt_tokens_details"] = {
+            "cached_tokens": estimate_tokens(system_text) if server.seen_prefix(system_text) else 0,
+        }
+
+        if payload.get('stream'):
+            server.stats.bump('streamed')
+            self._send_stream(payload.get('model', ''), output, usage, config.tokens_per_sec)
+        else:
+            if config.tokens_per_sec > 0:
+                time.sleep(usage["completion_tokens"] / config.tokens_per_sec)
+            self._send_json(200, {
+                "id": f"mock-{server.stats.requests}",
+                "object": "chat.completion",
+                "model": payload.get('model', ''),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": output},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+
+    def _send_json(self, status, obj, extra_headers=None):
+        data = json.dumps(obj).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, model, output, usage, tokens_per_sec):
+        """Send an SSE stream, one chunk per ~4 characters"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        delay = 1.0 / tokens_per_sec if tokens_per_sec > 0 else 0.0
+        for i in range(0, len(output), 4):
+            chunk = {
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": output[i:i + 4]}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            if delay:
+                time.sleep(delay)
+
+        final = {
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+        self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode('utf-8'))
+        self.wfile.flush()
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The socketserver default backlog (5) drops SYNs during bursts
+    request_queue_size = 128
+
+    def seen_prefix(self, text):
+        """Record a prompt prefix; True if it was already cached"""
+        with self._prefix_lock:
+            if text in self._prefixes:
+                return True
+            if len(self._prefixes) >= 64:
+                self._prefixes.clear()
+            self._prefixes.add(text)
+            return False
+
+
+class MockServer:
+    """Run the mock API on a background thread"""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockConfig()
+        self.httpd = _MockHTTPServer((host, port), MockHandler)
+        self.httpd.config = self.config
+        self.httpd.stats = MockStats()
+        self.httpd.bucket = _TokenBucket(self.config.rate_limit_rps) if self.config.rate_limit_rps > 0 else None
+        self.httpd._prefixes = set()
+        self.httpd._prefix_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self):
+        return self.httpd.stats
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,184 @@
+"""
+Benchmark Scenarios - drive TranslatorService against the mock server
+"""
+
+import math
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from translator import TranslatorService
+
+
+SAMPLE_SENTENCE = (
+    "Transformer-based language models have shown remarkable performance "
+    "on a wide range of natural language processing benchmarks. "
+)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def max_rss_mb():
+    """Peak resident set size of this process in MB (0 if unavailable)"""
+    if resource is None:
+        return 0.0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    if sys.platform == 'darwin':
+        return rss / (1024.0 * 1024.0)
+    return rss / 1024.0
+
+
+class ScenarioResult:
+    """Measurements for one scenario run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.errors = 0
+        self.elapsed = 0.0
+        self.peak_alloc_mb = 0.0
+        self.max_rss_mb = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, latency, ok):
+        with self.lock:
+            self.latencies.append(latency)
+            if not ok:
+                self.errors += 1
+
+    @property
+    def requests(self):
+        return len(self.latencies)
+
+    def to_dict(self):
+        rps = self.requests / self.elapsed if self.elapsed > 0 else 0.0
+        return {
+            'scenario': self.name,
+            'requests': self.requests,
+            'errors': self.errors,
+            'elapsed_s': round(self.elapsed, 4),
+            'rps': round(rps, 2),
+            'p50_ms': round(percentile(self.latencies, 50) * 1000, 2),
+            'p90_ms': round(percentile(self.latencies, 90) * 1000, 2),
+            'p99_ms': round(percentile(self.latencies, 99) * 1000, 2),
+            'max_ms': round(max(self.latencies) * 1000, 2) if self.latencies else 0.0,
+            'peak_alloc_mb': round(self.peak_alloc_mb, 3),
+            'max_rss_mb': round(self.max_rss_mb, 2),
+        }
+
+
+def make_translator(api_url):
+    """TranslatorService configured for the mock server"""
+    translator = TranslatorService()
+    translator.set_config(api_key="bench-key", api_url=api_url)
+    # Same request bytes on every run, so results compare across runs
+    translator.profile = 'deterministic'
+    return translator
+
+
+def timed_translate(translator, text, result):
+    """Translate once and record latency in result"""
+    start = time.perf_counter()
+    output = translator.translate(text)
+    ok = bool(output) and not (output.startswith("Error:") or output.startswith("Translation failed:"))
+    result.record(time.perf_counter() - start, ok)
+    return output
+
+
+def _run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def scenario_single(translator, requests=20, **kwargs):
+    """Sequential single-paragraph requests"""
+    result = ScenarioResult('single')
+    for i in range(requests):
+        timed_translate(translator, f"{i}. {SAMPLE_SENTENCE}", result)
+    return result
+
+
+def scenario_burst(translator, requests=20, **kwargs):
+    """All requests fired at once, like rapid repeated copies"""
+    result = ScenarioResult('burst')
+    barrier = threading.Barrier(requests)
+
+    def worker(i):
+        barrier.wait()
+        timed_translate(translator, f"{i}. {SAMPLE_SENTENCE}", result)
+
+    _run_threads(requests, worker)
+    return result
+
+
+def scenario_long_document(translator, requests=3, doc_chars=20000, **kwargs):
+    """A few very large inputs"""
+    result = ScenarioResult('long_document')
+    repeats = max(1, doc_chars // len(SAMPLE_SENTENCE))
+    document = SAMPLE_SENTENCE * repeats
+    for i in range(requests):
+        timed_translate(translator, f"{i}. {document}", result)
+    return result
+
+
+def scenario_concurrent(translator, requests=40, workers=4, **kwargs):
+    """A fixed pool of workers draining a request queue"""
+    result = ScenarioResult('concurrent')
+    counter = iter(range(requests))
+    lock = threading.Lock()
+
+    def worker(_):
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            timed_translate(translator, f"{i}. {SAMPLE_SENTENCE}", result)
+
+    _run_threads(workers, worker)
+    return result
+
+
+SCENARIOS = {
+    'single': scenario_single,
+    'burst': scenario_burst,
+    'long_document': scenario_long_document,
+    'concurrent': scenario_concurrent,
+}
+
+
+def run_scenario(name, translator, trace_memory=False, **kwargs):
+    """Run a scenario by name and fill in timing and memory figures"""
+    func = SCENARIOS[name]
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func(translator, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = 0
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    result.elapsed = elapsed
+    result.peak_alloc_mb = peak / (1024.0 * 1024.0)
+    result.max_rss_mb = max_rss_mb()
+    return result
@@ -13,16 +13,19 @@ package.domain = org.zotero
 source.dir = .
 
 # (list) 要包含的源文件
-source.include_exts = py,png,jpg,kv,atlas,json,otf,ttf,ttc,java,xml
+source.include_exts = py,png,jpg,kv,atlas,json,otf,ttf,ttc,java,xml,tsv
 
 # (list) 要排除的目录
-source.exclude_dirs = tests, bin, venv, .git, __pycache__, .buildozer
+source.exclude_dirs = tests, bin, venv, .git, __pycache__, .buildozer, benchmark
+
+# (list) 要排除的文件 (打包子集字体 NotoSansSC-Subset.otf，缺字时改用系统完整字体)
+source.exclude_patterns = assets/NotoSansSC-Regular.otf, assets/*.py, assets/.icons_manifest.json, assets/res/*
 
 # (str) 应用版本
 version = 1.0.0
 
 # (list) 应用需求
-requirements = python3,kivy,pyjnius,android,certifi,urllib3,cython==0.29.36
+requirements = python3,kivy,pyjnius,android,certifi,urllib3,sqlite3,cython==0.29.36
 
 # (str) 自定义源代码用于支持requirements
 # requirements.source.kivy = ../../kivy
@@ -33,6 +36,9 @@ requirements = python3,kivy,pyjnius,android,certifi,urllib3,cython==0.29.36
 # (str) 应用图标
 # icon.filename = %(source.dir)s/assets/icon.png
 
+# (str) 各密度图标与启动画面 (mipmap-*/drawable-port-*，由 create_icons.py 生成)
+# android.add_resources = assets/res
+
 # (str) 支持的屏幕方向
 orientation = portrait,portrait-reverse,landscape,landscape-reverse
 
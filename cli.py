@@ -0,0 +1,340 @@
+"""
+Zotero Translation Assistant - command-line batch mode
+
+Examples:
+    python cli.py translate paragraphs.txt -o out.jsonl
+    cat records.jsonl | python cli.py translate --format jsonl --field abstract > out.jsonl
+    python cli.py translate big.jsonl -o out.jsonl --checkpoint big.ckpt   # rerun to resume
+    python cli.py zotero ~/Zotero/zotero.sqlite --store zotero_translations.db
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from translator import TranslatorService
+from core import Glossary, TranslationEngine, TranslationScheduler, UsageTracker
+from core.batch import translate_ordered
+from core import zotero_library
+
+
+DEFAULT_CONFIG = 'translator_config.json'
+DEFAULT_GLOSSARY = 'glossary.tsv'
+DEFAULT_USAGE = 'usage_stats.json'
+
+
+def load_settings(path):
+    """Read the app's JsonStore settings file, if present"""
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('settings', {})
+    except Exception as e:
+        print(f"[CLI] Could not read {path}: {e}", file=sys.stderr)
+        return {}
+
+
+def build_engine(args):
+    """TranslatorService + engine configured from settings file, env and flags"""
+    settings = load_settings(args.config)
+    translator = TranslatorService()
+    translator.set_config(
+        api_key=args.api_key or os.environ.get('SILICONFLOW_API_KEY', '') or settings.get('api_key', ''),
+        api_url=args.api_url or settings.get('api_url', ''),
+        model=args.model or settings.get('model', ''),
+        target_lang=args.target_lang or settings.get('target_lang', ''),
+    )
+    translator.protect_spans = not args.no_protect
+    if args.deterministic or settings.get('deterministic'):
+        translator.profile = 'deterministic'
+    engine = TranslationEngine(translator, normalize=not args.no_normalize, keep_paragraphs=not args.join_paragraphs,
+                               skip_untranslatable=not args.no_skip, glossary=Glossary.load(args.glossary),
+                               usage=UsageTracker(args.usage_file or None))
+    if engine.glossary:
+        print(f"[CLI] Glossary: {len(engine.glossary)} terms from {args.glossary}", file=sys.stderr)
+    # Unattended output is never checked by a person: near matches only when asked for
+    engine.fuzzy.threshold = args.fuzzy if args.fuzzy is not None else 0
+    return engine
+
+
+def close_usage(engine):
+    """Save token totals and report this run's usage"""
+    engine.usage.close()
+    session = engine.usage.session
+    print(f"[CLI] Tokens: {session['prompt_tokens']} prompt + {session['completion_tokens']} completion "
+          f"in {session['requests']} requests", file=sys.stderr)
+
+
+def iter_lines(paths):
+    """Yield lines from files ('-' is stdin) without loading them whole"""
+    for path in paths or ['-']:
+        if path == '-':
+            for line in sys.stdin:
+                yield line
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield line
+
+
+def iter_records(lines, fmt, field, split):
+    """Yield (record, text) pairs from a line stream"""
+    if fmt == 'jsonl':
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield {'_line': number, 'error': f"Invalid JSON: {e}"}, ""
+                continue
+            if not isinstance(record, dict):
+                record = {field: record}
+            text = record.get(field)
+            yield record, text if isinstance(text, str) else ""
+    elif split == 'paragraph':
+        buffer = []
+        for line in lines:
+            if line.strip():
+                buffer.append(line.rstrip('\n'))
+            elif buffer:
+                text = "\n".join(buffer)
+                buffer = []
+                yield {field: text}, text
+        if buffer:
+            text = "\n".join(buffer)
+            yield {field: text}, text
+    else:
+        for line in lines:
+            text = line.rstrip('\n')
+            if text.strip():
+                yield {field: text}, text
+
+
+def detect_format(paths):
+    """Guess jsonl/text from file extensions"""
+    if paths and all(p != '-' and p.endswith(('.jsonl', '.ndjson')) for p in paths):
+        return 'jsonl'
+    return 'text'
+
+
+class Checkpoint:
+    """Number of input records already written to the output, and the output size then"""
+
+    def __init__(self, path, signature):
+        self.path = path
+        self.signature = signature
+        self.records_done = 0
+        self.output_bytes = None    # None when the output is not a seekable file
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('signature') != self.signature:
+            print("[CLI] Checkpoint was written for different inputs, ignoring it", file=sys.stderr)
+            return 0
+        self.records_done = int(data.get('records_done', 0))
+        self.output_bytes = data.get('output_bytes')
+        return self.records_done
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'signature': self.signature, 'records_done': self.records_done,
+                       'output_bytes': self.output_bytes}, f)
+        os.replace(tmp_path, self.path)
+
+
+def skip(iterable, count):
+    """Drop the first count items of an iterator"""
+    iterator = iter(iterable)
+    for _ in range(count):
+        if next(iterator, None) is None:
+            break
+    return iterator
+
+
+def cmd_translate(args):
+    fmt = args.format if args.format != 'auto' else detect_format(args.inputs)
+    signature = {'inputs': args.inputs or ['-'], 'format': fmt, 'field': args.field, 'split': args.split}
+    checkpoint = Checkpoint(args.checkpoint, signature)
+    resumed = checkpoint.load()
+    if resumed:
+        if '-' in (args.inputs or ['-']):
+            print("[CLI] Resuming from stdin assumes the same input is piped again", file=sys.stderr)
+        print(f"[CLI] Resuming after {resumed} records", file=sys.stderr)
+
+    engine = build_engine(args)
+    if not engine.translator.api_key:
+        print("Error: No API key (use --api-key, SILICONFLOW_API_KEY or the app settings file)", file=sys.stderr)
+        return 2
+    scheduler = TranslationScheduler(engine, workers=args.workers)
+
+    if args.output and args.output != '-':
+        out = open(args.output, 'a' if resumed else 'w', encoding='utf-8')
+        if resumed and checkpoint.output_bytes is not None:
+            # Drop lines written after the last checkpoint; their records are translated again
+            out.truncate(checkpoint.output_bytes)
+    else:
+        out = sys.stdout
+
+    def save_checkpoint():
+        # Output and checkpoint move together, so a resume neither skips nor repeats lines
+        out.flush()
+        if out is not sys.stdout:
+            checkpoint.output_bytes = out.tell()
+        checkpoint.save()
+
+    records = skip(iter_records(iter_lines(args.inputs), fmt, args.field, args.split), resumed)
+    stats = {'records': 0, 'translated': 0, 'cached': 0, 'failed': 0, 'skipped': 0}
+    start = time.perf_counter()
+    try:
+        window = max(args.workers * 4, 1)
+        # Duplicates that joined an in-flight job share its result; they were not separate requests
+        recent = deque(maxlen=window)
+        for record, result in translate_ordered(scheduler, records, window=window):
+            stats['records'] += 1
+            joined = result is not None and any(r is result for r in recent)
+            if result is not None:
+                recent.append(result)
+            if result is None:
+                stats['skipped'] += 1
+            elif result.ok:
+                record[args.output_field] = result.text
+                if result.origin == 'skipped':
+                    stats['skipped'] += 1
+                else:
+                    stats['cached' if result.reused or joined else 'translated'] += 1
+            else:
+                record['error'] = result.text
+                stats['failed'] += 1
+
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            checkpoint.records_done += 1
+            if checkpoint.records_done % args.checkpoint_every == 0:
+                save_checkpoint()
+    except KeyboardInterrupt:
+        print("\n[CLI] Interrupted, rerun with the same --checkpoint to resume", file=sys.stderr)
+        return 130
+    finally:
+        save_checkpoint()
+        if out is not sys.stdout:
+            out.close()
+        close_usage(engine)
+
+    elapsed = time.perf_counter() - start
+    print(f"[CLI] {stats} in {elapsed:.1f}s", file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+
+def cmd_zotero(args):
+    kinds = [k.strip() for k in args.kinds.split(',') if k.strip()]
+    unknown = set(kinds) - set(zotero_library.KINDS)
+    if unknown:
+        print(f"Error: Unknown kinds {sorted(unknown)}, choose from {zotero_library.KINDS}", file=sys.stderr)
+        return 2
+
+    engine = build_engine(args)
+    if not engine.translator.api_key:
+        print("Error: No API key (use --api-key, SILICONFLOW_API_KEY or the app settings file)", file=sys.stderr)
+        return 2
+    scheduler = TranslationScheduler(engine, workers=args.workers)
+
+    try:
+        zotero_conn = zotero_library.open_zotero_db(args.database, immutable=True if args.immutable else None)
+    except Exception as e:
+        print(f"Error: Cannot open {args.database}: {e}", file=sys.stderr)
+        return 2
+    store = zotero_library.SidecarStore(args.store)
+    if args.restart:
+        store.reset_progress()
+
+    last_report = [0.0]
+
+    def report(stats):
+        now = time.perf_counter()
+        if now - last_report[0] >= 5:
+            last_report[0] = now
+            print(f"[CLI] {stats}", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        stats = zotero_library.translate_library(
+            zotero_conn, store, engine, scheduler,
+            kinds=kinds, window=max(args.workers * 4, 1), limit=args.limit, on_progress=report,
+        )
+    except KeyboardInterrupt:
+        print("\n[CLI] Interrupted, rerun to resume", file=sys.stderr)
+        return 130
+    finally:
+        store.close()
+        zotero_conn.close()
+        close_usage(engine)
+
+    print(f"[CLI] {stats} in {time.perf_counter() - start:.1f}s -> {args.store}", file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--config', default=DEFAULT_CONFIG, help="App settings file to read API settings from")
+    common.add_argument('--api-key', default='', help="SiliconFlow API key")
+    common.add_argument('--api-url', default='', help="API base URL")
+    common.add_argument('--model', default='', help="Model name")
+    common.add_argument('--target-lang', default='', help="Target language")
+    common.add_argument('--glossary', default=DEFAULT_GLOSSARY, help="Terminology file: source<TAB>target per line")
+    common.add_argument('--usage-file', default=DEFAULT_USAGE, help="Token accounting file shared with the app ('' = off)")
+    common.add_argument('--no-normalize', action='store_true',
+                        help="Send text as-is (no de-hyphenation, reflow or page-artifact removal)")
+    common.add_argument('--join-paragraphs', action='store_true', help="Reflow each text into a single paragraph")
+    common.add_argument('--no-skip', action='store_true',
+                        help="Send everything, even text already in the target language, URLs, DOIs and numbers")
+    common.add_argument('--no-protect', action='store_true',
+                        help="Send formulas, citations, URLs and DOIs to the model instead of placeholders")
+    common.add_argument('--deterministic', action='store_true', help="Temperature 0 and a fixed seed")
+    common.add_argument('--fuzzy', type=float, default=None,
+                        help="Reuse translations of near-identical text at this similarity, e.g. 0.9 (default off)")
+
+    parser = argparse.ArgumentParser(description="Zotero Translation Assistant - batch tools")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('translate', parents=[common], help="Translate text or JSONL records to JSONL")
+    p.add_argument('inputs', nargs='*', help="Input files ('-' or none for stdin)")
+    p.add_argument('-o', '--output', help="Output JSONL file (default: stdout)")
+    p.add_argument('--format', choices=['auto', 'text', 'jsonl'], default='auto')
+    p.add_argument('--split', choices=['line', 'paragraph'], default='line',
+                   help="How plain text is split into records")
+    p.add_argument('--field', default='text', help="Source text field of JSONL records")
+    p.add_argument('--output-field', default='translation', help="Field the translation is written to")
+    p.add_argument('--workers', type=int, default=4, help="Concurrent API requests")
+    p.add_argument('--checkpoint', help="Checkpoint file for resuming")
+    p.add_argument('--checkpoint-every', type=int, default=1, help="Save checkpoint every N records")
+    p.set_defaults(func=cmd_translate)
+
+    p = sub.add_parser('zotero', parents=[common], help="Pre-translate a Zotero library into a sidecar database")
+    p.add_argument('database', help="Path to zotero.sqlite (opened read-only)")
+    p.add_argument('--store', default='zotero_translations.db', help="Sidecar SQLite file for results")
+    p.add_argument('--kinds', default=','.join(zotero_library.KINDS), help="Comma-separated: title,abstract,annotation")
+    p.add_argument('--workers', type=int, default=4, help="Concurrent API requests")
+    p.add_argument('--limit', type=int, default=0, help="Stop after this many texts (0 = all)")
+    p.add_argument('--immutable', action='store_true', help="Always read an immutable snapshot (never takes locks)")
+    p.add_argument('--restart', action='store_true', help="Ignore saved progress and rescan the library")
+    p.set_defaults(func=cmd_zotero)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""
+Headless translation core - no Kivy imports
+
+Used by the Kivy UI, the floating bubble and command-line tools alike.
+"""
+
+from .cache import TranslationCache
+from .clipboard import ClipboardTracker
+from .engine import TranslationEngine, TranslationResult
+from .fuzzy import FuzzyIndex, FuzzyMatch
+from .glossary import Glossary
+from .history import HistoryEntry, SQLiteHistory, TranslationHistory
+from .scheduler import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, TranslationJob, TranslationScheduler
+from .settings import Settings
+from .speculative import Speculator
+from .usage import UsageTracker
+
+__all__ = [
+    'TranslationCache',
+    'ClipboardTracker',
+    'TranslationEngine', 'TranslationResult',
+    'FuzzyIndex', 'FuzzyMatch',
+    'Glossary',
+    'HistoryEntry', 'SQLiteHistory', 'TranslationHistory',
+    'PRIORITY_HIGH', 'PRIORITY_LOW', 'PRIORITY_NORMAL', 'TranslationJob', 'TranslationScheduler',
+    'Settings',
+    'Speculator',
+    'UsageTracker',
+]
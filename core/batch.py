@@ -0,0 +1,27 @@
+"""
+Batch Helpers - ordered streaming translation with bounded memory
+"""
+
+from collections import deque
+
+
+def translate_ordered(scheduler, items, window=16, source="batch"):
+    """Translate a stream of (payload, text) pairs concurrently, in order.
+
+    At most `window` jobs are in flight, so memory stays constant no matter
+    how long the input is. Yields (payload, result) in input order; result is
+    None when text is empty and nothing was submitted.
+    """
+    pending = deque()
+    for payload, text in items:
+        job = scheduler.submit(text, source=source) if text and text.strip() else None
+        pending.append((payload, job))
+        if len(pending) >= window:
+            yield _finish(pending.popleft())
+    while pending:
+        yield _finish(pending.popleft())
+
+
+def _finish(entry):
+    payload, job = entry
+    return payload, (job.wait() if job is not None else None)
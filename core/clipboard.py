@@ -0,0 +1,66 @@
+"""
+Clipboard Change Detection - compare fingerprints, not copies of the text
+
+Monitoring polls the clipboard several times a second. Keeping the last
+text costs a full copy in memory; a (length, hash) pair costs nothing to
+keep. Without a platform stamp every tick still fetches the text and hashes
+it once (O(n)), since equal content can only be confirmed by reading it all;
+surrounding whitespace is only stripped (copied) when there is some. Where
+the platform stamps each clip (Android's ClipDescription timestamp), an
+unchanged stamp means the text is not fetched at all.
+"""
+
+
+def fingerprint(text):
+    """(length, hash) of text; equal texts always give equal fingerprints"""
+    return (len(text), hash(text))
+
+
+class ClipboardTracker:
+    """Remembers the last clipboard content by fingerprint"""
+
+    def __init__(self):
+        self._stamp = None          # platform clip timestamp, if any
+        self._raw = None            # fingerprint of the text as copied
+        self._stripped = None       # fingerprint ignoring surrounding whitespace
+
+    def stamp_changed(self, stamp):
+        """False when the clip timestamp shows the clip is the one already seen.
+
+        The stamp is recorded by is_new(), so a clip whose text could not be
+        read this time is fetched again on the next tick.
+        """
+        return stamp is None or stamp != self._stamp
+
+    def is_new(self, text, stamp=None):
+        """Record text (and its clip stamp); True when it differs from the last text beyond whitespace
+
+        An empty read (e.g. Kivy's paste() while the app is in the background)
+        records nothing, so that clip is fetched again.
+        """
+        if not text:
+            return False
+        if stamp is not None:
+            self._stamp = stamp
+        raw = fingerprint(text)
+        if raw == self._raw:
+            return False
+        self._raw = raw
+        key = self._stripped_fingerprint(text, raw)
+        if key is None or key == self._stripped:
+            return False
+        self._stripped = key
+        return True
+
+    def _stripped_fingerprint(self, text, raw):
+        # Only text with surrounding whitespace needs a stripped copy; None when blank
+        if not (text[0].isspace() or text[-1].isspace()):
+            return raw
+        stripped = text.strip()
+        return fingerprint(stripped) if stripped else None
+
+    def remember(self, text):
+        """Mark text as seen without reporting it (e.g. text the bubble just translated)"""
+        if text:
+            self._raw = fingerprint(text)
+            self._stripped = self._stripped_fingerprint(text, self._raw)
@@ -0,0 +1,171 @@
+"""
+Translation Engine - cache, history and TranslatorService behind one call
+"""
+
+import threading
+import time
+
+from .cache import TranslationCache
+from .fuzzy import FuzzyIndex
+from .glossary import Glossary
+from .history import HistoryEntry, TranslationHistory
+from .langdetect import SKIP, decide
+from .log import get_logger
+from .normalize import normalize_text
+from .usage import UsageTracker
+
+log = get_logger('engine')
+
+
+class TranslationResult:
+    """Outcome of one engine.translate() call"""
+
+    def __init__(self, source_text, text, ok, origin, elapsed=0.0, similarity=1.0, detail=""):
+        self.source_text = source_text
+        self.text = text            # translation, or error message when not ok
+        self.ok = ok
+        self.origin = origin        # 'api', 'cache', 'history', 'fuzzy', 'skipped' or 'error'
+        self.elapsed = elapsed
+        self.similarity = similarity    # below 1.0 only for fuzzy matches
+        self.detail = detail            # why a 'skipped' result was not sent
+        self.missing_terms = []         # glossary pairs the translation did not use
+
+    @property
+    def reused(self):
+        """True when served without calling the API"""
+        return self.ok and self.origin != 'api'
+
+    def __repr__(self):
+        return f"<TranslationResult ok={self.ok} origin={self.origin} {len(self.text or '')} chars>"
+
+
+class TranslationEngine:
+    """Headless translation pipeline shared by the UI, the bubble and batch tools"""
+
+    # Explicit requests are always sent: no near-match reuse, no language skipping
+    EXPLICIT_SOURCES = ('manual',)
+    # Results stored by exact key elsewhere (Zotero sidecar) must not be near matches either
+    EXACT_SOURCES = EXPLICIT_SOURCES + ('library',)
+
+    def __init__(self, translator=None, cache=None, history=None, fuzzy=None,
+                 normalize=True, keep_paragraphs=True, skip_untranslatable=True, glossary=None, usage=None):
+        if translator is None:
+            # Imported lazily so translator.py can itself use core helpers
+            from translator import TranslatorService
+            translator = TranslatorService()
+        self.translator = translator
+        self.cache = cache if cache is not None else TranslationCache()
+        self.history = history if history is not None else TranslationHistory()
+        self.fuzzy = fuzzy if fuzzy is not None else FuzzyIndex()
+        self.glossary = glossary if glossary is not None else Glossary()
+        self.usage = usage if usage is not None else UsageTracker()
+        self.normalize = normalize
+        self.keep_paragraphs = keep_paragraphs
+        self.skip_untranslatable = skip_untranslatable
+        self.skipped = {}           # reason -> API calls saved by the language check
+        self._skip_lock = threading.Lock()
+
+    def prepare(self, text):
+        """Text as it is keyed and sent: PDF layout artifacts removed"""
+        if not self.normalize or not text:
+            return text
+        return normalize_text(text, self.keep_paragraphs)
+
+    def _terms(self, clean):
+        return self.glossary.find(clean) if self.glossary else []
+
+    def key_for(self, text):
+        """Cache/dedupe key for text under the current translator config"""
+        clean = self.prepare(text)
+        return self.translator.cache_key(clean, self._terms(clean))
+
+    def translate(self, text, source="manual"):
+        """Translate text, serving repeats from the cache or the history store"""
+        from translator import is_error_result
+
+        start = time.perf_counter()
+
+        clean = self.prepare(text)
+        if not clean or not clean.strip():
+            return TranslationResult(text, "Error: No text to translate", False, 'error')
+
+        if self.skip_untranslatable and source not in self.EXPLICIT_SOURCES:
+            decision = decide(clean, self.translator.target_lang)
+            if decision.action == SKIP:
+                with self._skip_lock:
+                    self.skipped[decision.reason] = self.skipped.get(decision.reason, 0) + 1
+                return TranslationResult(text, clean, True, 'skipped', time.perf_counter() - start,
+                                         detail=decision.reason)
+
+        terms = self._terms(clean)
+        key = self.translator.cache_key(clean, terms)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return TranslationResult(text, cached, True, 'cache', time.perf_counter() - start)
+
+        try:
+            stored = self.history.lookup(key)
+        except Exception as e:
+            log.warning("[Engine] History lookup error: %s", e)
+            stored = None
+        if stored is not None:
+            self.cache.put(key, stored)
+            self.fuzzy.add(self.translator.config_scope(), clean, stored)
+            return TranslationResult(text, stored, True, 'history', time.perf_counter() - start)
+
+        if source not in self.EXACT_SOURCES:
+            match = self.fuzzy.lookup(self.translator.config_scope(), clean)
+            if match is not None:
+                # Not cached under this text's key: an explicit request can still replace it
+                return TranslationResult(text, match.translation, True, 'fuzzy',
+                                         time.perf_counter() - start, match.similarity)
+
+        try:
+            output = self.translator.translate(clean, terms)
+        except Exception as e:
+            output = f"Translation failed: {e}"
+        self._record_usage(source)
+
+        elapsed = time.perf_counter() - start
+        if is_error_result(output):
+            return TranslationResult(text, output or "Error: Empty result", False, 'error', elapsed)
+
+        self.cache.put(key, output)
+        self.fuzzy.add(self.translator.config_scope(), clean, output)
+        self.history.add(HistoryEntry(
+            clean, output, source=source,
+            model=self.translator.model, target_lang=self.translator.target_lang, key=key,
+        ))
+        result = TranslationResult(text, output, True, 'api', elapsed)
+        if terms:
+            result.missing_terms = self.glossary.missing(output, terms)
+            if result.missing_terms:
+                log.debug("[Engine] Glossary terms not used: %s", [source for source, _ in result.missing_terms])
+        return result
+
+    def _record_usage(self, source):
+        pop_usage = getattr(self.translator, 'pop_usage', None)
+        usage = pop_usage() if pop_usage else None
+        if usage:
+            try:
+                self.usage.record(self.translator.model, source, usage)
+            except Exception as e:
+                log.warning("[Engine] Usage accounting error: %s", e)
+
+    @property
+    def calls_skipped(self):
+        """Total API calls avoided by the local language check"""
+        with self._skip_lock:
+            return sum(self.skipped.values())
+
+    def warm_fuzzy(self, entries):
+        """Load past translations made under the current config into the fuzzy index"""
+        scope = self.translator.config_scope()
+        count = 0
+        for entry in entries:
+            # An entry belongs to this config (model, language, prompt version,
+            # glossary terms) exactly when its stored key still recomputes
+            if entry.key == self.translator.cache_key(entry.source_text, self._terms(entry.source_text)):
+                self.fuzzy.add(scope, entry.source_text, entry.target_text)
+                count += 1
+        return count
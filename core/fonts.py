@@ -0,0 +1,129 @@
+"""
+Fonts - pick the UI font once and remember it across launches
+
+Candidates are tried in order: subsetted CJK fonts first (a few hundred KB,
+quick to load and lay out), then full fonts. The pick is cached in a small
+JSON file, so later launches register it without probing. A subset lists
+its characters in a sidecar written by assets/subset_font.py; the first
+text with a character outside it switches the session to a full font.
+"""
+
+import json
+import os
+
+from .log import get_logger
+
+log = get_logger('fonts')
+
+
+# First bytes of TrueType / OpenType fonts and collections
+FONT_MAGIC = (b'\x00\x01\x00\x00', b'OTTO', b'true', b'ttcf')
+
+
+def is_font_file(path):
+    """Exists and starts like a font (a failed download saved as .otf does not)"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(4) in FONT_MAGIC
+    except OSError:
+        return False
+
+
+def load_coverage(path):
+    """Characters of a subset font, from its JSON sidecar"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return frozenset(json.load(f)['chars'])
+
+
+class FontSelector:
+    """First usable font of subsets, then full fonts; the pick is cached on disk"""
+
+    def __init__(self, subsets=(), full=(), cache_path=None):
+        self.subsets = dict(subsets)    # subset font path -> coverage sidecar path
+        self.full = list(full)          # full font paths, in preference order
+        self.cache_path = cache_path
+        self.path = None                # font in use, None for Kivy's default
+        self.resolved = False           # True once path is known (cached or probed)
+        self._coverage_path = None      # set while a subset is in use
+        self._coverage = None
+
+    def _candidates(self):
+        return list(self.subsets) + self.full
+
+    def _use(self, path):
+        self.path = path
+        self.resolved = True
+        self._coverage_path = self.subsets.get(path)
+        self._coverage = None
+
+    @property
+    def is_subset(self):
+        return self._coverage_path is not None
+
+    def cached(self):
+        """The font picked on an earlier launch, if the candidates are unchanged; no probing
+
+        A cached "no usable font" is not trusted: the fonts may have been
+        installed since, so the caller probes again.
+        """
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = data.get('font')
+        if not path or data.get('candidates') != self._candidates() or not os.path.exists(path):
+            return None
+        self._use(path)
+        return path
+
+    def select(self):
+        """Probe the candidates in order, cache the pick and return it (None if none is usable)"""
+        for path, coverage in self.subsets.items():
+            if is_font_file(path) and os.path.exists(coverage):
+                self._use(path)
+                break
+        else:
+            self._use(self._first_full())
+        self._save()
+        return self.path
+
+    def _first_full(self):
+        for path in self.full:
+            if is_font_file(path):
+                return path
+        return None
+
+    def _save(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'font': self.path, 'candidates': self._candidates()}, f)
+        except OSError as e:
+            log.warning("[Fonts] Could not save %s: %s", self.cache_path, e)
+
+    def missing(self, text):
+        """Characters of text the subset in use lacks (none with a full font)"""
+        if self._coverage_path is None or not text:
+            return set()
+        if self._coverage is None:
+            try:
+                self._coverage = load_coverage(self._coverage_path)
+            except (OSError, ValueError, KeyError) as e:
+                log.warning("[Fonts] Coverage of %s unavailable: %s", self.path, e)
+                self._coverage_path = None
+                return set()
+        return {ch for ch in set(text) - self._coverage if ch > '\x7f' and not ch.isspace()}
+
+    def fall_back(self):
+        """Switch to the first full font for this session; returns it, or None to stay on the subset"""
+        path = self._first_full()
+        if path is None:
+            # Nothing better available: stop checking
+            self._coverage_path = None
+            return None
+        self._use(path)
+        return path
@@ -0,0 +1,233 @@
+"""
+Fuzzy Translation Memory - near-duplicate lookup for re-copied PDF text
+
+Candidates are retrieved by LSH over a one-permutation MinHash of character
+5-grams and confirmed with a bounded Levenshtein distance, so a lookup
+touches only a handful of entries even with tens of thousands stored.
+A few edits can still flip the meaning, so numbers, citation markers and
+negations must match exactly before the distance is even considered.
+"""
+
+import heapq
+import re
+import threading
+from collections import Counter, deque
+
+
+SHINGLE = 5
+BINS = 32
+ROWS_PER_BAND = 4
+# Band keys shared by more entries than this carry no signal (like stop words)
+MAX_POSTING = 256
+MAX_CANDIDATES = 3
+
+_HYPHEN_BREAK = re.compile(r'(\w)-\s*\n\s*(\w)')
+_CITATION = re.compile(r'\[\d+(?:\s*[,–—-]\s*\d+)*\]')
+_SPACE = re.compile(r'\s+')
+# Tokens a reused translation must agree on: numbers (citation numbers included) and negations
+_GUARD = re.compile(r"\d+(?:[.,]\d+)*|\b(?:not|no|never|none|nor|neither|without|cannot)\b|n't", re.IGNORECASE)
+
+
+def canonical(text):
+    """Matching form: no line-break hyphenation, numeric citations or layout whitespace"""
+    text = _HYPHEN_BREAK.sub(r'\1\2', text)
+    text = _CITATION.sub('', text)
+    return _SPACE.sub(' ', text).strip().lower()
+
+
+def guard_tokens(text):
+    """Numbers and negations of text in order; near matches must have the same ones"""
+    return tuple(token.lower() for token in _GUARD.findall(_HYPHEN_BREAK.sub(r'\1\2', text)))
+
+
+def band_keys(canon):
+    """LSH band keys: texts sharing any key become candidates.
+
+    One hash per n-gram is split into BINS bins keeping each bin's minimum
+    (one-permutation MinHash); empty bins borrow from the next filled bin so
+    short texts still get every band.
+    """
+    if len(canon) <= SHINGLE:
+        hashes = {hash(canon)}
+    else:
+        hashes = set(map(hash, {canon[i:i + SHINGLE] for i in range(len(canon) - SHINGLE + 1)}))
+    mins = [None] * BINS
+    for h in sorted(hashes, reverse=True):
+        mins[h % BINS] = h
+    for i in range(BINS):
+        if mins[i] is None:
+            for step in range(1, BINS):
+                borrowed = mins[(i + step) % BINS]
+                if borrowed is not None:
+                    mins[i] = hash((borrowed, step))
+                    break
+    return [hash((band,) + tuple(mins[band:band + ROWS_PER_BAND])) for band in range(0, BINS, ROWS_PER_BAND)]
+
+
+def bounded_levenshtein(a, b, max_dist):
+    """Edit distance of a and b, or max_dist + 1 once it is known to exceed max_dist"""
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+
+    # Trim the common prefix and suffix (compared in C, not per character)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    a, b = a[lo:], b[lo:]
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    if lo:
+        a, b = a[:len(a) - lo], b[:len(b) - lo]
+
+    if not a or not b:
+        return min(max(len(a), len(b)), max_dist + 1)
+    if len(a) > len(b):
+        a, b = b, a
+
+    # Bit-parallel Levenshtein (Myers/Hyyro): one column of the DP matrix per
+    # character of b, held as bit vectors in Python ints
+    peq = {}
+    for i, ch in enumerate(a):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv, mv, score = mask, 0, len(a)
+    remaining = len(b)
+    for ch in b:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        if score - remaining > max_dist:
+            # Even matching every remaining character cannot get back under the bound
+            return max_dist + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return min(score, max_dist + 1)
+
+
+class FuzzyMatch:
+    """A stored translation whose source is similar to the query"""
+
+    def __init__(self, translation, similarity, source_text):
+        self.translation = translation
+        self.similarity = similarity
+        self.source_text = source_text
+
+
+class FuzzyIndex:
+    """Bounded in-memory fuzzy translation memory"""
+
+    def __init__(self, threshold=0.9, max_entries=20000):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries = {}              # id -> (scope, canon, band keys, guard, source_text, translation)
+        self._postings = {}             # band key -> set of ids
+        self._order = deque()
+        self._by_canon = {}             # (scope, canon) -> id
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+
+    def add(self, scope, source_text, translation):
+        canon = canonical(source_text)
+        if not canon:
+            return
+        values = band_keys(canon)
+        guard = guard_tokens(source_text)
+        with self._lock:
+            existing = self._by_canon.get((scope, canon))
+            if existing is not None:
+                self._remove(existing)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (scope, canon, values, guard, source_text, translation)
+            self._by_canon[(scope, canon)] = entry_id
+            self._order.append(entry_id)
+            for value in values:
+                self._postings.setdefault(value, set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(self._order.popleft())
+
+    def _remove(self, entry_id):
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        scope, canon, values = entry[0], entry[1], entry[2]
+        self._by_canon.pop((scope, canon), None)
+        for value in values:
+            ids = self._postings.get(value)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._postings[value]
+
+    def lookup(self, scope, text, threshold=None):
+        """Best stored translation with similarity >= threshold, or None"""
+        threshold = self.threshold if threshold is None else threshold
+        if not threshold or threshold <= 0:
+            return None
+        canon = canonical(text)
+        if not canon:
+            return None
+        values = band_keys(canon)
+        guard = guard_tokens(text)
+
+        with self._lock:
+            self.lookups += 1
+            counts = Counter()
+            for value in values:
+                ids = self._postings.get(value)
+                if ids and len(ids) <= MAX_POSTING:
+                    counts.update(ids)
+            # Filter before taking the top ones, so entries of other configs or
+            # with other numbers cannot crowd out a usable match
+            top = heapq.nlargest(MAX_CANDIDATES, (
+                (n, i) for i, n in counts.items()
+                if self._entries[i][0] == scope and self._entries[i][3] == guard
+            ))
+            candidates = [self._entries[i] for _, i in top]
+
+        best = None
+        for _, entry_canon, _, _, source_text, translation in candidates:
+            longest = max(len(canon), len(entry_canon))
+            max_dist = int(longest * (1.0 - threshold))
+            distance = bounded_levenshtein(canon, entry_canon, max_dist)
+            if distance > max_dist:
+                continue
+            similarity = 1.0 - distance / longest
+            if best is None or similarity > best.similarity:
+                best = FuzzyMatch(translation, similarity, source_text)
+
+        if best is not None:
+            with self._lock:
+                self.hits += 1
+        return best
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._order.clear()
+            self._by_canon.clear()
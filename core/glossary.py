@@ -0,0 +1,152 @@
+"""
+Glossary - fixed terminology injected per snippet
+
+All source terms are compiled into one Aho-Corasick automaton, so finding
+the terms present in a snippet takes a single pass over its text however
+large the glossary is. Only those terms go into the prompt, and the output
+is checked for their required translations afterwards.
+"""
+
+import csv
+import os
+import threading
+from collections import deque
+
+
+# Most terms injected into one prompt
+MAX_TERMS = 40
+
+
+def _is_word_char(ch):
+    return ch.isalnum() and ord(ch) < 0x3000
+
+
+class Glossary:
+    """Source -> target term pairs with linear-time matching"""
+
+    def __init__(self, pairs=()):
+        self._terms = {}            # lowercased source -> (source, target)
+        self._lock = threading.Lock()
+        self._automaton = None
+        for source, target in pairs:
+            self.add(source, target)
+
+    @classmethod
+    def load(cls, path):
+        """Read a TSV/CSV file of 'source<TAB>target' lines; '#' starts a comment"""
+        glossary = cls()
+        if not path or not os.path.exists(path):
+            return glossary
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            sample = f.read(4096)
+            f.seek(0)
+            delimiter = '\t' if '\t' in sample else ','
+            for row in csv.reader(f, delimiter=delimiter):
+                if len(row) < 2 or not row[0].strip() or row[0].lstrip().startswith('#'):
+                    continue
+                glossary.add(row[0], row[1])
+        return glossary
+
+    def add(self, source, target):
+        source, target = source.strip(), target.strip()
+        if not source or not target:
+            return
+        with self._lock:
+            self._terms[source.lower()] = (source, target)
+            self._automaton = None
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __bool__(self):
+        return bool(self._terms)
+
+    # -- automaton ---------------------------------------------------------
+
+    def _build(self):
+        """Trie of lowercased source terms plus failure links (BFS order)"""
+        goto = [{}]
+        output = [None]             # term key ending at this node, if any
+        for key in self._terms:
+            node = 0
+            for ch in key:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    output.append(None)
+                node = nxt
+            output[node] = key
+
+        fail = [0] * len(goto)
+        # Longest term ending at each node, following failure links
+        dict_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if goto[f].get(ch, 0) != nxt else 0
+                dict_link[nxt] = fail[nxt] if output[fail[nxt]] is not None else dict_link[fail[nxt]]
+        return goto, fail, output, dict_link
+
+    def _get_automaton(self):
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = self._build()
+                automaton = self._automaton
+        return automaton
+
+    # -- matching ----------------------------------------------------------
+
+    def find(self, text, limit=MAX_TERMS):
+        """(source, target) pairs present in text, leftmost-longest and in order of appearance"""
+        if not self._terms or not text:
+            return []
+        goto, fail, output, dict_link = self._get_automaton()
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets (rare special cases): match case-sensitively
+            lowered = text
+
+        matches = []
+        node = 0
+        for end, ch in enumerate(lowered, 1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if output[node] is not None else dict_link[node]
+            while hit:
+                key = output[hit]
+                start = end - len(key)
+                # Latin terms must match whole words; CJK terms match anywhere
+                if not ((_is_word_char(key[0]) and start > 0 and _is_word_char(lowered[start - 1])) or
+                        (_is_word_char(key[-1]) and end < len(lowered) and _is_word_char(lowered[end]))):
+                    matches.append((start, end, key))
+                hit = dict_link[hit]
+
+        # Prefer the longest term where matches overlap ("neural network" over "network")
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        found, seen, covered = [], set(), 0
+        for start, end, key in matches:
+            if start < covered:
+                continue
+            covered = end
+            if key not in seen:
+                seen.add(key)
+                found.append(self._terms[key])
+                if len(found) >= limit:
+                    break
+        return found
+
+    @staticmethod
+    def missing(output, terms):
+        """Terms whose required translation does not appear in output"""
+        lowered = output.lower()
+        return [(source, target) for source, target in terms if target.lower() not in lowered]
@@ -0,0 +1,323 @@
+"""
+Translation History - results kept after the output box is overwritten
+
+TranslationHistory is a small in-memory fallback; SQLiteHistory persists
+entries in WAL mode with a full-text index and writes on a background thread.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from .log import get_logger
+
+log = get_logger('history')
+
+
+class HistoryEntry:
+    """One finished translation"""
+
+    __slots__ = ('key', 'source_text', 'target_text', 'source', 'model', 'target_lang', 'created', 'id')
+
+    def __init__(self, source_text, target_text, source="", model="", target_lang="",
+                 created=None, key="", id=None):
+        self.key = key
+        self.source_text = source_text
+        self.target_text = target_text
+        self.source = source
+        self.model = model
+        self.target_lang = target_lang
+        self.created = created if created is not None else time.time()
+        self.id = id
+
+
+def _previews(entries, preview_chars):
+    """Copies of entries with text cut to preview_chars (0 = full text)"""
+    if not preview_chars:
+        return entries
+    return [HistoryEntry(e.source_text[:preview_chars], e.target_text[:preview_chars], source=e.source,
+                         model=e.model, target_lang=e.target_lang, created=e.created, key=e.key, id=e.id)
+            for e in entries]
+
+
+class TranslationHistory:
+    """Bounded in-memory history, newest first"""
+
+    def __init__(self, max_entries=200):
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def add(self, entry):
+        with self._lock:
+            if entry.id is None:
+                entry.id = self._next_id
+                self._next_id += 1
+            self._entries.appendleft(entry)
+
+    def lookup(self, key):
+        """Most recent translation stored under key, or None"""
+        with self._lock:
+            for entry in self._entries:
+                if entry.key == key:
+                    return entry.target_text
+        return None
+
+    def get(self, entry_id):
+        with self._lock:
+            for entry in self._entries:
+                if entry.id == entry_id:
+                    return entry
+        return None
+
+    def recent(self, limit=50, offset=0, preview_chars=0):
+        """Return up to limit entries, newest first"""
+        with self._lock:
+            entries = list(self._entries)[offset:offset + limit]
+        return _previews(entries, preview_chars)
+
+    def search(self, query, limit=50, offset=0, preview_chars=0):
+        """Substring search over source and target text"""
+        needle = query.strip().lower()
+        with self._lock:
+            matches = [e for e in self._entries
+                       if needle in e.source_text.lower() or needle in e.target_text.lower()]
+        return _previews(matches[offset:offset + limit], preview_chars)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def flush(self, timeout=None):
+        pass
+
+    def close(self):
+        pass
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteHistory:
+    """Persistent history: SQLite in WAL mode with an FTS5 index.
+
+    add() only enqueues; a writer thread inserts queued entries in batches,
+    so the UI thread never waits on disk. Reads use one connection per thread.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS history (
+        id INTEGER PRIMARY KEY,
+        key TEXT NOT NULL,
+        source_text TEXT NOT NULL,
+        target_text TEXT NOT NULL,
+        source TEXT,
+        model TEXT,
+        target_lang TEXT,
+        created REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS history_key ON history(key);
+    CREATE INDEX IF NOT EXISTS history_created ON history(created);
+    """
+
+    FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+        source_text, target_text, content='history', content_rowid='id', tokenize='{tokenizer}'
+    );
+    CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+        INSERT INTO history_fts(rowid, source_text, target_text)
+        VALUES (new.id, new.source_text, new.target_text);
+    END;
+    CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+        INSERT INTO history_fts(history_fts, rowid, source_text, target_text)
+        VALUES ('delete', old.id, old.source_text, old.target_text);
+    END;
+    """
+
+    COLUMNS = "id, key, source_text, target_text, source, model, target_lang, created"
+    PREVIEW_COLUMNS = "id, key, substr(source_text, 1, {n}), substr(target_text, 1, {n}), source, model, target_lang, created"
+
+    def __init__(self, path, batch_size=64, flush_interval=0.5, max_entries=50000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_entries = max_entries
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self._closed = False
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(self.SCHEMA)
+        self.fts_tokenizer = self._create_fts(conn)
+        conn.commit()
+        self._local.conn = conn
+
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _create_fts(self, conn):
+        """Create the FTS5 index; trigram handles CJK substrings, unicode61 is the fallback"""
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                conn.executescript(self.FTS_SCHEMA.format(tokenizer=tokenizer))
+                row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'history_fts'").fetchone()
+                # An existing index keeps the tokenizer it was created with
+                return 'trigram' if row and 'trigram' in row[0] else 'unicode61'
+            except sqlite3.OperationalError as e:
+                log.warning("[History] FTS5 tokenizer %s unavailable: %s", tokenizer, e)
+        return None
+
+    def _reader(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    # -- writes ------------------------------------------------------------
+
+    def add(self, entry):
+        """Queue an entry for the writer thread"""
+        if not self._closed:
+            self._queue.put(entry)
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is written"""
+        if self._closed or not self._writer.is_alive():
+            # Nothing left to write, and no writer to set the event
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush(timeout=5.0)
+        self._closed = True
+        self._queue.put(None)
+
+    def _write_loop(self):
+        conn = self._connect()
+        written = 0
+        while True:
+            item = self._queue.get()
+            batch, waiters, stop = [], [], False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO history (key, source_text, target_text, source, model, target_lang, created) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [(e.key, e.source_text, e.target_text, e.source, e.model, e.target_lang, e.created)
+                             for e in batch],
+                        )
+                    written += len(batch)
+                    if self.max_entries and written >= 500:
+                        written = 0
+                        self._prune(conn)
+                except Exception as e:
+                    log.warning("[History] Write error: %s", e)
+
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                conn.close()
+                return
+
+    def _prune(self, conn):
+        with conn:
+            conn.execute(
+                "DELETE FROM history WHERE id <= (SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    # -- reads -------------------------------------------------------------
+
+    def _entries(self, rows):
+        return [HistoryEntry(source_text=r[2], target_text=r[3], source=r[4], model=r[5],
+                             target_lang=r[6], created=r[7], key=r[1], id=r[0]) for r in rows]
+
+    def lookup(self, key):
+        """Most recent translation stored under key, or None"""
+        row = self._reader().execute(
+            "SELECT target_text FROM history WHERE key = ? ORDER BY id DESC LIMIT 1", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get(self, entry_id):
+        rows = self._reader().execute(f"SELECT {self.COLUMNS} FROM history WHERE id = ?", (entry_id,)).fetchall()
+        entries = self._entries(rows)
+        return entries[0] if entries else None
+
+    def _columns(self, preview_chars):
+        # Previews are cut inside SQLite so long texts never reach Python
+        return self.PREVIEW_COLUMNS.format(n=int(preview_chars)) if preview_chars else self.COLUMNS
+
+    def recent(self, limit=50, offset=0, preview_chars=0):
+        """Return up to limit entries, newest first"""
+        rows = self._reader().execute(
+            f"SELECT {self._columns(preview_chars)} FROM history ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset)
+        ).fetchall()
+        return self._entries(rows)
+
+    def search(self, query, limit=50, offset=0, preview_chars=0):
+        """Full-text search over source and target text, newest first"""
+        query = query.strip()
+        if not query:
+            return self.recent(limit, offset, preview_chars)
+        columns = self._columns(preview_chars)
+
+        conn = self._reader()
+        # trigram needs 3+ characters per term; shorter queries use LIKE
+        terms = query.split()
+        use_fts = self.fts_tokenizer and (self.fts_tokenizer != 'trigram' or min(len(t) for t in terms) >= 3)
+        if use_fts:
+            match = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            rows = conn.execute(
+                f"SELECT {columns} FROM history WHERE id IN "
+                "(SELECT rowid FROM history_fts WHERE history_fts MATCH ?) "
+                "ORDER BY id DESC LIMIT ? OFFSET ?",
+                (match, limit, offset),
+            ).fetchall()
+        else:
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = conn.execute(
+                f"SELECT {columns} FROM history "
+                "WHERE source_text LIKE ? ESCAPE '\\' OR target_text LIKE ? ESCAPE '\\' "
+                "ORDER BY id DESC LIMIT ? OFFSET ?",
+                (pattern, pattern, limit, offset),
+            ).fetchall()
+        return self._entries(rows)
+
+    def __len__(self):
+        return self._reader().execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def clear(self):
+        self.flush()
+        conn = self._reader()
+        with conn:
+            conn.execute("DELETE FROM history")
@@ -0,0 +1,119 @@
+"""
+Language Detection - local, network-free check run before dispatch
+
+Decides whether text needs the API at all: text already in the target
+language, URLs, DOIs, numbers and citation keys are skipped. Scripts are
+told apart by character ranges; Latin-script languages by a small
+character trigram model.
+"""
+
+import re
+
+
+SKIP = 'skip'
+TRANSLATE = 'translate'
+DETECT = 'detect'           # source unclear: let the model work it out
+
+# Share of the text (CJK characters + Latin words) that must be in one script
+SCRIPT_RATIO = 0.6
+# Below this many letters the trigram model is not trusted
+MIN_LATIN_LETTERS = 20
+
+_URL = re.compile(r'^(?:https?://|ftp://|www\.)\S+$', re.IGNORECASE)
+_DOI = re.compile(r'^(?:doi:\s*|https?://(?:dx\.)?doi\.org/)?10\.\d{4,9}/\S+$', re.IGNORECASE)
+_EMAIL = re.compile(r'^[\w.+-]+@[\w-]+(?:\.[\w-]+)+$')
+_NUMBER = re.compile(r'^[\d\s.,:;%+\-−–×÷/*=()\[\]<>~^±]+$')
+# BibTeX/Better BibTeX keys and pandoc citations: smith2020deep, Smith_2020, [@smith2020], \cite{a,b}
+_CITEKEY = re.compile(r'^(?:\\cite[tp]?\{[^}]*\}|\[?@?[A-Za-z][\w-]*?[_:]?(?:19|20)\d{2}[\w-]*\]?)$')
+
+_HAN = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]')
+_KANA = re.compile(r'[\u3040-\u30ff\u31f0-\u31ff]')
+_HANGUL = re.compile(r'[\uac00-\ud7af\u1100-\u11ff]')
+_LATIN_WORD = re.compile(r'[A-Za-z\u00c0-\u024f]+')
+
+# Frequent character trigrams per language, word boundaries written as '_'
+PROFILES = {
+    'English': ('_th', 'the', 'he_', '_an', 'and', 'nd_', '_of', 'of_', '_in', 'ing', 'ng_', '_to', 'to_',
+                'is_', 'ion', 'tio', 'ed_', 'er_', 're_', 'on_', 'at_', 'es_', 'ent', 'for', 'or_', 'al_',
+                '_a_', '_be', '_co', 'wit', 'ith', 'hat', 'tha', '_is', 'are', 'ati', '_we', '_st', 'ly_',
+                'wor', 'ork', 'ks_', 'ave', 've_', 'nce', 'man', 'per', '_pr', 'pro', '_re', 'res', 'ity', 'ty_',
+                '_wh', '_ha', 'ts_', 'ted', 'ons', 'ers', 'ove', '_fo', '_ma', 'ate'),
+    'German': ('en_', 'er_', 'der', 'ch_', 'die', 'ie_', 'ein', 'und', '_un', 'nd_', 'sch', 'ich', 'den',
+               '_de', '_di', 'cht', 'ine', 'gen', 'ung', '_ei', '_zu', 'ten', 'ter', 'es_', 'eit', 'ht_',
+               'ist', '_ge', '_au', 'aus', 'auf', 'ach', 'lic', 'te_', 'ne_', 'em_', 'sie', 'wir', 'nic'),
+    'French': ('es_', '_de', 'de_', 'le_', 'ent', '_le', 'nt_', 'la_', '_la', 'ion', 'les', '_et', 'et_',
+               'que', '_qu', 're_', 'des', '_pa', 'ns_', 'men', '_un', 'une', '_po', '_co', '_pr', 'ur_',
+               'ait', 'our', '_en', 'ux_', 'est', '_du', 'du_', 'eur', 'ans', 'dan', '_so', 'ue_', 'ce_'),
+    'Spanish': ('_de', 'de_', 'os_', 'la_', 'el_', '_la', 'es_', 'en_', '_el', 'que', '_qu', 'ue_', 'as_',
+                'ión', 'ent', 'aci', 'ado', '_co', 'con', 'los', '_lo', 'del', '_se', '_en', '_pa', '_po',
+                '_un', 'est', 'ra_', 'ar_', 'nte', 'ció', '_es', 'do_', 'al_', 'an_', 'par', 'por', 'una'),
+}
+_TRIGRAMS = {lang: frozenset(g.replace('_', ' ') for g in grams) for lang, grams in PROFILES.items()}
+
+
+class Decision:
+    """What to do with a piece of text before dispatch"""
+
+    def __init__(self, action, language=None, reason=""):
+        self.action = action
+        self.language = language
+        self.reason = reason
+
+    def __repr__(self):
+        return f"<Decision {self.action} {self.language or '-'} {self.reason}>"
+
+
+def detect_latin(text):
+    """Best-matching Latin-script language and its trigram score; None when no language clearly leads"""
+    words = _LATIN_WORD.findall(text.lower())
+    padded = ' ' + ' '.join(words) + ' '
+    grams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+    if not grams:
+        return None, 0.0
+    scores = {lang: sum(1 for g in grams if g in table) / len(grams) for lang, table in _TRIGRAMS.items()}
+    best = max(scores, key=scores.get)
+    ranked = sorted(scores.values(), reverse=True)
+    # Require a clear lead over the runner-up
+    if ranked[0] < 0.08 or ranked[0] < ranked[1] * 1.3:
+        return None, ranked[0]
+    return best, ranked[0]
+
+
+def detect(text):
+    """Dominant language of text: a name from PROFILES, 'Chinese', 'Japanese', 'Korean' or None"""
+    han = len(_HAN.findall(text))
+    kana = len(_KANA.findall(text))
+    hangul = len(_HANGUL.findall(text))
+    latin_words = _LATIN_WORD.findall(text)
+    total = han + kana + hangul + len(latin_words)
+    if not total:
+        return None
+
+    if (han + kana) / total >= SCRIPT_RATIO:
+        # Japanese mixes kana into kanji text; Chinese never does
+        return 'Japanese' if kana > (han + kana) * 0.1 else 'Chinese'
+    if hangul / total >= SCRIPT_RATIO:
+        return 'Korean'
+    if len(latin_words) / total >= SCRIPT_RATIO and sum(map(len, latin_words)) >= MIN_LATIN_LETTERS:
+        return detect_latin(text)[0]
+    return None
+
+
+def decide(text, target_lang):
+    """Skip, translate or leave source detection to the model"""
+    stripped = text.strip()
+    if not stripped:
+        return Decision(SKIP, reason="empty")
+    if ' ' not in stripped and '\n' not in stripped:
+        for name, pattern in (('url', _URL), ('doi', _DOI), ('email', _EMAIL), ('citation key', _CITEKEY)):
+            if pattern.match(stripped):
+                return Decision(SKIP, reason=name)
+    if _NUMBER.match(stripped):
+        return Decision(SKIP, reason="number")
+
+    language = detect(stripped)
+    if language is None:
+        return Decision(DETECT)
+    if language == target_lang:
+        return Decision(SKIP, language, f"already {language}")
+    return Decision(TRANSLATE, language)
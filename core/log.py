@@ -0,0 +1,107 @@
+"""
+Logging - leveled logger with an in-memory ring buffer
+
+Callers only put a record on a queue (QueueHandler); formatting and all
+output - the ring buffer, a rotating log file, the console (logcat on
+Android) - happen on one background thread (QueueListener). Messages use
+%-style arguments, so a disabled debug call costs one level check and the
+message is never built.
+"""
+
+import logging
+import logging.handlers
+import queue
+import threading
+from collections import deque
+
+
+ROOT = 'zt'
+FORMAT = '%(asctime)s %(levelname).1s %(name)s: %(message)s'
+
+_lock = threading.Lock()
+_listener = None
+_ring = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues the record as is; the message is built on the listener thread"""
+
+    def prepare(self, record):
+        return record
+
+
+def get_logger(name):
+    """Logger under the app root, e.g. get_logger('engine') -> 'zt.engine'"""
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records as (time, level, logger, message) tuples"""
+
+    def __init__(self, capacity=1000):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append((record.created, record.levelname, record.name, record.getMessage()))
+        except Exception:
+            self.handleError(record)
+
+
+def setup(path=None, debug=False, console_level=logging.WARNING, ring_size=1000,
+          max_bytes=512 * 1024, backups=2):
+    """Route all app loggers through a background listener (idempotent).
+
+    INFO and above (DEBUG too when debug is set) reach the ring buffer and
+    the rotating file at path; only console_level and above go to stdout.
+    """
+    global _listener, _ring
+    with _lock:
+        if _listener is not None:
+            set_debug(debug)
+            return
+        _ring = RingBufferHandler(ring_size)
+        handlers = [_ring]
+        formatter = logging.Formatter(FORMAT)
+        if path:
+            try:
+                file_handler = logging.handlers.RotatingFileHandler(
+                    path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8', delay=True)
+                file_handler.setFormatter(formatter)
+                handlers.append(file_handler)
+            except Exception as e:
+                print(f"[Log] Log file unavailable: {e}")
+        console = logging.StreamHandler()
+        console.setLevel(console_level)
+        console.setFormatter(formatter)
+        handlers.append(console)
+
+        records = queue.SimpleQueue()
+        root = logging.getLogger(ROOT)
+        root.handlers[:] = [_DeferredQueueHandler(records)]
+        root.propagate = False
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        set_debug(debug)
+
+
+def set_debug(enabled):
+    logging.getLogger(ROOT).setLevel(logging.DEBUG if enabled else logging.INFO)
+
+
+def recent(limit=200, level=logging.DEBUG):
+    """Last log lines (oldest first), for an in-app log view or bug reports"""
+    if _ring is None:
+        return []
+    records = [r for r in list(_ring.records) if logging.getLevelName(r[1]) >= level]
+    return records[-limit:]
+
+
+def shutdown():
+    """Flush queued records and stop the background thread"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
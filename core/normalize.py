@@ -0,0 +1,123 @@
+"""
+Text Normalizer - clean up text copied out of a PDF reader
+
+Removes what the PDF layout adds to copied text (hard line breaks,
+hyphenated word splits, ligatures, page numbers and running headers, runs
+of whitespace) so the prompt is shorter and repeated copies of the same
+passage produce the same cache key.
+"""
+
+import re
+
+
+LIGATURES = {
+    '\ufb00': 'ff', '\ufb01': 'fi', '\ufb02': 'fl', '\ufb03': 'ffi', '\ufb04': 'ffl',
+    '\ufb05': 'st', '\ufb06': 'st', '\u0132': 'IJ', '\u0133': 'ij', '\u0152': 'OE', '\u0153': 'oe',
+}
+SPACES = '\u00a0\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u202f\u205f\u3000\t\v'
+INVISIBLE = '\u00ad\u200b\u200c\u200d\u2060\ufeff'
+
+_TRANSLATE = {ord(k): v for k, v in LIGATURES.items()}
+_TRANSLATE.update({ord(c): ' ' for c in SPACES})
+_TRANSLATE.update({ord(c): None for c in INVISIBLE})
+_TRANSLATE.update({ord('\r'): '\n', ord('\f'): '\n\n', ord('\u2028'): '\n', ord('\u2029'): '\n\n'})
+
+# Lines that look like a page number: "12", "- 12 -", "Page 3", "Page 3 of 10", "3 / 10".
+# Years, equation results and table cells look the same, so a match alone is not enough.
+_PAGE_NUMBER = re.compile(r'^(?:[-–—]?\s*(\d{1,4})\s*[-–—]?|page\s+(\d{1,4})(?:\s+of\s+\d{1,4})?|(\d{1,4})\s*/\s*\d{1,4})$',
+                          re.IGNORECASE)
+# Word, hyphen, line break, lowercase letter: a word split by the layout.
+# Words already joined by a hyphen ("state-of-\nthe-art") keep theirs.
+_HYPHEN_BREAK = re.compile(r'(?<![\w\-\u2010])([^\W\d_]+)[-\u2010]\n(?= *[a-z\u00df-\u00ff])')
+_CJK = re.compile(r'[\u3000-\u30ff\u3400-\u9fff\uac00-\ud7af\uff00-\uffef]')
+_SPACE_RUN = re.compile(r' {2,}')
+_SENTENCE_END = ('.', ',', ';', ':', '!', '?', '\u3002', '\uff0c', '\uff1b', '\uff1a', '\x00')
+
+# A short line repeated this often across the copied text is a running header or footer
+HEADER_REPEATS = 3
+HEADER_MAX_CHARS = 80
+
+
+def _page_numbers(lines):
+    """Indexes of lines that are page numbers.
+
+    A number line counts when it stands alone between blank lines (a page or
+    paragraph boundary), or when it runs on from another number line (n, n + 1)
+    with text in between, as page numbers do. Runs of adjacent number lines
+    are table columns or lists and are kept.
+    """
+    numbers = {}
+    for i, line in enumerate(lines):
+        match = _PAGE_NUMBER.match(line) if line else None
+        if match:
+            numbers[i] = int(next(group for group in match.groups() if group))
+    drop = set()
+    values = {}
+    for i, value in numbers.items():
+        if (i == 0 or not lines[i - 1]) and (i == len(lines) - 1 or not lines[i + 1]):
+            drop.add(i)
+        elif i - 1 not in numbers and i + 1 not in numbers:
+            values.setdefault(value, []).append(i)
+    for value, indexes in values.items():
+        if value + 1 in values:
+            drop.update(indexes)
+            drop.update(values[value + 1])
+    return drop
+
+
+def _drop_page_artifacts(lines):
+    counts = {}
+    for line in lines:
+        # Prose lines end in punctuation; headers and footers usually do not
+        if line and len(line) <= HEADER_MAX_CHARS and not line.endswith(_SENTENCE_END):
+            counts[line] = counts.get(line, 0) + 1
+    repeated = {line for line, n in counts.items() if n >= HEADER_REPEATS}
+    pages = _page_numbers(lines)
+    return [line for i, line in enumerate(lines) if not (line and (line in repeated or i in pages))]
+
+
+def _join_lines(lines):
+    """Reflow the lines of one paragraph; CJK text is joined without a space"""
+    out = lines[0]
+    for line in lines[1:]:
+        if out.endswith('\x00'):
+            # De-hyphenated split: join directly
+            out = out[:-1] + line
+        elif out.endswith(('-', '\u2010')) and line[:1].islower():
+            # Hyphenated compound broken after its hyphen
+            out += line
+        elif _CJK.match(out[-1:]) and _CJK.match(line[:1]):
+            out += line
+        else:
+            out += ' ' + line
+    return out
+
+
+def normalize_text(text, keep_paragraphs=True):
+    """Return text with PDF layout artifacts removed.
+
+    keep_paragraphs keeps blank-line paragraph breaks (as a single blank
+    line); otherwise the whole text is reflowed into one paragraph.
+    """
+    if not text:
+        return text
+    text = text.replace('\r\n', '\n').translate(_TRANSLATE)
+    if '\n' not in text:
+        return _SPACE_RUN.sub(' ', text).strip()
+
+    # Mark word splits so reflowing joins them without a space
+    text = _HYPHEN_BREAK.sub('\\1\x00\n', text)
+    lines = _drop_page_artifacts([line.strip() for line in text.split('\n')])
+
+    paragraphs, current = [], []
+    for line in lines:
+        if line:
+            current.append(line)
+        elif current:
+            paragraphs.append(_join_lines(current))
+            current = []
+    if current:
+        paragraphs.append(_join_lines(current))
+
+    separator = '\n\n' if keep_paragraphs else ' '
+    return _SPACE_RUN.sub(' ', separator.join(paragraphs).replace('\x00', '-'))
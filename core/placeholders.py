@@ -0,0 +1,73 @@
+"""
+Span Protection - keep formulas, citations, URLs and DOIs out of the model
+
+Spans the model should copy verbatim are swapped for short placeholders
+before the request and put back afterwards, which saves the tokens of
+re-emitting them and keeps them from being "translated" or mangled.
+"""
+
+import re
+
+
+PLACEHOLDER = "\u27e6{}\u27e7"                       # ⟦1⟧
+_PLACEHOLDER = re.compile(r'\u27e6\s*(\d+)\s*\u27e7')
+
+_AUTHOR = r"[A-Z][A-Za-z'\u2019\-]+(?:\s+(?:et\s+al\.?|and|&)(?:\s+[A-Z][A-Za-z'\u2019\-]+)?)?"
+_AUTHOR_YEAR = _AUTHOR + r",?\s+(?:19|20)\d{2}[a-z]?"
+
+# Earlier alternatives win where spans overlap
+_SPANS = re.compile('|'.join((
+    # Display math and LaTeX environments
+    r'\$\$.+?\$\$',
+    r'\\\[.+?\\\]',
+    r'\\begin\{([a-zA-Z*]+)\}.*?\\end\{\1\}',
+    # Inline math: no space just inside the dollars, so "$5 and $10" is left alone
+    r'\$(?!\s)[^$\n]+?(?<!\s)\$',
+    r'\\\(.+?\\\)',
+    # LaTeX references and citations
+    r'\\(?:cite[tp]?|ref|eqref|autoref|label|url)\{[^}]*\}',
+    # Numeric citations: [12], [3, 5-7]
+    r'\[\d+(?:\s*[,\u2013\u2014-]\s*\d+)*\]',
+    # Author-year citations: (Smith et al., 2020; Lee and Park, 2019a)
+    r'\(' + _AUTHOR_YEAR + r'(?:;\s*' + _AUTHOR_YEAR + r')*\)',
+    # URLs and DOIs, without trailing punctuation
+    r'https?://[^\s<>"]*[^\s<>".,;:!?)\]]',
+    r'\b10\.\d{4,9}/[^\s"<>]*[^\s"<>.,;:!?)\]]',
+)), re.DOTALL)
+
+
+def protect(text):
+    """Replace protected spans with placeholders; returns (masked text, spans)"""
+    spans = []
+    ids = {}
+
+    def swap(match):
+        span = match.group(0)
+        n = ids.get(span)
+        if n is None:
+            spans.append(span)
+            n = ids[span] = len(spans)
+        return PLACEHOLDER.format(n)
+
+    masked = _SPANS.sub(swap, text)
+    return masked, spans
+
+
+def restore(output, spans):
+    """Put spans back; returns (text, problems) where problems lists lost or unknown placeholders"""
+    if not spans:
+        return output, []
+    seen = set()
+    unknown = []
+
+    def swap(match):
+        n = int(match.group(1))
+        if not 1 <= n <= len(spans):
+            unknown.append(match.group(0))
+            return match.group(0)
+        seen.add(n)
+        return spans[n - 1]
+
+    restored = _PLACEHOLDER.sub(swap, output)
+    problems = [PLACEHOLDER.format(n) for n in range(1, len(spans) + 1) if n not in seen] + unknown
+    return restored, problems
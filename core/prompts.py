@@ -0,0 +1,104 @@
+"""
+Prompt Templates - versioned prompts and sampling profiles
+
+The prompt version is part of every cache key, so changing a template's
+wording means registering a new version rather than editing an old one;
+results produced by older prompts then stop matching.
+
+Since version 3 the system prompt is identical for every request and the
+user message puts the short per-language line first and the text last,
+so servers with prefix (KV) caching can reuse the longest possible prefix.
+"""
+
+
+class PromptTemplate:
+    """System and user prompt wording; never edit a registered version in place"""
+
+    def __init__(self, version, system, user, glossary="", placeholders=False):
+        self.version = version
+        self.system = system
+        self.user = user
+        self.glossary = glossary            # term block: fills {terms} in user, else is prepended
+        self.placeholders = placeholders    # the rules tell the model to keep ⟦n⟧ placeholders
+
+    def system_prompt(self, target_lang):
+        return self.system.format(target_lang=target_lang)
+
+    def user_prompt(self, text, target_lang, terms=None):
+        block = ""
+        if terms and self.glossary:
+            lines = "\n".join(f"- {source}: {target}" for source, target in terms)
+            block = self.glossary.format(terms=lines)
+        prompt = self.user.format(target_lang=target_lang, text=text, terms=block)
+        if block and '{terms}' not in self.user:
+            prompt = block + prompt
+        return prompt
+
+
+TEMPLATES = {}
+
+
+def register(template):
+    TEMPLATES[template.version] = template
+    return template
+
+
+def get_template(version):
+    """Registered template for version, falling back to the current one"""
+    return TEMPLATES.get(version) or TEMPLATES[CURRENT_VERSION]
+
+
+register(PromptTemplate(
+    1,
+    system="""You are a professional academic translator. Translate the given text to {target_lang}.
+
+Rules:
+1. Accurate translation preserving academic terminology
+2. Natural and fluent output
+3. Keep professional terms, add original in brackets if needed
+4. Maintain paragraph structure
+5. Output translation only, no explanations""",
+    user="Translate to {target_lang}:\n\n{text}",
+))
+
+register(PromptTemplate(
+    2,
+    system="""You are a professional academic translator. Translate the given text to {target_lang}.
+
+Rules:
+1. Accurate translation preserving academic terminology
+2. Natural and fluent output
+3. Keep professional terms, add original in brackets if needed
+4. Maintain paragraph structure
+5. Output translation only, no explanations
+6. Copy placeholders such as ⟦1⟧ exactly, in the matching position""",
+    user="Translate to {target_lang}:\n\n{text}",
+    glossary="Use these translations for the following terms:\n{terms}\n\n",
+    placeholders=True,
+))
+
+register(PromptTemplate(
+    3,
+    system="""You are a professional academic translator. Translate the text of each request into the target language it names.
+
+Rules:
+1. Accurate translation preserving academic terminology
+2. Natural and fluent output
+3. Keep professional terms, add original in brackets if needed
+4. Maintain paragraph structure
+5. Output translation only, no explanations
+6. Copy placeholders such as ⟦1⟧ exactly, in the matching position
+7. When the request lists terms, translate each of them exactly as given""",
+    user="Target language: {target_lang}\n{terms}\nText:\n{text}",
+    glossary="Terms:\n{terms}\n",
+    placeholders=True,
+))
+
+CURRENT_VERSION = 3
+
+
+# Request parameters per sampling profile; 'seed' is dropped for servers that reject it
+SAMPLING_PROFILES = {
+    'default': {'temperature': 0.3},
+    'deterministic': {'temperature': 0, 'seed': 42},
+}
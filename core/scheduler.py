@@ -0,0 +1,252 @@
+"""
+Translation Scheduler - background workers with in-flight deduplication
+"""
+
+import itertools
+import queue
+import threading
+from collections import deque
+
+from .log import get_logger
+from .segment import SEGMENT_CHARS, iter_segments
+
+log = get_logger('scheduler')
+
+
+# Lower runs first; interactive requests overtake background ones
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class TranslationJob:
+    """A queued translation request"""
+
+    def __init__(self, text, source, key, priority=PRIORITY_NORMAL):
+        self.text = text
+        self.source = source
+        self.key = key
+        self.priority = priority
+        self.status = "queued"      # queued -> running -> done, or queued -> cancelled
+        self.result = None          # TranslationResult once done
+        self._on_done = []
+        self._on_status = []
+        self._done_event = threading.Event()
+
+    @property
+    def done(self):
+        return self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the job finishes, return its TranslationResult"""
+        self._done_event.wait(timeout)
+        return self.result
+
+
+class StreamJob:
+    """A large text translated segment by segment; results are handed out, not kept"""
+
+    def __init__(self, source):
+        self.source = source
+        self.segments = 0           # segments delivered so far
+        self.failed = 0
+        self.cancelled = False
+        self._done_event = threading.Event()
+
+    @property
+    def done(self):
+        return self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        self._done_event.wait(timeout)
+        return self.failed == 0 and not self.cancelled
+
+    def cancel(self):
+        """Stop after the segment in progress; queued segments are withdrawn"""
+        if self.done:
+            return False
+        self.cancelled = True
+        return True
+
+    def _hold(self, job):
+        # on_done marker for the segment jobs, so cancelling withdraws only ours
+        pass
+
+
+class TranslationScheduler:
+    """Runs engine.translate() on worker threads.
+
+    Callbacks are invoked on the worker thread; UI code must hop back to its
+    own thread (Clock.schedule_once / run_on_ui_thread) before touching widgets.
+    """
+
+    def __init__(self, engine, workers=2, stream_window=2):
+        self.engine = engine
+        self.workers = workers
+        self.stream_window = stream_window      # segments of a stream queued or running at once
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()   # FIFO order within a priority
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._threads = []
+
+    @property
+    def busy(self):
+        """True while any job is queued or running"""
+        with self._lock:
+            return bool(self._inflight)
+
+    def submit(self, text, source="manual", on_done=None, on_status=None, priority=PRIORITY_NORMAL):
+        """Queue text for translation.
+
+        An identical request already in flight is reused instead of calling
+        the API twice; the new callbacks are attached to it. If that job is
+        still queued at a lower priority it is promoted and takes on the new
+        source, so a background request the user then asks for runs next.
+        """
+        key = self.engine.key_for(text)
+        with self._lock:
+            job = self._inflight.get(key)
+            enqueue = job is None
+            if enqueue:
+                job = TranslationJob(text, source, key, priority)
+                self._inflight[key] = job
+            elif priority < job.priority and job.status == "queued":
+                # The stale queue entry is skipped when a worker reaches it
+                job.priority = priority
+                job.source = source
+                enqueue = True
+            if on_done:
+                job._on_done.append(on_done)
+            if on_status:
+                job._on_status.append(on_status)
+            self._ensure_workers()
+
+        if enqueue:
+            self._queue.put((job.priority, next(self._seq), job))
+        return job
+
+    def submit_stream(self, text, source="manual", on_segment=None, on_done=None,
+                      priority=PRIORITY_NORMAL, max_chars=SEGMENT_CHARS, window=None):
+        """Translate a large text segment by segment, delivering results in order.
+
+        At most `window` segments (stream_window by default) are in flight,
+        so besides the input itself memory stays within a few segments.
+        on_segment(stream, result) runs for each segment once it and every
+        earlier one are done, then on_done(stream); both on a helper thread.
+        """
+        stream = StreamJob(source)
+        window = max(1, window or self.stream_window)
+
+        def drive():
+            segments = iter_segments(text, max_chars)
+            pending = deque()
+            try:
+                while not stream.cancelled:
+                    while len(pending) < window:
+                        segment = next(segments, None)
+                        if segment is None:
+                            break
+                        pending.append(self.submit(segment, source, on_done=stream._hold, priority=priority))
+                    if not pending:
+                        break
+                    result = pending.popleft().wait()
+                    if stream.cancelled or result is None:
+                        break
+                    stream.segments += 1
+                    if not result.ok:
+                        stream.failed += 1
+                    if on_segment:
+                        try:
+                            on_segment(stream, result)
+                        except Exception as e:
+                            log.warning("[Scheduler] Segment callback error: %s", e)
+            finally:
+                for job in pending:
+                    self.cancel(job, stream._hold)
+                stream._done_event.set()
+            if on_done:
+                try:
+                    on_done(stream)
+                except Exception as e:
+                    log.warning("[Scheduler] Callback error: %s", e)
+
+        threading.Thread(target=drive, name="translate-stream", daemon=True).start()
+        return stream
+
+    def cancel(self, job, on_done=None):
+        """Withdraw a request whose text is stale; returns False if it already finished.
+
+        Only the given on_done callback is removed (all callbacks when None),
+        so other requesters sharing the job are unaffected. A queued job left
+        with no callbacks never reaches the API. A running request cannot be
+        interrupted; it completes and its result is still cached.
+        """
+        if isinstance(job, StreamJob):
+            return job.cancel()
+        with self._lock:
+            if job.status in ("done", "cancelled"):
+                return False
+            if on_done is None:
+                del job._on_done[:]
+            elif on_done in job._on_done:
+                job._on_done.remove(on_done)
+            if job._on_done or job.status != "queued":
+                return True
+            job.status = "cancelled"
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+        job._done_event.set()
+        return True
+
+    def _ensure_workers(self):
+        # Threads are started on first use so importing/constructing stays cheap
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"translate-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker(self):
+        while True:
+            priority, _, job = self._queue.get()
+            try:
+                with self._lock:
+                    # Promoted jobs are queued twice; only the first entry runs
+                    claimed = job.status == "queued" and job.priority == priority
+                    if claimed:
+                        job.status = "running"
+                if claimed:
+                    self._run(job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job):
+        self._set_status(job, "running")
+        try:
+            job.result = self.engine.translate(job.text, source=job.source)
+        except Exception as e:
+            from .engine import TranslationResult
+            job.result = TranslationResult(job.text, f"Translation failed: {e}", False, 'error')
+
+        with self._lock:
+            if self._inflight.get(job.key) is job:
+                del self._inflight[job.key]
+            callbacks = list(job._on_done)
+
+        job.status = "done"
+        job._done_event.set()
+        self._set_status(job, "done")
+
+        for callback in callbacks:
+            try:
+                callback(job)
+            except Exception as e:
+                log.warning("[Scheduler] Callback error: %s", e)
+
+    def _set_status(self, job, status):
+        job.status = status
+        for callback in list(job._on_status):
+            try:
+                callback(job, status)
+            except Exception as e:
+                log.warning("[Scheduler] Status callback error: %s", e)
@@ -0,0 +1,50 @@
+"""
+Segmentation - split very large inputs into request-sized pieces
+
+A large copy is never normalized, sent or translated as one string:
+segments are sliced off lazily at the best boundary available (paragraph,
+sentence, line, word), so only the input itself plus the few segments in
+flight are held at any time.
+"""
+
+
+# Inputs longer than this are translated segment by segment
+LARGE_INPUT_CHARS = 8000
+# Target segment size; a segment is cut no shorter than half of it
+SEGMENT_CHARS = 4000
+
+# Preferred cut points, best first
+_BOUNDARIES = ('\n\n', '. ', '? ', '! ', '。', '？', '！', '\n', ' ')
+
+
+def is_large(text):
+    return text is not None and len(text) > LARGE_INPUT_CHARS
+
+
+def split_point(text, start, max_chars=SEGMENT_CHARS):
+    """End offset of the segment starting at start, without slicing text"""
+    end = start + max_chars
+    if end >= len(text):
+        return len(text)
+    lower = start + max_chars // 2
+    for boundary in _BOUNDARIES:
+        cut = text.rfind(boundary, lower, end)
+        if cut != -1:
+            return cut + len(boundary)
+    return end
+
+
+def iter_segments(text, max_chars=SEGMENT_CHARS):
+    """Yield successive non-blank segments of at most max_chars characters"""
+    start = 0
+    while start < len(text):
+        end = split_point(text, start, max_chars)
+        segment = text[start:end]
+        start = end
+        if segment.strip():
+            yield segment
+
+
+def separator(segment):
+    """What to put after this segment's translation when joining them"""
+    return "\n\n" if segment.rstrip(' \t').endswith('\n') else " "
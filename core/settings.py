@@ -0,0 +1,180 @@
+"""
+Settings - typed app settings read once, saved in the background
+
+The file keeps the layout Kivy's JsonStore used ({"settings": {...}}), so
+existing translator_config.json files and cli.py read it unchanged. Reads
+are attribute lookups on the loaded values; no file I/O happens on the
+monitoring tick. Updates notify subscribers straight away and are written
+atomically after a short delay, so a burst of changes costs one write.
+"""
+
+import json
+import os
+import threading
+
+from .log import get_logger
+
+log = get_logger('settings')
+
+
+RECORD = 'settings'
+
+
+class Settings:
+    """Typed view of the 'settings' record; read with attributes, change with update()"""
+
+    # name -> (type, default)
+    FIELDS = {
+        'api_key': (str, ''),
+        'api_url': (str, 'https://api.siliconflow.cn'),
+        'model': (str, 'Qwen/Qwen2.5-7B-Instruct'),
+        'target_lang': (str, 'Chinese'),
+        'auto_translate': (bool, True),
+        'enable_bubble': (bool, False),
+        'keep_paragraphs': (bool, True),
+        'deterministic': (bool, False),
+        'speculative': (bool, False),
+        'debug_logging': (bool, False),
+        'fuzzy_threshold': (float, 0.9),
+        'settle_delay': (float, 1.0),
+    }
+
+    def __init__(self, path=None, save_delay=1.0):
+        self.path = path
+        self.save_delay = save_delay
+        self.saved = False          # True once the record exists on disk
+        self._values = {name: default for name, (_, default) in self.FIELDS.items()}
+        self._unknown = {}          # keys of newer/older versions, written back untouched
+        self._other = {}            # other JsonStore records in the same file
+        self._subscribers = []      # (callback, keys or None)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._timer = None
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            log.warning("[Settings] Could not read %s: %s", self.path, e)
+            return
+        record = data.pop(RECORD, None)
+        self._other = data
+        if not isinstance(record, dict):
+            return
+        self.saved = True
+        for name, value in record.items():
+            if name in self.FIELDS:
+                self._values[name] = self._coerce(name, value)
+            else:
+                self._unknown[name] = value
+
+    def _coerce(self, name, value):
+        kind, default = self.FIELDS[name]
+        try:
+            return kind(value) if value is not None else default
+        except (TypeError, ValueError):
+            return default
+
+    def __getattr__(self, name):
+        fields = type(self).FIELDS
+        if name in fields:
+            return self.__dict__['_values'][name]
+        raise AttributeError(name)
+
+    def as_dict(self):
+        with self._lock:
+            return dict(self._values)
+
+    # -- changes -----------------------------------------------------------
+
+    def subscribe(self, callback, keys=None, replay=False):
+        """Call callback(changes) whenever one of keys (any key when None) changes.
+
+        changes maps each changed name to its new value. With replay the
+        callback is also called once now with the current values.
+        """
+        keys = frozenset(keys) if keys is not None else None
+        with self._lock:
+            self._subscribers.append((callback, keys))
+            current = dict(self._values)
+        if replay:
+            self._notify(callback, keys, current)
+
+    def update(self, **values):
+        """Apply new values, notify subscribers and schedule a save; returns what changed"""
+        changes = {}
+        with self._lock:
+            for name, value in values.items():
+                if name not in self.FIELDS:
+                    raise KeyError(f"Unknown setting: {name}")
+                value = self._coerce(name, value)
+                if value != self._values[name]:
+                    self._values[name] = value
+                    changes[name] = value
+            # Nothing on disk yet: write the record even if the values match
+            if not changes and self.saved:
+                return changes
+            self._dirty = True
+            subscribers = list(self._subscribers)
+        self._schedule_save()
+        for callback, keys in subscribers:
+            self._notify(callback, keys, changes)
+        return changes
+
+    def _notify(self, callback, keys, changes):
+        if keys is not None:
+            changes = {name: value for name, value in changes.items() if name in keys}
+        if not changes:
+            return
+        try:
+            callback(changes)
+        except Exception as e:
+            log.warning("[Settings] Subscriber error: %s", e)
+
+    # -- persistence -------------------------------------------------------
+
+    def _schedule_save(self):
+        if not self.path:
+            return
+        if not self.save_delay:
+            self.save()
+            return
+        with self._lock:
+            if self._timer is not None:
+                # Already pending: this change goes out with it
+                return
+            self._timer = threading.Timer(self.save_delay, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def save(self):
+        """Write the record atomically (no-op without a path or changes)"""
+        with self._lock:
+            self._timer = None
+            if not self.path or not self._dirty:
+                return
+            data = dict(self._other)
+            data[RECORD] = dict(self._unknown, **self._values)
+            self._dirty = False
+        tmp = self.path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self.saved = True
+        except Exception as e:
+            log.warning("[Settings] Could not save %s: %s", self.path, e)
+            with self._lock:
+                self._dirty = True
+
+    def close(self):
+        """Write any pending change now"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.save()
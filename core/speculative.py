@@ -0,0 +1,111 @@
+"""
+Speculative Translation - translate copied text before the user asks
+
+With auto-translate off, the user copies text and then taps the bubble.
+Offering each newly copied text here starts its translation at low priority
+in the meantime, so the tap is answered from the cache (or joins the job
+still in flight) instead of starting the whole request then.
+
+A speculation replaced on the clipboard while still queued is withdrawn
+before it reaches the API. Every one that was sent but never asked for is
+wasted spend, so it is capped twice: a daily token budget for the
+'speculative' usage source, and a pause after several speculations in a
+row went unused. The pause lifts as soon as the user taps for text that
+would have been speculated.
+"""
+
+import threading
+import time
+
+from .scheduler import PRIORITY_LOW
+from .segment import is_large
+
+
+SOURCE = 'speculative'
+
+
+class Speculator:
+    """Low-priority pre-translation of clipboard text with a spending cap"""
+
+    def __init__(self, scheduler, usage=None, daily_tokens=20000, max_unclaimed=5):
+        self.scheduler = scheduler
+        self.usage = usage
+        self.daily_tokens = daily_tokens        # 0 disables the token budget
+        self.max_unclaimed = max_unclaimed      # unused speculations in a row before pausing
+        self.enabled = False
+        self.offered = 0
+        self.claimed = 0
+        self.wasted = 0
+        self.unclaimed_streak = 0
+        self._current_key = None
+        self._current_job = None    # None when the current text was not sent
+        self._lock = threading.Lock()
+
+    def spent_today(self):
+        """Tokens spent on speculation today"""
+        if self.usage is None:
+            return 0
+        sums = self.usage.totals(day=time.strftime('%Y-%m-%d'), source=SOURCE)
+        return sums['prompt_tokens'] + sums['completion_tokens']
+
+    @property
+    def paused(self):
+        if self.max_unclaimed and self.unclaimed_streak >= self.max_unclaimed:
+            return True
+        return bool(self.daily_tokens) and self.spent_today() >= self.daily_tokens
+
+    def offer(self, text):
+        """Text just became readable on the clipboard; returns the job if one was started"""
+        # Large copies are too costly to translate on a guess
+        if not self.enabled or not text or is_large(text) or not text.strip():
+            return None
+        key = self.scheduler.engine.key_for(text)
+        with self._lock:
+            if key == self._current_key:
+                return self._current_job
+            self._retire()
+            self._current_key = key
+            self._current_job = None
+            self.offered += 1
+        if self.paused:
+            # Still remembered, so a matching tap shows speculation would have paid off
+            return None
+        job = self.scheduler.submit(text, source=SOURCE, on_done=self._hold, priority=PRIORITY_LOW)
+        with self._lock:
+            if self._current_key == key:
+                self._current_job = job
+        return job
+
+    def claim(self, text):
+        """The user asked for text; a matching speculation counts as used"""
+        with self._lock:
+            if self._current_key is None:
+                return False
+        key = self.scheduler.engine.key_for(text)
+        with self._lock:
+            if key != self._current_key:
+                return False
+            if self._current_job is not None:
+                self.claimed += 1
+            self.unclaimed_streak = 0
+            self._current_key = None
+            self._current_job = None
+        return True
+
+    def _hold(self, job):
+        # on_done marker for speculative jobs, so withdrawing one leaves other requesters' callbacks
+        pass
+
+    def _retire(self):
+        # The previous text was replaced on the clipboard before any tap
+        job = self._current_job
+        if job is None:
+            return
+        # Still queued and nobody else waiting on it: withdrawn before it reaches the API
+        self.scheduler.cancel(job, on_done=self._hold)
+        if job.status == "cancelled":
+            return
+        # Jobs answered without an API call (cache, skipped...) cost nothing
+        if not job.done or job.result is None or job.result.origin == 'api':
+            self.wasted += 1
+            self.unclaimed_streak += 1
@@ -0,0 +1,50 @@
+"""
+Startup Trace - where cold-start time goes
+
+Steps run before the first frame delay the window; everything else is
+deferred until it has been drawn. The trace times both kinds, relative to
+process start, so the log shows what the first frame waited for and what
+was moved out of its way.
+"""
+
+import threading
+import time
+
+
+class StartupTrace:
+    """Timings of startup steps; report() lists them once startup has settled"""
+
+    def __init__(self, t0=None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.steps = []             # (name, offset, duration, deferred), seconds
+        self.first_frame = None     # offset of the first drawn frame
+        self._lock = threading.Lock()
+
+    def measure(self, name, func, *args, deferred=False):
+        """Run func(*args), record how long it took and return its result"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.steps.append((name, start - self.t0, end - start, deferred))
+
+    def frame_drawn(self):
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.t0
+
+    def report(self):
+        """Human-readable lines, in the order the steps finished"""
+        with self._lock:
+            steps = list(self.steps)
+        lines = []
+        for name, offset, duration, deferred in steps:
+            kind = "deferred" if deferred else "startup "
+            lines.append(f"{kind} {name:<20} at {offset * 1000:7.1f} ms took {duration * 1000:6.1f} ms")
+        if self.first_frame is not None:
+            blocking = sum(duration for _, _, duration, deferred in steps if not deferred)
+            moved = sum(duration for _, _, duration, deferred in steps if deferred)
+            lines.append(f"first frame at {self.first_frame * 1000:.1f} ms "
+                         f"({blocking * 1000:.1f} ms in steps before it, {moved * 1000:.1f} ms deferred)")
+        return lines
@@ -0,0 +1,115 @@
+"""
+Usage Accounting - token counts from API responses
+
+Requests are aggregated per (day, model, source) so the stats file stays a
+few rows long however many requests are made.
+"""
+
+import json
+import os
+import threading
+import time
+
+from .log import get_logger
+
+log = get_logger('usage')
+
+
+class UsageTracker:
+    """Token totals per day, model and source (monitor, manual, bubble, batch, library)"""
+
+    # Row layout after the (day, model, source) key
+    FIELDS = ('requests', 'prompt_tokens', 'completion_tokens', 'cached_tokens')
+
+    def __init__(self, path=None, save_interval=10.0):
+        self.path = path
+        self.save_interval = save_interval
+        self._rows = {}             # (day, model, source) -> counts in FIELDS order
+        self.session = dict.fromkeys(self.FIELDS, 0)    # since this tracker was created
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for row in data.get('rows', []):
+                counts = list(row[3:]) + [0] * (len(self.FIELDS) - len(row[3:]))
+                self._rows[tuple(row[:3])] = counts[:len(self.FIELDS)]
+        except Exception as e:
+            log.warning("[Usage] Could not read %s: %s", self.path, e)
+
+    def record(self, model, source, usage):
+        """Add one response's usage dict (prompt_tokens, completion_tokens, cached_tokens)"""
+        prompt = int(usage.get('prompt_tokens') or 0)
+        completion = int(usage.get('completion_tokens') or 0)
+        # Prompt tokens served from the provider's prefix cache
+        cached = int(usage.get('cached_tokens') or 0)
+        key = (time.strftime('%Y-%m-%d'), model, source or "")
+        now = time.monotonic()
+        with self._lock:
+            row = self._rows.setdefault(key, [0] * len(self.FIELDS))
+            for i, (name, value) in enumerate(zip(self.FIELDS, (1, prompt, completion, cached))):
+                row[i] += value
+                self.session[name] += value
+            self._dirty = True
+            due = now - self._last_save >= self.save_interval
+        if due:
+            self.save()
+
+    # -- queries -----------------------------------------------------------
+
+    def totals(self, day=None, model=None, source=None):
+        """Summed counts over rows matching the given filters"""
+        sums = dict.fromkeys(self.FIELDS, 0)
+        with self._lock:
+            for (row_day, row_model, row_source), counts in self._rows.items():
+                if (day is None or row_day == day) and (model is None or row_model == model) \
+                        and (source is None or row_source == source):
+                    for name, value in zip(self.FIELDS, counts):
+                        sums[name] += value
+        return sums
+
+    def breakdown(self, field, day=None):
+        """Totals grouped by 'day', 'model' or 'source'"""
+        index = ('day', 'model', 'source').index(field)
+        groups = {}
+        with self._lock:
+            for key, counts in self._rows.items():
+                if day is not None and key[0] != day:
+                    continue
+                sums = groups.setdefault(key[index], dict.fromkeys(self.FIELDS, 0))
+                for name, value in zip(self.FIELDS, counts):
+                    sums[name] += value
+        return groups
+
+    def today(self):
+        return self.totals(day=time.strftime('%Y-%m-%d'))
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self):
+        """Write the aggregate rows atomically (no-op without a path or changes)"""
+        with self._save_lock:
+            with self._lock:
+                if not self.path or not self._dirty:
+                    return
+                rows = [list(key) + counts for key, counts in sorted(self._rows.items())]
+                self._dirty = False
+                self._last_save = time.monotonic()
+            tmp = self.path + '.tmp'
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump({'fields': ['day', 'model', 'source'] + list(self.FIELDS), 'rows': rows},
+                              f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp, self.path)
+            except Exception as e:
+                log.warning("[Usage] Could not save %s: %s", self.path, e)
+
+    def close(self):
+        self.save()
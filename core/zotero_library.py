@@ -0,0 +1,266 @@
+"""
+Zotero Library - bulk pre-translation of titles, abstracts and annotations
+
+Reads zotero.sqlite strictly read-only and writes results to a separate
+sidecar database, so a running Zotero is never blocked or modified.
+"""
+
+import os
+import sqlite3
+import time
+import urllib.parse
+
+from .batch import translate_ordered
+from .log import get_logger
+
+log = get_logger('zotero')
+
+
+KINDS = ('title', 'abstract', 'annotation')
+
+# Zotero field names for the metadata kinds
+METADATA_FIELDS = {'title': 'title', 'abstract': 'abstractNote'}
+
+
+class LibraryText:
+    """One translatable text from the Zotero library"""
+
+    __slots__ = ('kind', 'item_id', 'item_key', 'text')
+
+    def __init__(self, kind, item_id, item_key, text):
+        self.kind = kind
+        self.item_id = item_id
+        self.item_key = item_key
+        self.text = text
+
+
+def open_zotero_db(path, immutable=None):
+    """Open zotero.sqlite read-only.
+
+    mode=ro never takes a write lock, and in WAL mode it never blocks Zotero.
+    A running Zotero may still hold its own exclusive lock; then (or when
+    immutable=True) the file is opened with immutable=1, which skips locking
+    entirely. Immutable reads can miss changes Zotero is making right now,
+    which is fine for an overnight batch that can simply be rerun.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    base = "file:" + urllib.parse.quote(os.path.abspath(path))
+    if not immutable:
+        try:
+            conn = sqlite3.connect(base + "?mode=ro", uri=True, timeout=1.0)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("SELECT 1 FROM items LIMIT 1").fetchall()
+            return conn
+        except sqlite3.OperationalError as e:
+            if immutable is False or 'locked' not in str(e):
+                raise
+            log.info("[ZoteroLibrary] Database locked (%s), reading immutable snapshot", e)
+
+    conn = sqlite3.connect(base + "?mode=ro&immutable=1", uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def iter_metadata(conn, kinds, after_item_id=0):
+    """Stream titles/abstracts in itemID order (cursor iteration, no fetchall)"""
+    fields = {METADATA_FIELDS[k]: k for k in kinds if k in METADATA_FIELDS}
+    if not fields:
+        return
+    placeholders = ",".join("?" * len(fields))
+    cursor = conn.execute(
+        f"""
+        SELECT i.itemID, i.key, f.fieldName, v.value
+        FROM items i
+        JOIN itemData d ON d.itemID = i.itemID
+        JOIN fields f ON f.fieldID = d.fieldID
+        JOIN itemDataValues v ON v.valueID = d.valueID
+        WHERE f.fieldName IN ({placeholders})
+          AND i.itemID >= ?
+          AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+        ORDER BY i.itemID, f.fieldName
+        """,
+        (*fields, after_item_id),
+    )
+    for item_id, item_key, field_name, value in cursor:
+        if isinstance(value, str) and value.strip():
+            yield LibraryText(fields[field_name], item_id, item_key, value)
+
+
+def iter_annotations(conn, after_item_id=0):
+    """Stream highlighted annotation text in itemID order"""
+    try:
+        cursor = conn.execute(
+            """
+            SELECT a.itemID, i.key, a.text
+            FROM itemAnnotations a
+            JOIN items i ON i.itemID = a.itemID
+            WHERE a.itemID >= ?
+              AND a.text IS NOT NULL AND a.text != ''
+              AND a.itemID NOT IN (SELECT itemID FROM deletedItems)
+            ORDER BY a.itemID
+            """,
+            (after_item_id,),
+        )
+    except sqlite3.OperationalError as e:
+        # Zotero < 6 has no itemAnnotations table
+        log.debug("[ZoteroLibrary] No annotations: %s", e)
+        return
+    for item_id, item_key, text in cursor:
+        if text.strip():
+            yield LibraryText('annotation', item_id, item_key, text)
+
+
+class SidecarStore:
+    """SQLite store for library translations and job progress"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS translations (
+        key TEXT PRIMARY KEY,
+        source_text TEXT NOT NULL,
+        target_text TEXT NOT NULL,
+        model TEXT,
+        target_lang TEXT,
+        created REAL
+    );
+    CREATE TABLE IF NOT EXISTS item_texts (
+        item_id INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        item_key TEXT,
+        key TEXT NOT NULL,
+        PRIMARY KEY (item_id, kind, key)
+    );
+    CREATE TABLE IF NOT EXISTS skipped (
+        key TEXT PRIMARY KEY,
+        reason TEXT,
+        created REAL
+    );
+    CREATE TABLE IF NOT EXISTS progress (
+        name TEXT PRIMARY KEY,
+        last_item_id INTEGER NOT NULL
+    );
+    """
+
+    def __init__(self, path, commit_every=50):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.commit_every = commit_every
+        self._uncommitted = 0
+
+    def has_translation(self, key):
+        return self.conn.execute("SELECT 1 FROM translations WHERE key = ?", (key,)).fetchone() is not None
+
+    def get_translation(self, key):
+        row = self.conn.execute("SELECT target_text FROM translations WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def add_translation(self, key, source_text, target_text, model, target_lang):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+            (key, source_text, target_text, model, target_lang, time.time()),
+        )
+        self._maybe_commit()
+
+    def is_skipped(self, key):
+        return self.conn.execute("SELECT 1 FROM skipped WHERE key = ?", (key,)).fetchone() is not None
+
+    def add_skipped(self, key, reason):
+        """Text the language check decided not to send; it has no translation row"""
+        self.conn.execute("INSERT OR REPLACE INTO skipped VALUES (?, ?, ?)", (key, reason, time.time()))
+        self._maybe_commit()
+
+    def link_item(self, entry, key):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO item_texts VALUES (?, ?, ?, ?)",
+            (entry.item_id, entry.kind, entry.item_key, key),
+        )
+        self._maybe_commit()
+
+    def get_progress(self, name):
+        row = self.conn.execute("SELECT last_item_id FROM progress WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def set_progress(self, name, item_id):
+        self.conn.execute("INSERT OR REPLACE INTO progress VALUES (?, ?)", (name, item_id))
+        self._maybe_commit()
+
+    def reset_progress(self):
+        self.conn.execute("DELETE FROM progress")
+        self.commit()
+
+    def _maybe_commit(self):
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        self.conn.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+
+def translate_library(zotero_conn, store, engine, scheduler, kinds=KINDS, window=16, limit=0, on_progress=None):
+    """Translate library texts into the sidecar store, resuming from saved progress.
+
+    Texts already in the store are linked without an API call; repeats within
+    the run are served from the engine cache and the scheduler's dedupe.
+    Returns a stats dict.
+    """
+    translator = engine.translator
+    stats = {'seen': 0, 'stored': 0, 'translated': 0, 'cached': 0, 'skipped': 0, 'failed': 0}
+
+    streams = []
+    metadata_kinds = [k for k in kinds if k in METADATA_FIELDS]
+    if metadata_kinds:
+        streams.append(('metadata', iter_metadata(zotero_conn, metadata_kinds, store.get_progress('metadata'))))
+    if 'annotation' in kinds:
+        streams.append(('annotation', iter_annotations(zotero_conn, store.get_progress('annotation'))))
+
+    for name, entries in streams:
+        progress_blocked = False
+
+        def pending(entries=entries):
+            # Link texts that are already stored, queue the rest
+            for entry in entries:
+                if limit and stats['seen'] >= limit:
+                    return
+                stats['seen'] += 1
+                key = engine.key_for(entry.text)
+                if store.has_translation(key):
+                    store.link_item(entry, key)
+                    stats['stored'] += 1
+                    continue
+                if store.is_skipped(key):
+                    stats['skipped'] += 1
+                    continue
+                yield (entry, key), entry.text
+
+        # 'library' results are exact (never fuzzy matches): they are stored under the text's own key
+        for (entry, key), result in translate_ordered(scheduler, pending(), window=window, source="library"):
+            if result is not None and result.ok and result.origin == 'skipped':
+                # The source text is not a translation; remember the decision instead
+                store.add_skipped(key, result.detail)
+                stats['skipped'] += 1
+            elif result is not None and result.ok:
+                store.add_translation(key, entry.text, result.text, translator.model, translator.target_lang)
+                store.link_item(entry, key)
+                stats['cached' if result.reused else 'translated'] += 1
+            else:
+                stats['failed'] += 1
+                # Keep progress before the failed item so a rerun retries it
+                progress_blocked = True
+                log.warning("[ZoteroLibrary] %s of item %s failed: %s", entry.kind, entry.item_key, result.text if result else 'empty')
+            if not progress_blocked:
+                # Results arrive in itemID order, so everything before this item is done
+                store.set_progress(name, entry.item_id)
+            if on_progress:
+                on_progress(stats)
+        store.commit()
+
+    return stats
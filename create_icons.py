@@ -1,6 +1,9 @@
 """
 生成应用图标和启动画面
 运行此脚本生成基础图标文件
+
+渐变和圆角遮罩用 NumPy 数组一次算出，各 Android 密度的图片在多个进程中并行生成；
+输入 (本脚本内容和图片尺寸) 未变化的文件会跳过，记录保存在 assets/.icons_manifest.json
 """
 
 try:
@@ -9,163 +12,258 @@ except ImportError:
     print("请先安装Pillow: pip install Pillow")
     exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("请先安装NumPy: pip install numpy")
+    exit(1)
+
+import argparse
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Android 启动器图标尺寸 (mipmap-*)
+ICON_DENSITIES = {
+    'mdpi': 48,
+    'hdpi': 72,
+    'xhdpi': 96,
+    'xxhdpi': 144,
+    'xxxhdpi': 192,
+}
+
+# 竖屏启动画面尺寸 (drawable-port-*)
+PRESPLASH_DENSITIES = {
+    'mdpi': (320, 480),
+    'hdpi': (480, 800),
+    'xhdpi': (720, 1280),
+    'xxhdpi': (1080, 1920),
+    'xxxhdpi': (1440, 2560),
+}
+
+MANIFEST_FILE = '.icons_manifest.json'
+
+
+def vertical_gradient(width, height, top, delta):
+    """竖直渐变: 第 y 行颜色为 top + (y / height) * delta，与逐行 draw.line 结果一致"""
+    t = np.arange(height, dtype=np.float64)[:, None] / height
+    rows = (np.array(top, dtype=np.float64) + t * np.array(delta, dtype=np.float64)).astype(np.uint8)
+    return np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, len(top))))
+
+
+def rounded_mask(size, radius):
+    """圆角矩形遮罩 (边缘抗锯齿)"""
+    y, x = np.ogrid[:size, :size]
+    # 到最近的内部矩形点的距离，圆角以外为 0
+    dx = np.maximum(np.maximum(radius - x, x - (size - 1 - radius)), 0)
+    dy = np.maximum(np.maximum(radius - y, y - (size - 1 - radius)), 0)
+    dist = np.sqrt(dx * dx + dy * dy)
+    alpha = np.clip(radius + 0.5 - dist, 0.0, 1.0)
+    return (alpha * 255).astype(np.uint8)
 
 
 def create_icon(size=512):
     """创建应用图标"""
-    # 创建圆角矩形图标
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+    # 按 512 像素的设计稿缩放线宽和偏移
+    s = size / 512
+
     # 背景渐变色 (深蓝绿色)
-    for y in range(size):
-        r = int(25 + (y/size) * 20)
-        g = int(100 + (y/size) * 50)
-        b = int(120 + (y/size) * 30)
-        draw.line([(0, y), (size, y)], fill=(r, g, b, 255))
-    
+    rgb = vertical_gradient(size, size, (25, 100, 120), (20, 50, 30))
+
     # 绘制圆角遮罩
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
     corner_radius = size // 5
-    mask_draw.rounded_rectangle(
-        [(0, 0), (size-1, size-1)],
-        radius=corner_radius,
-        fill=255
-    )
-    img.putalpha(mask)
-    
+    alpha = rounded_mask(size, corner_radius)
+    img = Image.fromarray(np.dstack((rgb, alpha)), 'RGBA')
+
     # 添加书本图标符号
     draw = ImageDraw.Draw(img)
-    
+
     # 书本形状
     book_margin = size // 6
     book_left = book_margin
     book_right = size - book_margin
     book_top = size // 4
     book_bottom = size - size // 5
-    
+
     # 书脊
     spine_x = size // 2
     draw.rectangle(
-        [(spine_x - 10, book_top), (spine_x + 10, book_bottom)],
+        [(spine_x - round(10 * s), book_top), (spine_x + round(10 * s), book_bottom)],
         fill=(255, 255, 255, 200)
     )
-    
+
     # 左页
     draw.polygon([
-        (book_left, book_top + 20),
-        (spine_x - 15, book_top),
-        (spine_x - 15, book_bottom),
-        (book_left, book_bottom - 20)
+        (book_left, book_top + round(20 * s)),
+        (spine_x - round(15 * s), book_top),
+        (spine_x - round(15 * s), book_bottom),
+        (book_left, book_bottom - round(20 * s))
     ], fill=(255, 255, 255, 180))
-    
+
     # 右页
     draw.polygon([
-        (book_right, book_top + 20),
-        (spine_x + 15, book_top),
-        (spine_x + 15, book_bottom),
-        (book_right, book_bottom - 20)
+        (book_right, book_top + round(20 * s)),
+        (spine_x + round(15 * s), book_top),
+        (spine_x + round(15 * s), book_bottom),
+        (book_right, book_bottom - round(20 * s))
     ], fill=(255, 255, 255, 180))
-    
-    # 翻译符号 (A→中)
-    try:
-        # 尝试使用系统字体
-        font_size = size // 8
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
-    
+
     # 在底部添加"译"字标识
-    text_y = book_bottom + 10
+    text_y = book_bottom + round(10 * s)
     draw.text(
         (size // 2, text_y),
         "译",
         fill=(255, 255, 255, 230),
         anchor="mt"
     )
-    
+
     return img
 
 
+def load_font(size):
+    try:
+        # 尝试使用系统字体
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        return ImageFont.load_default()
+
+
 def create_presplash(width=1080, height=1920):
     """创建启动画面"""
-    img = Image.new('RGB', (width, height), (20, 30, 40))
-    draw = ImageDraw.Draw(img)
-    
+    # 按 1080 宽的设计稿缩放
+    s = width / 1080
+
     # 渐变背景
-    for y in range(height):
-        r = int(20 + (y/height) * 15)
-        g = int(30 + (y/height) * 30)
-        b = int(40 + (y/height) * 40)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-    
+    img = Image.fromarray(vertical_gradient(width, height, (20, 30, 40), (15, 30, 40)), 'RGB')
+    draw = ImageDraw.Draw(img)
+
     # 中心图标
-    icon = create_icon(256)
-    icon_x = (width - 256) // 2
-    icon_y = (height - 256) // 2 - 100
+    icon_size = round(256 * s)
+    icon = create_icon(icon_size)
+    icon_x = (width - icon_size) // 2
+    icon_y = (height - icon_size) // 2 - round(100 * s)
     img.paste(icon, (icon_x, icon_y), icon)
-    
+
     # 应用名称
-    try:
-        title_font = ImageFont.truetype("arial.ttf", 60)
-        subtitle_font = ImageFont.truetype("arial.ttf", 30)
-    except:
-        title_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-    
+    title_font = load_font(round(60 * s))
+    subtitle_font = load_font(round(30 * s))
+
     draw.text(
-        (width // 2, icon_y + 300),
+        (width // 2, icon_y + round(300 * s)),
         "Zotero翻译助手",
         fill=(255, 255, 255),
         anchor="mt",
         font=title_font
     )
-    
+
     draw.text(
-        (width // 2, icon_y + 380),
+        (width // 2, icon_y + round(380 * s)),
         "学术文献阅读翻译工具",
         fill=(180, 180, 180),
         anchor="mt",
         font=subtitle_font
     )
-    
+
     # 底部加载提示
     draw.text(
-        (width // 2, height - 150),
+        (width // 2, height - round(150 * s)),
         "Loading...",
         fill=(120, 120, 120),
         anchor="mt",
         font=subtitle_font
     )
-    
+
     return img
 
 
+def build_jobs(assets_dir):
+    """(输出路径, 类型, 尺寸) 列表: buildozer 使用的两张图 + 各密度版本 (assets/res)"""
+    jobs = [
+        (os.path.join(assets_dir, 'icon.png'), 'icon', (512,)),
+        (os.path.join(assets_dir, 'presplash.png'), 'presplash', (1080, 1920)),
+    ]
+    res_dir = os.path.join(assets_dir, 'res')
+    for density, size in ICON_DENSITIES.items():
+        jobs.append((os.path.join(res_dir, f'mipmap-{density}', 'icon.png'), 'icon', (size,)))
+    for density, size in PRESPLASH_DENSITIES.items():
+        jobs.append((os.path.join(res_dir, f'drawable-port-{density}', 'presplash.png'), 'presplash', size))
+    return jobs
+
+
+def input_hash(script_digest, kind, size):
+    """输出内容只取决于绘制代码和尺寸"""
+    return hashlib.sha256(f"{script_digest}:{kind}:{size}".encode('utf-8')).hexdigest()
+
+
+def render(job):
+    """在工作进程中生成并保存一张图片"""
+    path, kind, size = job
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    img = create_icon(*size) if kind == 'icon' else create_presplash(*size)
+    img.save(path, 'PNG')
+    return path
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 def main():
     """生成图标文件"""
-    assets_dir = os.path.join(os.path.dirname(__file__), 'assets')
+    parser = argparse.ArgumentParser(description="生成应用图标和启动画面")
+    parser.add_argument('--force', action='store_true', help="忽略记录，全部重新生成")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="并行进程数")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    assets_dir = os.path.join(script_dir, 'assets')
     os.makedirs(assets_dir, exist_ok=True)
-    
-    # 生成应用图标
-    print("生成应用图标...")
-    icon = create_icon(512)
-    icon_path = os.path.join(assets_dir, 'icon.png')
-    icon.save(icon_path, 'PNG')
-    print(f"  已保存: {icon_path}")
-    
-    # 生成启动画面
-    print("生成启动画面...")
-    presplash = create_presplash()
-    presplash_path = os.path.join(assets_dir, 'presplash.png')
-    presplash.save(presplash_path, 'PNG')
-    print(f"  已保存: {presplash_path}")
-    
-    print("\n✅ 图标生成完成!")
+
+    with open(os.path.abspath(__file__), 'rb') as f:
+        script_digest = hashlib.sha256(f.read()).hexdigest()
+    manifest_path = os.path.join(assets_dir, MANIFEST_FILE)
+    manifest = {} if args.force else load_manifest(manifest_path)
+
+    # 只生成输入有变化或文件缺失的图片
+    pending = []
+    hashes = {}
+    for path, kind, size in build_jobs(assets_dir):
+        key = os.path.relpath(path, assets_dir).replace(os.sep, '/')
+        hashes[key] = input_hash(script_digest, kind, size)
+        if manifest.get(key) != hashes[key] or not os.path.exists(path):
+            pending.append((path, kind, size))
+
+    if not pending:
+        print("图标和启动画面均已是最新，无需生成")
+        return
+
+    print(f"生成 {len(pending)} 张图片 (跳过 {len(hashes) - len(pending)} 张未变化的)...")
+    workers = max(1, min(args.jobs, len(pending)))
+    if workers == 1:
+        done = [render(job) for job in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(render, pending))
+    for path in done:
+        print(f"  已保存: {path}")
+
+    manifest.update(hashes)
+    tmp = manifest_path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, manifest_path)
+
+    print(f"\n✅ 图标生成完成! ({time.perf_counter() - start:.2f}s)")
     print("提示: 如需自定义图标，请替换 assets/ 目录下的图片文件")
 
 
 if __name__ == '__main__':
     main()
-
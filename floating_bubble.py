@@ -7,12 +7,16 @@ from kivy.utils import platform
 from kivy.clock import Clock
 from kivy.app import App
 
+from core.log import get_logger
+
+log = get_logger('bubble')
+
 if platform == 'android':
     try:
         from jnius import autoclass, PythonJavaClass, java_method
         from android.runnable import run_on_ui_thread
     except ImportError:
-        print("[FloatingBubble] Warning: Android imports not available")
+        log.warning("[FloatingBubble] Warning: Android imports not available")
 
 
 def show_toast(message):
@@ -30,7 +34,7 @@ def show_toast(message):
                 Toast.makeText(activity, String(message), Toast.LENGTH_SHORT).show()
             _show()
         except Exception as e:
-            print(f"[Toast] Error: {e}")
+            log.warning("[Toast] Error: %s", e)
 
 
 class FloatingBubble:
@@ -89,60 +93,50 @@ class FloatingBubble:
                 self.update_status("step3")
                 clip_text = prefs.getString("clip_text", "")
                 
-                print(f"[FloatingBubble] Got clipboard: {len(clip_text)} chars")
+                log.debug("[FloatingBubble] Got clipboard: %s chars", len(clip_text))
                 
                 self.pending_request_id = None
                 self.last_processed_request_id = result_request_id
                 
                 if clip_text and len(clip_text.strip()) > 0:
-                    print("[FloatingBubble] Starting background translation...")
+                    log.debug("[FloatingBubble] Starting background translation...")
                     self._start_background_translation(clip_text)
                 else:
                     show_toast("Clipboard empty")
                     self.update_status("error")
                     
         except Exception as e:
-            print(f"[FloatingBubble] Poll error: {e}")
+            log.warning("[FloatingBubble] Poll error: %s", e)
     
     def _start_background_translation(self, text):
-        """Start translation in background thread"""
-        import threading
+        """Queue translation on the core scheduler"""
+        app = App.get_running_app()
+        if not app or not hasattr(app, 'scheduler'):
+            return
         
-        def translate_thread():
-            try:
-                app = App.get_running_app()
-                if not app or not hasattr(app, 'translator'):
-                    return
-                
-                self.update_status("step4")
-                print(f"[FloatingBubble] Translating...")
-                
-                result = app.translator.translate(text)
-                
-                if result and not (result.startswith("Error:") or result.startswith("Translation failed:")):
-                    print(f"[FloatingBubble] Translation done: {len(result)} chars")
-                    self.cached_translation = result
-                    Clock.schedule_once(lambda dt: self._show_translation_result(result), 0)
-                else:
-                    Clock.schedule_once(lambda dt: self._show_translation_error(result or "Empty result"), 0)
-                    
-            except Exception as e:
-                print(f"[FloatingBubble] Translation error: {e}")
-                Clock.schedule_once(lambda dt: self._show_translation_error(str(e)), 0)
+        self.update_status("step4")
+        log.debug("[FloatingBubble] Translating...")
+        
+        def on_done(job):
+            result = job.result
+            if result.ok:
+                log.debug("[FloatingBubble] Translation done (%s): %s chars", result.origin, len(result.text))
+                self.cached_translation = result.text
+                Clock.schedule_once(lambda dt: self._show_translation_result(result.text), 0)
+            else:
+                Clock.schedule_once(lambda dt: self._show_translation_error(result.text), 0)
         
-        thread = threading.Thread(target=translate_thread)
-        thread.daemon = True
-        thread.start()
+        app.scheduler.submit(text, source="bubble", on_done=on_done)
     
     def _show_translation_result(self, result):
         """Show translation result (called on main Kivy thread)"""
         try:
             self.update_status("step5")
-            print("[FloatingBubble] Showing translation result...")
+            log.debug("[FloatingBubble] Showing translation result...")
             self.show_translation(result)
             self.update_status("done")
         except Exception as e:
-            print(f"[FloatingBubble] Show result error: {e}")
+            log.warning("[FloatingBubble] Show result error: %s", e)
             self.update_status("error")
             show_toast(f"Result: {result[:80]}")
     
@@ -219,13 +213,13 @@ class FloatingBubble:
                                     self.bubble_ref.bubble_params
                                 )
                             except Exception as e:
-                                print(f"[Bubble] Drag error: {e}")
+                                log.warning("[Bubble] Drag error: %s", e)
                         return True
                     
                     elif action == MotionEvent.ACTION_UP:
                         if not self.is_dragging:
                             # Click detected - launch ClipboardBridgeActivity
-                            print("[Bubble] Click!")
+                            log.debug("[Bubble] Click!")
                             self.bubble_ref._handle_click()
                         return True
                     
@@ -292,11 +286,11 @@ class FloatingBubble:
                     self_ref.window_manager.addView(self_ref.bubble_view, self_ref.bubble_params)
                     self_ref.is_showing = True
                     self_ref.last_error = ""
-                    print("[FloatingBubble] Bubble shown!")
+                    log.debug("[FloatingBubble] Bubble shown!")
                     
                 except Exception as e:
                     self_ref.last_error = str(e)
-                    print(f"[FloatingBubble] Show error: {e}")
+                    log.warning("[FloatingBubble] Show error: %s", e)
                     import traceback
                     traceback.print_exc()
             
@@ -305,7 +299,7 @@ class FloatingBubble:
             
         except Exception as e:
             self.last_error = str(e)
-            print(f"[FloatingBubble] Import error: {e}")
+            log.warning("[FloatingBubble] Import error: %s", e)
             return False
     
     def _handle_click(self):
@@ -345,9 +339,9 @@ class FloatingBubble:
                 activity.startActivity(intent)
                 activity.overridePendingTransition(0, 0)
                 launched = True
-                print(f"[Bubble] Launched ClipboardBridgeActivity")
+                log.debug("[Bubble] Launched ClipboardBridgeActivity")
             except Exception as e:
-                print(f"[Bubble] ClipboardBridgeActivity failed: {e}")
+                log.warning("[Bubble] ClipboardBridgeActivity failed: %s", e)
                 self.update_status("fallback")
                 
                 # Fallback: bring main Activity to front
@@ -361,15 +355,15 @@ class FloatingBubble:
                     
                     self.pending_clipboard_read = True
                     launched = True
-                    print("[Bubble] Fallback to main Activity")
+                    log.debug("[Bubble] Fallback to main Activity")
                 except Exception as e2:
-                    print(f"[Bubble] Fallback failed: {e2}")
+                    log.warning("[Bubble] Fallback failed: %s", e2)
             
             if not launched:
                 self.update_status("error")
                 
         except Exception as e:
-            print(f"[Bubble] Click handler error: {e}")
+            log.warning("[Bubble] Click handler error: %s", e)
             self.update_status("error")
     
     def update_status(self, status):
@@ -409,15 +403,15 @@ class FloatingBubble:
                         bg.setColor(AndroidColor.parseColor(color))
                         
                 except Exception as e:
-                    print(f"[Bubble] Update status error: {e}")
+                    log.warning("[Bubble] Update status error: %s", e)
             
             _update()
         except Exception as e:
-            print(f"[Bubble] Update import error: {e}")
+            log.warning("[Bubble] Update import error: %s", e)
     
     def show_translation(self, text):
         """Show translation in panel"""
-        print(f"[Bubble] show_translation: {len(text)} chars, is_showing: {self.is_showing}")
+        log.debug("[Bubble] show_translation: %s chars, is_showing: %s", len(text), self.is_showing)
         
         if platform != 'android' or not self.is_showing:
             show_toast(f"Result: {text[:60]}")
@@ -517,17 +511,17 @@ class FloatingBubble:
                     # Add to window
                     self_ref.window_manager.addView(self_ref.panel_view, self_ref.panel_params)
                     self_ref.is_expanded = True
-                    print("[Bubble] Panel shown!")
+                    log.debug("[Bubble] Panel shown!")
                     
                 except Exception as e:
-                    print(f"[Bubble] Show panel error: {e}")
+                    log.warning("[Bubble] Show panel error: %s", e)
                     import traceback
                     traceback.print_exc()
             
             _show_panel()
             
         except Exception as e:
-            print(f"[Bubble] show_translation error: {e}")
+            log.warning("[Bubble] show_translation error: %s", e)
             show_toast(f"Result: {text[:80]}")
     
     def hide(self):
@@ -559,8 +553,8 @@ class FloatingBubble:
                         self_ref.bubble_view = None
                         self_ref.is_showing = False
                 except Exception as e:
-                    print(f"[Bubble] Hide error: {e}")
+                    log.warning("[Bubble] Hide error: %s", e)
             
             _hide()
         except Exception as e:
-            print(f"[Bubble] Hide import error: {e}")
+            log.warning("[Bubble] Hide import error: %s", e)
@@ -0,0 +1,210 @@
+"""
+History Browser - virtualized list of past translations
+
+Only the rows on screen exist as widgets (RecycleView), pages are queried
+from the history store on demand, and full text is loaded only when an
+entry is opened.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.graphics import Color, Rectangle
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.textinput import TextInput
+
+from core.log import get_logger
+
+log = get_logger('history_view')
+
+
+PAGE_SIZE = 50
+PREVIEW_CHARS = 120
+SEARCH_DEBOUNCE = 0.3
+
+# All pages are queried on this one thread, so SQLiteHistory opens a single
+# reader connection for the browser however often it is opened or searched
+_queries = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-query")
+
+
+def _one_line(text):
+    return " ".join(text.split())
+
+
+class HistoryRow(RecycleDataViewBehavior, ButtonBehavior, BoxLayout):
+    """One recycled row: source and translation previews"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = (dp(8), dp(4))
+        self.entry_id = None
+        self.browser = None
+
+        self.source_label = Label(font_size=dp(13), color=(0.8, 0.8, 0.9, 1),
+                                  halign='left', valign='middle', shorten=True, shorten_from='right')
+        self.target_label = Label(font_size=dp(13), color=(0.8, 0.95, 0.8, 1),
+                                  halign='left', valign='middle', shorten=True, shorten_from='right')
+        for label in (self.source_label, self.target_label):
+            label.bind(size=self._update_text_size)
+            self.add_widget(label)
+
+        with self.canvas.before:
+            Color(0.18, 0.18, 0.22, 1)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_bg, size=self._update_bg)
+
+    def _update_text_size(self, label, size):
+        label.text_size = size
+
+    def _update_bg(self, *args):
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this recycled widget to another row of data"""
+        self.browser = rv.browser
+        self.entry_id = data['entry_id']
+        self.source_label.text = data['source_preview']
+        self.target_label.text = data['target_preview']
+        return super().refresh_view_attrs(rv, index, data)
+
+    def on_release(self):
+        if self.browser and self.entry_id is not None:
+            self.browser.open_entry(self.entry_id)
+
+
+class HistoryPopup(Popup):
+    """Searchable history list backed by app.history"""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(**kwargs)
+        self.app = app
+        self.title = "History"
+        self.size_hint = (0.95, 0.9)
+
+        self._query = ""
+        self._generation = 0
+        self._loading = False
+        self._exhausted = False
+
+        layout = BoxLayout(orientation='vertical', padding=dp(8), spacing=dp(8))
+
+        self.search_input = TextInput(
+            multiline=False,
+            size_hint_y=None,
+            height=dp(45),
+            hint_text="Search source or translation..."
+        )
+        self.search_input.bind(text=self._on_search_text)
+        layout.add_widget(self.search_input)
+
+        self.rv = RecycleView(do_scroll_x=False, bar_width=dp(6))
+        self.rv.browser = self
+        self.rv.viewclass = HistoryRow
+        rv_layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(60)),
+            default_size_hint=(1, None),
+            spacing=dp(4)
+        )
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        self.rv.add_widget(rv_layout)
+        self.rv.bind(scroll_y=self._on_scroll)
+        layout.add_widget(self.rv)
+
+        self.status_label = Label(size_hint_y=None, height=dp(20), font_size=dp(12), color=(0.7, 0.7, 0.7, 1))
+        layout.add_widget(self.status_label)
+
+        close_btn = Button(text="Close", size_hint_y=None, height=dp(45), background_color=(0.3, 0.3, 0.35, 1))
+        close_btn.bind(on_press=lambda instance: self.dismiss())
+        layout.add_widget(close_btn)
+
+        self.content = layout
+
+        # Debounced search: restarted on every keystroke
+        self._search_trigger = Clock.create_trigger(self._run_search, SEARCH_DEBOUNCE)
+        self._load_page(reset=True)
+
+    def _on_search_text(self, instance, value):
+        self._search_trigger.cancel()
+        self._search_trigger()
+
+    def _run_search(self, dt):
+        self._query = self.search_input.text
+        self._load_page(reset=True)
+
+    def _on_scroll(self, instance, scroll_y):
+        # scroll_y is 0 at the bottom; fetch the next page slightly before that
+        if scroll_y < 0.1 and not self._loading and not self._exhausted:
+            self._load_page()
+
+    def _load_page(self, reset=False):
+        """Query one page off the UI thread"""
+        if reset:
+            self._generation += 1
+            self._exhausted = False
+        generation = self._generation
+        offset = 0 if reset else len(self.rv.data)
+        query = self._query
+        history = self.app.history
+        self._loading = True
+        self.status_label.text = "Loading..."
+
+        def worker():
+            if generation != self._generation:
+                # Replaced by a newer search while waiting for the query thread
+                return
+            try:
+                entries = history.search(query, limit=PAGE_SIZE, offset=offset, preview_chars=PREVIEW_CHARS)
+            except Exception as e:
+                log.warning("[History] Query error: %s", e)
+                entries = []
+            rows = [{
+                'entry_id': e.id,
+                'source_preview': _one_line(e.source_text),
+                'target_preview': _one_line(e.target_text),
+            } for e in entries]
+            Clock.schedule_once(lambda dt: self._apply_page(generation, rows, reset), 0)
+
+        _queries.submit(worker)
+
+    def _apply_page(self, generation, rows, reset):
+        if generation != self._generation:
+            # A newer search replaced this one
+            return
+        self._loading = False
+        self._exhausted = len(rows) < PAGE_SIZE
+        if reset:
+            self.rv.data = rows
+            self.rv.scroll_y = 1
+        else:
+            self.rv.data.extend(rows)
+
+        count = len(self.rv.data)
+        if not count:
+            self.status_label.text = "No matches" if self._query.strip() else "No history yet"
+        else:
+            self.status_label.text = f"{count} shown" + ("" if self._exhausted else ", scroll for more")
+
+    def open_entry(self, entry_id):
+        """Load the full entry and show it in the main window"""
+        try:
+            entry = self.app.history.get(entry_id)
+        except Exception as e:
+            log.warning("[History] Load error: %s", e)
+            entry = None
+        if entry is None:
+            self.status_label.text = "Entry no longer available"
+            return
+        self.app.main_widget.show_history_entry(entry)
+        self.dismiss()
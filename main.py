@@ -2,27 +2,49 @@
 Zotero Translation Assistant
 """
 
+import threading
+import time
+
+# Process start as seen by the startup trace, taken before the Kivy imports
+STARTED_AT = time.perf_counter()
+
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.popup import Popup
-from kivy.uix.switch import Switch
-from kivy.uix.spinner import Spinner
 from kivy.clock import Clock
 from kivy.core.clipboard import Clipboard
 from kivy.core.window import Window
 from kivy.properties import StringProperty, BooleanProperty
 from kivy.utils import platform
-from kivy.storage.jsonstore import JsonStore
 from kivy.metrics import dp
 from kivy.graphics import Color, RoundedRectangle
 
-import threading
+from translator import TranslatorService, is_error_result
+from text_view import ScrollableLabel
+from core import (PRIORITY_HIGH, ClipboardTracker, Glossary, Settings, SQLiteHistory, Speculator,
+                  TranslationEngine, TranslationHistory, TranslationScheduler, UsageTracker)
+from core import log as logs
+from core.fonts import FontSelector
+from core.log import get_logger
+from core.segment import is_large, separator
+from core.startup import StartupTrace
 
-from translator import TranslatorService
+log = get_logger('app')
+
+
+# Most characters put into a text widget; larger texts show a preview
+MAX_WIDGET_CHARS = 20000
+
+# UI fonts: the bundled subset (assets/subset_font.py) first, then full fonts
+SUBSET_FONTS = [('assets/NotoSansSC-Subset.otf', 'assets/NotoSansSC-Subset.json')]
+FULL_FONTS = [
+    '/system/fonts/NotoSansCJK-Regular.ttc',
+    '/system/fonts/NotoSansSC-Regular.otf',
+    '/system/fonts/DroidSansFallback.ttf',
+    'assets/NotoSansSC-Regular.otf',
+]
 
 
 # Android utilities
@@ -125,10 +147,10 @@ class AndroidForegroundService:
             nm.notify(self.notification_id, notification)
             
             self.is_running = True
-            print("Foreground service started")
+            log.info("Foreground service started")
             
         except Exception as e:
-            print(f"Foreground service error: {e}")
+            log.warning("Foreground service error: %s", e)
     
     def stop(self):
         """Stop foreground service"""
@@ -148,10 +170,10 @@ class AndroidForegroundService:
             nm.cancel(self.notification_id)
             
             self.is_running = False
-            print("Foreground service stopped")
+            log.info("Foreground service stopped")
             
         except Exception as e:
-            print(f"Stop service error: {e}")
+            log.warning("Stop service error: %s", e)
     
     def update_notification(self, text):
         """Update notification text"""
@@ -193,7 +215,7 @@ class AndroidForegroundService:
             nm.notify(self.notification_id, notification)
             
         except Exception as e:
-            print(f"Update notification error: {e}")
+            log.warning("Update notification error: %s", e)
 
 
 # Floating Bubble implementation with translation panel
@@ -230,9 +252,17 @@ class FloatingBubble:
         # Background translation lock (avoid overlapping requests)
         self.is_translating = False
         
-        # Start polling for SharedPreferences results
-        if platform == 'android':
-            Clock.schedule_interval(self._poll_clipboard_result, 0.1)  # Check every 100ms
+        # Incremental panel text: Java-side appender, or deltas batched here per frame
+        self._appender = None
+        self._panel_text_view = None
+        self._panel_streaming = False   # a panel for the current text is open or being built
+        self._append_buffer = []
+        self._append_buffered = 0       # characters in _append_buffer
+        self._append_lock = threading.Lock()
+        self._flush_trigger = Clock.create_trigger(self._flush_appends)
+        
+        # SharedPreferences result polling, only while the bubble can be tapped
+        self._poll_event = None
 
     def _start_clipboard_waiter(self, request_id, timeout_s=3.0, poll_interval_s=0.05):
         """Wait for ClipboardBridgeActivity result without relying on Kivy Clock."""
@@ -266,7 +296,7 @@ class FloatingBubble:
                         return
 
                 except Exception as e:
-                    print(f"[FloatingBubble] Clipboard waiter error: {e}")
+                    log.warning("[FloatingBubble] Clipboard waiter error: %s", e)
 
                 time.sleep(poll_interval_s)
 
@@ -281,19 +311,28 @@ class FloatingBubble:
 
         self.update_status("step3")
 
-        print(f"[FloatingBubble] Got clipboard result for request {request_id}")
-        print(f"[FloatingBubble] Text length: {len(clip_text) if clip_text else 0}")
+        log.debug("[FloatingBubble] Got clipboard result for request %s", request_id)
+        log.debug("[FloatingBubble] Text length: %s", len(clip_text) if clip_text else 0)
 
         self.pending_request_id = None
         self.last_processed_request_id = request_id
 
         if clip_text and len(clip_text.strip()) > 0:
-            print("[FloatingBubble] Starting background translation...")
+            log.debug("[FloatingBubble] Starting background translation...")
             self._start_background_translation(clip_text)
         else:
             show_toast("Clipboard empty")
             self.update_status("error")
     
+    def _start_polling(self):
+        if self._poll_event is None:
+            self._poll_event = Clock.schedule_interval(self._poll_clipboard_result, 0.1)  # Check every 100ms
+
+    def _stop_polling(self):
+        if self._poll_event is not None:
+            self._poll_event.cancel()
+            self._poll_event = None
+
     def _poll_clipboard_result(self, dt):
         """Poll SharedPreferences for clipboard result from ClipboardBridgeActivity"""
         if not self.pending_request_id:
@@ -318,57 +357,81 @@ class FloatingBubble:
                 self._handle_clipboard_result(result_request_id, clip_text)
                     
         except Exception as e:
-            print(f"[FloatingBubble] Poll error: {e}")
+            log.warning("[FloatingBubble] Poll error: %s", e)
     
     def _start_background_translation(self, text):
-        """Start translation in background thread, update bubble when done"""
-        import threading
-
+        """Queue translation on the core scheduler, update bubble when done"""
         if self.is_translating:
             show_toast("Already translating...")
             return
 
+        app = App.get_running_app()
+        if not app or not hasattr(app, 'scheduler'):
+            log.debug("[FloatingBubble] No app or translator")
+            self._show_translation_error("Translator not initialized")
+            return
+
         self.is_translating = True
+        log.debug("[FloatingBubble] Translating...")
+        self.update_status("step4")
+        if app.speculator.claim(text):
+            log.debug("[FloatingBubble] Text was translated speculatively")
+        
+        if is_large(text):
+            self._start_large_translation(app, text)
+            return
         
-        def translate_thread():
+        def on_done(job):
+            # Runs on the scheduler worker thread
             try:
-                app = App.get_running_app()
-                if not app or not hasattr(app, 'translator'):
-                    print("[FloatingBubble] No app or translator")
-                    self._show_translation_error("Translator not initialized")
-                    return
-
-                print("[FloatingBubble] Translating...")
-                self.update_status("step4")
-                
-                # Do translation
-                result = app.translator.translate(text)
-                
-                if not result:
-                    print("[FloatingBubble] Translation returned empty")
-                    self._show_translation_error("Translation failed")
-                    return
-
-                if result.startswith("Error:") or result.startswith("Translation failed:"):
-                    self._show_translation_error(result)
+                result = job.result
+                if not result.ok:
+                    self._show_translation_error(result.text)
                     return
 
-                print(f"[FloatingBubble] Translation success: {result[:50]}...")
+                log.debug("[FloatingBubble] Translation success (%s): %.50s...", result.origin, result.text)
                 self.update_status("step5")
-                self._show_translation_result(result)
+                self._show_translation_result(result.text)
                     
             except Exception as e:
-                print(f"[FloatingBubble] Translation error: {e}")
+                log.warning("[FloatingBubble] Translation error: %s", e)
                 import traceback
                 traceback.print_exc()
                 self._show_translation_error(str(e))
             finally:
                 self.is_translating = False
         
-        # Start translation thread
-        thread = threading.Thread(target=translate_thread)
-        thread.daemon = True
-        thread.start()
+        app.scheduler.submit(text, source="bubble", on_done=on_done, priority=PRIORITY_HIGH)
+    
+    def _start_large_translation(self, app, text):
+        """Stream a large input segment by segment into the panel (first MAX_WIDGET_CHARS)"""
+        size = [0]
+        
+        def on_segment(stream, result):
+            if size[0] >= MAX_WIDGET_CHARS:
+                return
+            piece = (result.text if result.ok else f"[{result.text}]") + separator(result.source_text)
+            piece = piece[:MAX_WIDGET_CHARS - size[0]]
+            if size[0] == 0:
+                self.update_status("step5")
+                self.show_translation(piece)
+            else:
+                self.append_translation(piece)
+            size[0] += len(piece)
+        
+        def on_done(stream):
+            try:
+                if stream.segments and stream.failed == stream.segments:
+                    self._show_translation_error("All segments failed")
+                    return
+                log.debug("[FloatingBubble] Large translation done: %s segments, %s failed", stream.segments, stream.failed)
+                self.update_status("done")
+                vibrate(200)
+            finally:
+                self.is_translating = False
+        
+        app.scheduler.submit_stream(text, source="bubble", on_segment=on_segment, on_done=on_done,
+                                    priority=PRIORITY_HIGH)
     
     def _show_translation_result(self, result):
         """Show translation result in bubble panel (called on main thread)"""
@@ -388,7 +451,7 @@ class FloatingBubble:
                 except:
                     pass
         except Exception as e:
-            print(f"[FloatingBubble] Show result error: {e}")
+            log.warning("[FloatingBubble] Show result error: %s", e)
     
     def _show_translation_error(self, error):
         """Show translation error (called on main thread)"""
@@ -396,8 +459,17 @@ class FloatingBubble:
             self.update_status("error")
             show_toast(f"Error: {error[:50]}")
         except Exception as e:
-            print(f"[FloatingBubble] Show error error: {e}")
-    
+            log.warning("[FloatingBubble] Show error error: %s", e)
+
+    def on_settings(self, changes):
+        """Settings subscriber: show or hide as soon as the bubble is toggled"""
+        if changes['enable_bubble']:
+            self.show("ready")
+            show_toast("Floating bubble enabled")
+        else:
+            self.hide()
+            show_toast("Floating bubble disabled")
+
     def show(self, status="monitoring"):
         """Show floating bubble"""
         if platform != 'android':
@@ -406,6 +478,7 @@ class FloatingBubble:
         
         if self.is_showing:
             return True
+        self._start_polling()
         
         try:
             from jnius import autoclass, PythonJavaClass, java_method
@@ -456,9 +529,9 @@ class FloatingBubble:
                                         self.bubble_ref.window_manager.removeView(self.bubble_ref.panel_view)
                                         self.bubble_ref.panel_view = None
                                         self.bubble_ref.is_expanded = False
-                                        print("[FloatingBubble] Panel hidden on drag start")
+                                        log.debug("[FloatingBubble] Panel hidden on drag start")
                                     except Exception as e:
-                                        print(f"[FloatingBubble] Panel hide error: {e}")
+                                        log.warning("[FloatingBubble] Panel hide error: %s", e)
                         
                         if self.is_dragging:
                             try:
@@ -479,13 +552,13 @@ class FloatingBubble:
                                     self.bubble_ref.bubble_params
                                 )
                             except Exception as e:
-                                print(f"[FloatingBubble] Drag error: {e}")
+                                log.warning("[FloatingBubble] Drag error: %s", e)
                         return True
                     
                     elif action == MotionEvent.ACTION_UP:
                         if not self.is_dragging:
                             # This is a click - launch transparent ClipboardBridgeActivity
-                            print("[FloatingBubble] Click detected!")
+                            log.debug("[FloatingBubble] Click detected!")
                             self.bubble_ref.update_status("step1")
                             
                             try:
@@ -530,11 +603,11 @@ class FloatingBubble:
                                     except:
                                         pass
                                     launched = True
-                                    print(f"[FloatingBubble] Launched ClipboardBridgeActivity: {request_id}")
+                                    log.debug("[FloatingBubble] Launched ClipboardBridgeActivity: %s", request_id)
                                     self.bubble_ref._start_clipboard_waiter(request_id)
                                     vibrator.vibrate(100)
                                 except Exception as bridge_err:
-                                    print(f"[FloatingBubble] ClipboardBridgeActivity failed: {bridge_err}")
+                                    log.warning("[FloatingBubble] ClipboardBridgeActivity failed: %s", bridge_err)
                                     self.bubble_ref.update_status("fallback")
                                     
                                     # Fallback: bring main Activity to front
@@ -552,17 +625,17 @@ class FloatingBubble:
                                         # Set flag for main Activity to read clipboard on resume
                                         self.bubble_ref.pending_clipboard_read = True
                                         launched = True
-                                        print("[FloatingBubble] Fallback to main Activity")
+                                        log.debug("[FloatingBubble] Fallback to main Activity")
                                         vibrator.vibrate(150)
                                     except Exception as main_err:
-                                        print(f"[FloatingBubble] Main Activity fallback failed: {main_err}")
+                                        log.warning("[FloatingBubble] Main Activity fallback failed: %s", main_err)
                                 
                                 if not launched:
                                     self.bubble_ref.update_status("error")
                                     vibrator.vibrate(500)
                                     
                             except Exception as e:
-                                print(f"[FloatingBubble] Click handler error: {e}")
+                                log.warning("[FloatingBubble] Click handler error: %s", e)
                                 self.bubble_ref.update_status("error")
                         return True
                     
@@ -636,11 +709,11 @@ class FloatingBubble:
                     self_ref.window_manager.addView(self_ref.bubble_view, self_ref.bubble_params)
                     self_ref.is_showing = True
                     self_ref.last_error = ""
-                    print("[FloatingBubble] Bubble shown with touch support!")
+                    log.debug("[FloatingBubble] Bubble shown with touch support!")
                     
                 except Exception as e:
                     self_ref.last_error = str(e)
-                    print(f"[FloatingBubble] Show error: {e}")
+                    log.warning("[FloatingBubble] Show error: %s", e)
                     import traceback
                     traceback.print_exc()
             
@@ -649,13 +722,15 @@ class FloatingBubble:
             
         except Exception as e:
             self.last_error = str(e)
-            print(f"[FloatingBubble] Import error: {e}")
+            log.warning("[FloatingBubble] Import error: %s", e)
             return False
     
     def hide(self):
         """Hide floating bubble and panel"""
         if platform != 'android':
             return
+        self._detach_panel_text()
+        self._stop_polling()
         
         try:
             from android.runnable import run_on_ui_thread
@@ -673,29 +748,34 @@ class FloatingBubble:
                         self_ref.panel_view = None
                     self_ref.is_showing = False
                     self_ref.is_expanded = False
-                    print("[FloatingBubble] Hidden")
+                    log.debug("[FloatingBubble] Hidden")
                 except Exception as e:
-                    print(f"[FloatingBubble] Hide error: {e}")
+                    log.warning("[FloatingBubble] Hide error: %s", e)
             
             _hide()
             
         except Exception as e:
-            print(f"[FloatingBubble] Hide import error: {e}")
+            log.warning("[FloatingBubble] Hide import error: %s", e)
     
     def show_translation(self, text):
         """Show translation in expanded panel"""
-        print(f"[FloatingBubble] show_translation called, text length: {len(text) if text else 0}")
-        print(f"[FloatingBubble] is_showing: {self.is_showing}, platform: {platform}")
+        log.debug("[FloatingBubble] show_translation called, text length: %s", len(text) if text else 0)
+        log.debug("[FloatingBubble] is_showing: %s, platform: %s", self.is_showing, platform)
         
         if platform != 'android':
-            print("[FloatingBubble] Not Android, skipping")
+            log.debug("[FloatingBubble] Not Android, skipping")
             return
         
         if not self.is_showing:
-            print("[FloatingBubble] WARNING: Bubble not showing! Attempting to show via toast...")
+            log.warning("[FloatingBubble] WARNING: Bubble not showing! Attempting to show via toast...")
             show_toast(f"Result: {text[:50]}...")
             return
         
+        # Deltas appended from now on belong to the new panel
+        self._detach_panel_text()
+        with self._append_lock:
+            self._panel_streaming = True
+        
         try:
             from jnius import autoclass
             from android.runnable import run_on_ui_thread
@@ -706,7 +786,7 @@ class FloatingBubble:
             @run_on_ui_thread
             def _show_panel():
                 try:
-                    print("[FloatingBubble] _show_panel executing on UI thread...")
+                    log.debug("[FloatingBubble] _show_panel executing on UI thread...")
                     PythonActivity = autoclass('org.kivy.android.PythonActivity')
                     Context = autoclass('android.content.Context')
                     LayoutParams = autoclass('android.view.WindowManager$LayoutParams')
@@ -721,7 +801,7 @@ class FloatingBubble:
                     
                     activity = PythonActivity.mActivity
                     if not activity:
-                        print("[FloatingBubble] No activity!")
+                        log.warning("[FloatingBubble] No activity!")
                         return
                         
                     metrics = activity.getResources().getDisplayMetrics()
@@ -731,9 +811,9 @@ class FloatingBubble:
                     if self_ref.panel_view and self_ref.window_manager:
                         try:
                             self_ref.window_manager.removeView(self_ref.panel_view)
-                            print("[FloatingBubble] Old panel removed")
+                            log.debug("[FloatingBubble] Old panel removed")
                         except Exception as re:
-                            print(f"[FloatingBubble] Remove old panel error: {re}")
+                            log.warning("[FloatingBubble] Remove old panel error: %s", re)
                         finally:
                             self_ref.panel_view = None
                             self_ref.is_expanded = False
@@ -746,7 +826,7 @@ class FloatingBubble:
                     JavaString = autoclass('java.lang.String')
                     text_view = TextView(activity)
                     text_view.setText(JavaString(translation_text))
-                    print(f"[FloatingBubble] TextView created with text")
+                    log.debug("[FloatingBubble] TextView created with text")
                     text_view.setTextSize(TypedValue.COMPLEX_UNIT_SP, 14)
                     text_view.setTextColor(AndroidColor.parseColor("#FFFFFF"))
                     text_view.setPadding(int(12*density), int(12*density), int(12*density), int(12*density))
@@ -796,22 +876,122 @@ class FloatingBubble:
                     
                     self_ref.window_manager.addView(self_ref.panel_view, self_ref.panel_params)
                     self_ref.is_expanded = True
-                    print("[FloatingBubble] Panel shown!")
+                    self_ref._attach_panel_text(text_view)
+                    log.debug("[FloatingBubble] Panel shown!")
                     
                 except Exception as e:
-                    print(f"[FloatingBubble] Show panel error: {e}")
+                    log.warning("[FloatingBubble] Show panel error: %s", e)
                     import traceback
                     traceback.print_exc()
             
             _show_panel()
             
         except Exception as e:
-            print(f"[FloatingBubble] Panel import error: {e}")
+            log.warning("[FloatingBubble] Panel import error: %s", e)
+    
+    def _attach_panel_text(self, text_view):
+        """Route appends to the new panel's TextView (runs on the UI thread)"""
+        try:
+            from jnius import autoclass
+            PanelTextAppender = autoclass('org.zotero.zoterotranslator.PanelTextAppender')
+            appender = PanelTextAppender(text_view)
+        except Exception as e:
+            log.warning("[FloatingBubble] Java appender unavailable, batching in Python: %s", e)
+            appender = None
+        
+        # Deltas that arrived while the panel was being built
+        buffered = ""
+        with self._append_lock:
+            self._appender = appender
+            self._panel_text_view = text_view
+            if appender is not None:
+                buffered = "".join(self._append_buffer)
+                del self._append_buffer[:]
+                self._append_buffered = 0
+        if buffered:
+            appender.append(buffered)
+        elif appender is None:
+            self._flush_trigger()
+    
+    def _detach_panel_text(self):
+        with self._append_lock:
+            appender = self._appender
+            self._appender = None
+            self._panel_text_view = None
+            self._panel_streaming = False
+            del self._append_buffer[:]
+            self._append_buffered = 0
+        if appender is not None:
+            try:
+                appender.detach()
+            except Exception as e:
+                log.warning("[FloatingBubble] Appender detach error: %s", e)
+    
+    @property
+    def panel_streaming(self):
+        """A panel opened by show_translation is up (or being built) and takes appends"""
+        return self._panel_streaming
+    
+    def append_translation(self, delta):
+        """Add text to the open panel without resending what it already shows.
+        
+        The Java appender applies deltas with TextView.append at most once per
+        frame; without it, deltas are joined here and posted once per Kivy frame.
+        With no panel since the last show_translation the delta is dropped.
+        """
+        if platform != 'android' or not delta:
+            return
+        with self._append_lock:
+            streaming = self._panel_streaming
+            appender = self._appender
+            if streaming and appender is None:
+                # Held until the panel exists, or until the next flush; a panel
+                # shows at most MAX_WIDGET_CHARS, so more is never needed
+                if self._append_buffered < MAX_WIDGET_CHARS:
+                    self._append_buffer.append(delta)
+                    self._append_buffered += len(delta)
+                ready = self._panel_text_view is not None
+        if not streaming:
+            return
+        if appender is not None:
+            try:
+                appender.append(delta)
+            except Exception as e:
+                log.warning("[FloatingBubble] Append error: %s", e)
+        elif ready:
+            self._flush_trigger()
+    
+    def _flush_appends(self, dt):
+        """Python fallback: one run_on_ui_thread post for all deltas since the last frame"""
+        with self._append_lock:
+            text_view = self._panel_text_view
+            if text_view is None or not self._append_buffer:
+                return
+            pending = "".join(self._append_buffer)
+            del self._append_buffer[:]
+            self._append_buffered = 0
+        
+        try:
+            from jnius import autoclass
+            from android.runnable import run_on_ui_thread
+            JavaString = autoclass('java.lang.String')
+            
+            @run_on_ui_thread
+            def _append():
+                try:
+                    text_view.append(JavaString(pending))
+                except Exception as e:
+                    log.warning("[FloatingBubble] Panel append error: %s", e)
+            
+            _append()
+        except Exception as e:
+            log.warning("[FloatingBubble] Panel append import error: %s", e)
     
     def hide_panel(self):
         """Hide translation panel"""
         if platform != 'android' or not self.panel_view:
             return
+        self._detach_panel_text()
         
         try:
             from android.runnable import run_on_ui_thread
@@ -826,12 +1006,12 @@ class FloatingBubble:
                         self_ref.panel_view = None
                         self_ref.is_expanded = False
                 except Exception as e:
-                    print(f"[FloatingBubble] Hide panel error: {e}")
+                    log.warning("[FloatingBubble] Hide panel error: %s", e)
             
             _hide_panel()
             
         except Exception as e:
-            print(f"[FloatingBubble] Hide panel import error: {e}")
+            log.warning("[FloatingBubble] Hide panel import error: %s", e)
     
     def update_status(self, status):
         """Update bubble status with numbers for debugging"""
@@ -884,221 +1064,12 @@ class FloatingBubble:
                         self_ref.bubble_view.setText(JavaString("T"))
                         if bg: bg.setColor(AndroidColor.parseColor("#2196F3")) # Blue
                 except Exception as e:
-                    print(f"[FloatingBubble] Update error: {e}")
+                    log.warning("[FloatingBubble] Update error: %s", e)
             
             _update()
             
         except Exception as e:
-            print(f"[FloatingBubble] Update import error: {e}")
-
-
-class SettingsPopup(Popup):
-    """Settings popup"""
-    
-    def __init__(self, app, **kwargs):
-        super().__init__(**kwargs)
-        self.app = app
-        self.title = "Settings"
-        self.size_hint = (0.9, 0.85)
-        
-        layout = BoxLayout(orientation='vertical', padding=dp(15), spacing=dp(12))
-        
-        # API Key
-        api_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
-        api_section.add_widget(Label(text="API Key:", size_hint_y=None, height=dp(25)))
-        self.api_key_input = TextInput(
-            text=self.app.config_store.get('settings')['api_key'] if self.app.config_store.exists('settings') else '',
-            multiline=False,
-            password=True,
-            size_hint_y=None,
-            height=dp(45),
-            hint_text="Enter SiliconFlow API Key"
-        )
-        api_section.add_widget(self.api_key_input)
-        layout.add_widget(api_section)
-        
-        # API URL
-        url_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
-        url_section.add_widget(Label(text="API URL:", size_hint_y=None, height=dp(25)))
-        self.api_url_input = TextInput(
-            text=self.app.config_store.get('settings')['api_url'] if self.app.config_store.exists('settings') else 'https://api.siliconflow.cn',
-            multiline=False,
-            size_hint_y=None,
-            height=dp(45)
-        )
-        url_section.add_widget(self.api_url_input)
-        layout.add_widget(url_section)
-        
-        # Model
-        model_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
-        model_section.add_widget(Label(text="Model:", size_hint_y=None, height=dp(25)))
-        models = [
-            'Qwen/Qwen2.5-7B-Instruct',
-            'Qwen/Qwen2.5-14B-Instruct',
-            'Qwen/Qwen2.5-32B-Instruct',
-            'deepseek-ai/DeepSeek-V2.5',
-        ]
-        current_model = self.app.config_store.get('settings')['model'] if self.app.config_store.exists('settings') else models[0]
-        self.model_spinner = Spinner(
-            text=current_model,
-            values=models,
-            size_hint_y=None,
-            height=dp(45)
-        )
-        model_section.add_widget(self.model_spinner)
-        layout.add_widget(model_section)
-        
-        # Auto translate
-        auto_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
-        auto_section.add_widget(Label(text="Auto Monitor:", size_hint_x=0.7))
-        self.auto_switch = Switch(
-            active=self.app.config_store.get('settings').get('auto_translate', True) if self.app.config_store.exists('settings') else True,
-            size_hint_x=0.3
-        )
-        auto_section.add_widget(self.auto_switch)
-        layout.add_widget(auto_section)
-        
-        # Target language
-        lang_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
-        lang_section.add_widget(Label(text="Target:", size_hint_y=None, height=dp(25)))
-        languages = ['Chinese', 'English', 'Japanese']
-        current_lang = self.app.config_store.get('settings').get('target_lang', 'Chinese') if self.app.config_store.exists('settings') else 'Chinese'
-        self.lang_spinner = Spinner(
-            text=current_lang,
-            values=languages,
-            size_hint_y=None,
-            height=dp(45)
-        )
-        lang_section.add_widget(self.lang_spinner)
-        layout.add_widget(lang_section)
-        
-        # Floating bubble switch
-        bubble_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
-        bubble_section.add_widget(Label(text="Floating Bubble:", size_hint_x=0.7))
-        self.bubble_switch = Switch(
-            active=self.app.config_store.get('settings').get('enable_bubble', False) if self.app.config_store.exists('settings') else False,
-            size_hint_x=0.3
-        )
-        bubble_section.add_widget(self.bubble_switch)
-        layout.add_widget(bubble_section)
-        
-        # Request overlay permission button
-        perm_btn = Button(
-            text="Request Overlay Permission",
-            size_hint_y=None,
-            height=dp(45),
-            background_color=(0.5, 0.5, 0.6, 1)
-        )
-        perm_btn.bind(on_press=self.request_overlay_permission)
-        layout.add_widget(perm_btn)
-        
-        layout.add_widget(BoxLayout(size_hint_y=0.05))
-        
-        # Save button
-        save_btn = Button(
-            text="Save",
-            size_hint_y=None,
-            height=dp(50),
-            background_color=(0.2, 0.7, 0.3, 1)
-        )
-        save_btn.bind(on_press=self.save_settings)
-        layout.add_widget(save_btn)
-        
-        self.content = layout
-    
-    def request_overlay_permission(self, instance):
-        """Request overlay permission on Android"""
-        if platform != 'android':
-            show_toast("Only available on Android")
-            return
-        
-        try:
-            from jnius import autoclass
-            
-            VERSION = autoclass('android.os.Build$VERSION')
-            Settings = autoclass('android.provider.Settings')
-            Intent = autoclass('android.content.Intent')
-            Uri = autoclass('android.net.Uri')
-            PythonActivity = autoclass('org.kivy.android.PythonActivity')
-            
-            activity = PythonActivity.mActivity
-            pkg_name = activity.getPackageName()
-            
-            print(f"[Permission] Package: {pkg_name}")
-            print(f"[Permission] SDK: {VERSION.SDK_INT}")
-            
-            if VERSION.SDK_INT >= 23:
-                has_perm = Settings.canDrawOverlays(activity)
-                print(f"[Permission] Has overlay: {has_perm}")
-                
-                if not has_perm:
-                    # Create intent to open overlay settings
-                    uri = Uri.parse("package:" + pkg_name)
-                    intent = Intent(Settings.ACTION_MANAGE_OVERLAY_PERMISSION, uri)
-                    intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
-                    activity.startActivity(intent)
-                    show_toast("Opening permission settings...")
-                else:
-                    show_toast("Permission already granted!")
-                    # Try to show bubble immediately
-                    self.app.floating_bubble.show("ready")
-            else:
-                show_toast("No permission needed")
-                self.app.floating_bubble.show("ready")
-                
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            show_toast(f"Error: {str(e)[:50]}")
-    
-    def save_settings(self, instance):
-        settings = {
-            'api_key': self.api_key_input.text,
-            'api_url': self.api_url_input.text,
-            'model': self.model_spinner.text,
-            'auto_translate': self.auto_switch.active,
-            'target_lang': self.lang_spinner.text,
-            'enable_bubble': self.bubble_switch.active
-        }
-        self.app.config_store.put('settings', **settings)
-        self.app.update_translator_config()
-        
-        # Apply bubble setting immediately
-        if self.bubble_switch.active:
-            self.app.floating_bubble.show("ready")
-            show_toast("Floating bubble enabled")
-        else:
-            self.app.floating_bubble.hide()
-            show_toast("Floating bubble disabled")
-        
-        self.dismiss()
-
-
-class ScrollableLabel(ScrollView):
-    """Scrollable text display widget"""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.text_widget = TextInput(
-            multiline=True,
-            readonly=True,
-            background_color=(0.15, 0.18, 0.15, 1),
-            foreground_color=(0.9, 1.0, 0.9, 1),
-            hint_text="Translation appears here...",
-            size_hint_y=None
-        )
-        self.text_widget.bind(minimum_height=self.text_widget.setter('height'))
-        self.add_widget(self.text_widget)
-    
-    @property
-    def text(self):
-        return self.text_widget.text
-    
-    @text.setter
-    def text(self, value):
-        self.text_widget.text = value
-        # Scroll to top when new text is set
-        self.scroll_y = 1
+            log.warning("[FloatingBubble] Update import error: %s", e)
 
 
 class TranslatorWidget(BoxLayout):
@@ -1112,11 +1083,16 @@ class TranslatorWidget(BoxLayout):
         self.orientation = 'vertical'
         self.padding = dp(10)
         self.spacing = dp(8)
-        self.last_clipboard = ""
+        self.clip_tracker = ClipboardTracker()     # last clipboard by fingerprint, not by value
+        self._clip_manager = None   # Android ClipboardManager (False when unusable)
         self.is_translating = False  # Translation lock
-        
-        # Start bubble click checker (legacy fallback)
-        Clock.schedule_interval(self._check_bubble_click, 0.3)
+        self._job = None            # latest do_translate job and its callback
+        self._job_callback = None
+        self._pending_clip = None   # copied text waiting for the selection to settle
+        self._source_full = None    # full text behind a truncated source preview
+        self._source_preview = None
+        self._omitted = 0           # translated characters beyond MAX_WIDGET_CHARS
+        self._settle_event = None
         
         with self.canvas.before:
             Color(0.12, 0.12, 0.15, 1)
@@ -1136,20 +1112,24 @@ class TranslatorWidget(BoxLayout):
         title_bar.add_widget(Label(
             text="Zotero Translator",
             font_size=dp(18),
-            size_hint_x=0.4,
+            size_hint_x=0.32,
             color=(0.9, 0.85, 0.7, 1)
         ))
         
         # Test bubble button
-        bubble_btn = Button(text="Bubble", size_hint_x=0.2, background_color=(0.6, 0.4, 0.2, 1))
+        bubble_btn = Button(text="Bubble", size_hint_x=0.17, background_color=(0.6, 0.4, 0.2, 1))
         bubble_btn.bind(on_press=self.test_bubble)
         title_bar.add_widget(bubble_btn)
         
-        settings_btn = Button(text="Set", size_hint_x=0.2, background_color=(0.3, 0.3, 0.35, 1))
+        history_btn = Button(text="Hist", size_hint_x=0.17, background_color=(0.35, 0.35, 0.5, 1))
+        history_btn.bind(on_press=self.open_history)
+        title_bar.add_widget(history_btn)
+        
+        settings_btn = Button(text="Set", size_hint_x=0.17, background_color=(0.3, 0.3, 0.35, 1))
         settings_btn.bind(on_press=self.open_settings)
         title_bar.add_widget(settings_btn)
         
-        self.monitor_btn = Button(text="Start", size_hint_x=0.2, background_color=(0.2, 0.6, 0.3, 1))
+        self.monitor_btn = Button(text="Start", size_hint_x=0.17, background_color=(0.2, 0.6, 0.3, 1))
         self.monitor_btn.bind(on_press=self.toggle_monitoring)
         title_bar.add_widget(self.monitor_btn)
         
@@ -1210,6 +1190,8 @@ class TranslatorWidget(BoxLayout):
         
         # Use ScrollableLabel for translation output
         self.trans_output = ScrollableLabel()
+        self.trans_output.glyph_check = self.app.ensure_glyphs
+        self.trans_output.block_copy = self.copy_paragraph
         trans_section.add_widget(self.trans_output)
         self.add_widget(trans_section)
     
@@ -1217,6 +1199,10 @@ class TranslatorWidget(BoxLayout):
         """Scroll translation to top"""
         self.trans_output.scroll_y = 1
     
+    def start_bubble_checker(self):
+        """Start the bubble click checker (legacy fallback); deferred until after the first frame"""
+        Clock.schedule_interval(self._check_bubble_click, 0.3)
+    
     def _check_bubble_click(self, dt):
         """Check if bubble was clicked (legacy fallback, main logic now in on_resume)"""
         # Handle legacy click (fallback for direct clipboard access)
@@ -1225,7 +1211,7 @@ class TranslatorWidget(BoxLayout):
             pending_text = self.app.floating_bubble.pending_text
             self.app.floating_bubble.pending_text = None
             
-            print("[BubbleClick] Processing legacy click...")
+            log.debug("[BubbleClick] Processing legacy click...")
             
             if pending_text:
                 # Use the text captured on click
@@ -1238,7 +1224,7 @@ class TranslatorWidget(BoxLayout):
     
     def _do_bubble_translate_with_text(self, text):
         """Translate with provided text"""
-        print(f"[BubbleTranslate] With text: {text[:50]}...")
+        log.debug("[BubbleTranslate] With text: %.50s...", text)
         
         if self.is_translating:
             show_toast("Already translating...")
@@ -1250,11 +1236,11 @@ class TranslatorWidget(BoxLayout):
                 self.app.floating_bubble.hide_panel()
             
             # Store source text
-            self.source_input.text = text
-            self.last_clipboard = text
+            self._show_source(text)
+            self.clip_tracker.remember(text)
             
             # Translate (do_translate will update status to step4)
-            self.do_translate(text)
+            self.do_translate(text, source="bubble")
         else:
             show_toast("Text is empty")
             if platform == 'android':
@@ -1262,7 +1248,7 @@ class TranslatorWidget(BoxLayout):
     
     def _do_bubble_translate(self):
         """Try to read clipboard and translate"""
-        print("[BubbleTranslate] Trying to read clipboard...")
+        log.debug("[BubbleTranslate] Trying to read clipboard...")
         
         if self.is_translating:
             show_toast("Already translating...")
@@ -1274,9 +1260,9 @@ class TranslatorWidget(BoxLayout):
         try:
             current = Clipboard.paste()
             if current:
-                print(f"[BubbleTranslate] Got: {current[:50]}...")
+                log.debug("[BubbleTranslate] Got: %.50s...", current)
         except Exception as e:
-            print(f"[BubbleTranslate] Clipboard error: {e}")
+            log.warning("[BubbleTranslate] Clipboard error: %s", e)
         
         if current and len(current.strip()) > 0:
             self._do_bubble_translate_with_text(current)
@@ -1336,9 +1322,22 @@ class TranslatorWidget(BoxLayout):
             show_toast("Only works on Android")
     
     def open_settings(self, instance):
+        from settings_view import SettingsPopup
         popup = SettingsPopup(self.app)
         popup.open()
     
+    def open_history(self, instance):
+        from history_view import HistoryPopup
+        popup = HistoryPopup(self.app)
+        popup.open()
+    
+    def show_history_entry(self, entry):
+        """Show a past translation from the history browser"""
+        self._show_source(entry.source_text)
+        self.trans_output.text = entry.target_text
+        self.status_label.text = "Loaded from history"
+        self.status_label.color = (0.7, 0.7, 0.9, 1)
+    
     def toggle_monitoring(self, instance):
         self.is_monitoring = not self.is_monitoring
         if self.is_monitoring:
@@ -1364,6 +1363,9 @@ class TranslatorWidget(BoxLayout):
             self.status_label.color = (0.7, 0.7, 0.7, 1)
             if hasattr(self, 'clipboard_event'):
                 self.clipboard_event.cancel()
+            if self._settle_event:
+                self._settle_event.cancel()
+                self._settle_event = None
             
             # Stop foreground service
             self.app.foreground_service.stop()
@@ -1375,19 +1377,16 @@ class TranslatorWidget(BoxLayout):
             show_toast("Monitoring stopped")
     
     def check_clipboard(self, dt):
-        # Skip if already translating
-        if self.is_translating:
-            return
-        
+        # Keeps watching while translating: a newer copy replaces the request in flight
         try:
+            # Same clip timestamp: nothing was copied, don't even fetch the text
+            stamp = self._clip_stamp()
+            if not self.clip_tracker.stamp_changed(stamp):
+                return
             current = Clipboard.paste()
-            if current and current != self.last_clipboard and len(current.strip()) > 0:
-                # Check if content is different enough (not just whitespace changes)
-                if current.strip() == self.last_clipboard.strip():
-                    return
-                
-                self.last_clipboard = current
-                self.source_input.text = current
+            # Ignores repeats and whitespace-only changes; the stamp counts as seen only now
+            if self.clip_tracker.is_new(current, stamp):
+                self._show_source(current)
                 
                 # Notify user that new text was detected
                 self.status_label.text = "New text detected!"
@@ -1401,27 +1400,96 @@ class TranslatorWidget(BoxLayout):
                     self.app.floating_bubble.hide_panel()
                 self.app.floating_bubble.update_status("translating")
                 
-                if self.app.config_store.exists('settings'):
-                    if self.app.config_store.get('settings').get('auto_translate', True):
-                        self.do_translate(current)
+                # Wait until the clipboard stops changing: repeated copies while
+                # adjusting a selection only translate the final one
+                if self.app.settings.auto_translate:
+                    self._cancel_stale()
+                self._pending_clip = current
+                if self._settle_event:
+                    self._settle_event.cancel()
+                self._settle_event = Clock.schedule_once(self._on_clipboard_settled, self.app.settings.settle_delay)
         except:
             pass
     
+    def _clip_stamp(self):
+        """Timestamp of the current clip on Android 8+, None where unavailable"""
+        if platform != 'android' or self._clip_manager is False:
+            return None
+        try:
+            if self._clip_manager is None:
+                from jnius import autoclass
+                VERSION = autoclass('android.os.Build$VERSION')
+                if VERSION.SDK_INT < 26:
+                    self._clip_manager = False
+                    return None
+                PythonActivity = autoclass('org.kivy.android.PythonActivity')
+                Context = autoclass('android.content.Context')
+                self._clip_manager = PythonActivity.mActivity.getSystemService(Context.CLIPBOARD_SERVICE)
+            description = self._clip_manager.getPrimaryClipDescription()
+            return description.getTimestamp() if description is not None else None
+        except Exception as e:
+            log.warning("[Clipboard] Clip timestamp unavailable: %s", e)
+            self._clip_manager = False
+            return None
+    
+    def _on_clipboard_settled(self, dt):
+        """Clipboard unchanged for the settle window: translate the latest text"""
+        self._settle_event = None
+        text, self._pending_clip = self._pending_clip, None
+        if not text:
+            return
+        if self.app.settings.auto_translate:
+            self.do_translate(text)
+        else:
+            # Warm the result for a later bubble tap (no-op unless enabled)
+            self.app.speculator.offer(text)
+    
+    def _cancel_stale(self):
+        """Drop the request still in flight for text that has since been replaced"""
+        job, callback = self._job, self._job_callback
+        self._job = self._job_callback = None
+        self.is_translating = False
+        if job is not None and self.app.scheduler.cancel(job, callback):
+            log.debug("[do_translate] Withdrew stale request")
+    
+    def _show_source(self, text):
+        """Put text in the source box; beyond MAX_WIDGET_CHARS only a preview is laid out"""
+        self.app.ensure_glyphs(text[:MAX_WIDGET_CHARS])
+        if len(text) <= MAX_WIDGET_CHARS:
+            self._source_full = self._source_preview = None
+            self.source_input.text = text
+            return
+        self._source_full = text
+        self._source_preview = (text[:MAX_WIDGET_CHARS] +
+                                f"\n\n[... {len(text) - MAX_WIDGET_CHARS} more characters not shown]")
+        self.source_input.text = self._source_preview
+    
     def paste_text(self, instance):
         try:
             text = Clipboard.paste()
             if text:
-                self.source_input.text = text
+                self._show_source(text)
                 self.status_label.text = "Text pasted"
         except:
             pass
     
     def manual_translate(self, instance):
-        text = self.source_input.text.strip()
+        text = self.source_input.text
+        if self._source_full is not None and text == self._source_preview:
+            # Unedited preview: translate the whole text behind it
+            text = self._source_full
+        text = text.strip()
         if text:
-            self.do_translate(text)
+            self.do_translate(text, source="manual")
     
-    def do_translate(self, text):
+    def do_translate(self, text, source="monitor"):
+        # The latest request wins; an older one still running no longer updates the UI
+        self._cancel_stale()
+        
+        if is_large(text):
+            self._translate_large(text, source)
+            return
+        
         # Set translation lock
         self.is_translating = True
         
@@ -1433,40 +1501,98 @@ class TranslatorWidget(BoxLayout):
         self.status_label.text = "Translating, please wait..."
         self.status_label.color = (1.0, 0.8, 0.2, 1)
         
-        def translate_thread():
-            try:
-                print("[TranslateThread] Starting translation...")
-                # Use a separate status for API request if needed
-                result = self.app.translator.translate(text)
-                print(f"[TranslateThread] Got result: {result[:50]}...")
-                
-                # Success! Move to rendering phase
-                if platform == 'android':
-                    Clock.schedule_once(lambda dt: self.app.floating_bubble.update_status("step5"), 0)
-                
-                Clock.schedule_once(lambda dt: self.update_translation(result), 0)
-            except Exception as e:
-                print(f"[TranslateThread] Exception caught: {e}")
-                import traceback
-                traceback.print_exc()
-                if platform == 'android':
-                    Clock.schedule_once(lambda dt: self.app.floating_bubble.update_status("error"), 0)
-                Clock.schedule_once(lambda dt: self.update_translation(f"Error: {e}"), 0)
+        def on_done(job):
+            # Runs on the scheduler worker thread
+            result = job.result
+            log.debug("[TranslateThread] Got result (%s): %.50s...", result.origin, result.text)
+            
+            # Move to rendering phase
+            if platform == 'android':
+                Clock.schedule_once(lambda dt: self.app.floating_bubble.update_status("step5"), 0)
+            
+            note = None
+            if result.origin == 'fuzzy':
+                note = f"Reused similar text ({result.similarity:.0%}) - Translate for fresh"
+            elif result.origin == 'skipped':
+                note = f"Not sent ({result.detail}) - Translate to force"
+            elif result.missing_terms:
+                note = "Glossary not followed: " + ", ".join(source for source, _ in result.missing_terms)
+            
+            def show(dt):
+                if job is self._job:
+                    self._job = self._job_callback = None
+                    self.update_translation(result.text, note)
+            
+            Clock.schedule_once(show, 0)
+        
+        self.app.speculator.claim(text)
+        self._job = self.app.scheduler.submit(text, source=source, on_done=on_done, priority=PRIORITY_HIGH)
+        self._job_callback = on_done
+        log.debug("[do_translate] Job submitted")
+    
+    def _translate_large(self, text, source):
+        """Stream a large input through the translator, showing segments as they arrive"""
+        self.is_translating = True
+        if platform == 'android':
+            self.app.floating_bubble.update_status("step4")
         
-        thread = threading.Thread(target=translate_thread)
-        thread.daemon = True
-        thread.start()
-        print("[do_translate] Thread started")
+        self.trans_output.text = ""
+        self._omitted = 0
+        self.status_label.text = f"Large text ({len(text)} chars), translating in segments..."
+        self.status_label.color = (1.0, 0.8, 0.2, 1)
+        
+        def on_segment(stream, result):
+            # Runs on the stream's helper thread
+            piece = (result.text if result.ok else f"[{result.text}]") + separator(result.source_text)
+            Clock.schedule_once(lambda dt: self._append_segment(stream, piece), 0)
+        
+        def on_done(stream):
+            Clock.schedule_once(lambda dt: self._finish_large(stream), 0)
+        
+        self._job = self.app.scheduler.submit_stream(text, source=source, on_segment=on_segment,
+                                                     on_done=on_done, priority=PRIORITY_HIGH)
+        self._job_callback = None
+    
+    def _append_segment(self, stream, piece):
+        if stream is not self._job:
+            return
+        shown = len(self.trans_output.text)
+        if shown < MAX_WIDGET_CHARS:
+            visible = piece[:MAX_WIDGET_CHARS - shown]
+            self.trans_output.append(visible)
+            # The panel receives only the new text, not the whole translation again
+            bubble = self.app.floating_bubble
+            if bubble.is_showing:
+                if shown == 0 or not bubble.panel_streaming:
+                    # A panel opened mid-stream starts with everything so far
+                    bubble.show_translation(self.trans_output.text)
+                else:
+                    bubble.append_translation(visible)
+        self._omitted += max(0, len(piece) - max(0, MAX_WIDGET_CHARS - shown))
+        self.status_label.text = f"Translated {stream.segments} segments..."
     
-    def update_translation(self, result):
+    def _finish_large(self, stream):
+        if stream is not self._job:
+            return
+        self._job = None
+        if self._omitted:
+            self.trans_output.append(f"\n\n[... {self._omitted} more characters, see History]")
+        note = f"{stream.failed} of {stream.segments} segments failed" if stream.failed else None
+        if platform == 'android':
+            self.app.floating_bubble.update_status("step5")
+        self.update_translation(self.trans_output.text, note, streamed=True)
+    
+    def update_translation(self, result, note=None, streamed=False):
+        """Show a finished translation; streamed results are already on screen"""
         # Clear translation lock
         self.is_translating = False
         
-        print(f"[UpdateTranslation] Result: {result[:100]}...")
-        self.trans_output.text = result
+        log.debug("[UpdateTranslation] Result: %.100s...", result)
+        if not streamed:
+            self.trans_output.text = result
         
         # Check if result is an error message
-        is_error = result.startswith("Error:") or result.startswith("Translation failed:")
+        is_error = is_error_result(result)
         
         # Notify user that translation is complete
         vibrate(100)
@@ -1482,20 +1608,21 @@ class TranslatorWidget(BoxLayout):
             else:
                 self.app.floating_bubble.update_status("done")
                 try:
-                    print("[UpdateTranslation] Calling show_translation...")
-                    self.app.floating_bubble.show_translation(result)
+                    if not streamed:
+                        log.debug("[UpdateTranslation] Calling show_translation...")
+                        self.app.floating_bubble.show_translation(result)
                     show_toast("Translation ready!")
-                    print("[UpdateTranslation] show_translation succeeded")
+                    log.debug("[UpdateTranslation] show_translation succeeded")
                 except Exception as e:
-                    print(f"[UpdateTranslation] show_translation error: {e}")
+                    log.warning("[UpdateTranslation] show_translation error: %s", e)
                     import traceback
                     traceback.print_exc()
                     self.app.floating_bubble.update_status("error")
                     # Fallback: display result via long toast
                     show_toast(f"Result: {result[:100]}")
-                    print(f"[UpdateTranslation] Fallback toast shown")
+                    log.debug("[UpdateTranslation] Fallback toast shown")
         else:
-            print("[UpdateTranslation] Bubble not showing, using toast")
+            log.debug("[UpdateTranslation] Bubble not showing, using toast")
             show_toast(f"Done: {result[:50]}")
         
         if self.is_monitoring:
@@ -1504,11 +1631,14 @@ class TranslatorWidget(BoxLayout):
         else:
             self.status_label.text = "Translation complete"
             self.status_label.color = (0.3, 0.9, 0.3, 1)
+        if note:
+            self.status_label.text = note
+            self.status_label.color = (1.0, 0.8, 0.2, 1)
         
         # If we're in fallback mode, go back to background after showing result
         if hasattr(self.app, 'fallback_mode_active') and self.app.fallback_mode_active:
             self.app.fallback_mode_active = False
-            print("[UpdateTranslation] Fallback mode: going to background after delay")
+            log.debug("[UpdateTranslation] Fallback mode: going to background after delay")
             # Wait a bit for panel to show before going to background
             Clock.schedule_once(lambda dt: self.app._go_to_background_now(), 1.0)
     
@@ -1522,6 +1652,16 @@ class TranslatorWidget(BoxLayout):
                 show_toast("Copied!")
         except:
             pass
+    
+    def copy_paragraph(self, text):
+        """Double-tapped paragraph of the translation"""
+        try:
+            Clipboard.copy(text)
+            self.status_label.text = "Paragraph copied"
+            vibrate(30)
+            show_toast("Paragraph copied!")
+        except:
+            pass
 
 
 class ZoteroTranslatorApp(App):
@@ -1529,61 +1669,170 @@ class ZoteroTranslatorApp(App):
     
     def build(self):
         self.title = "Zotero Translator"
-        
-        # Setup Chinese font for Android
-        self._setup_font()
-        
-        self.config_store = JsonStore('translator_config.json')
+        # Only what the first frame needs runs here; the rest waits for on_first_frame
+        self.startup = StartupTrace(STARTED_AT)
+        measure = self.startup.measure
+        
+        # A font picked on an earlier launch is registered now; probing waits for the first frame
+        self.fonts = FontSelector(SUBSET_FONTS, FULL_FONTS, 'font_cache.json')
+        font = measure("font cache", self.fonts.cached)
+        if font:
+            self._register_font(font)
+        
+        self.settings = measure("settings", Settings, 'translator_config.json')
+        logs.setup('translator.log', debug=self.settings.debug_logging)
         self.translator = TranslatorService()
-        self.update_translator_config()
+        self.history = measure("history", self._open_history)
+        self.usage = UsageTracker('usage_stats.json')
+        self.engine = TranslationEngine(self.translator, history=self.history,
+                                        glossary=measure("glossary", self._load_glossary), usage=self.usage)
+        self.scheduler = TranslationScheduler(self.engine)
+        self.speculator = Speculator(self.scheduler, self.usage)
+        self.settings.subscribe(self.translator.apply_settings, keys=TranslatorService.SETTINGS_KEYS, replay=True)
+        self.settings.subscribe(self.update_translator_config, replay=True)
         self.floating_bubble = FloatingBubble()
-        self.foreground_service = AndroidForegroundService()
+        self.settings.subscribe(self.floating_bubble.on_settings, keys=('enable_bubble',))
+        self._foreground_service = None
         
         if platform not in ('android', 'ios'):
             Window.size = (400, 700)
         
-        self.main_widget = TranslatorWidget(self)
+        self.main_widget = measure("main window", TranslatorWidget, self)
         return self.main_widget
     
+    @property
+    def foreground_service(self):
+        """Created when monitoring first starts"""
+        if self._foreground_service is None:
+            self._foreground_service = AndroidForegroundService()
+        return self._foreground_service
+    
+    def on_start(self):
+        Window.bind(on_flip=self.on_first_frame)
+    
+    def on_first_frame(self, *args):
+        """The window has been drawn once; start the work deferred from build()"""
+        Window.unbind(on_flip=self.on_first_frame)
+        self.startup.frame_drawn()
+        threading.Thread(target=self._warm_network, daemon=True).start()
+        self._deferred = [
+            ("font", self._setup_font),
+            ("bubble checker", self.main_widget.start_bubble_checker),
+            ("fuzzy warm-up", self._warm_fuzzy),
+        ]
+        Clock.schedule_once(self._run_deferred, 0)
+    
+    def _run_deferred(self, dt):
+        """One deferred step per frame, so the window stays responsive"""
+        name, func = self._deferred.pop(0)
+        try:
+            self.startup.measure(name, func, deferred=True)
+        except Exception as e:
+            log.warning("[Startup] %s failed: %s", name, e)
+        if self._deferred:
+            Clock.schedule_once(self._run_deferred, 0)
+        else:
+            for line in self.startup.report():
+                log.info("[Startup] %s", line)
+    
+    def _warm_network(self):
+        try:
+            self.startup.measure("network warm-up", self.translator.warm_up, deferred=True)
+        except Exception as e:
+            log.debug("[Startup] Network warm-up skipped: %s", e)
+    
+    def _open_history(self):
+        """Persistent translation history, in-memory if SQLite is unavailable"""
+        try:
+            return SQLiteHistory('translation_history.db')
+        except Exception as e:
+            log.warning("History store unavailable, using memory: %s", e)
+            return TranslationHistory()
+    
+    def _load_glossary(self):
+        """Terminology from glossary.tsv (source<TAB>target per line), if present"""
+        try:
+            glossary = Glossary.load('glossary.tsv')
+            if glossary:
+                log.info("Glossary loaded: %s terms", len(glossary))
+            return glossary
+        except Exception as e:
+            log.warning("Glossary unavailable: %s", e)
+            return Glossary()
+    
     def _setup_font(self):
-        """Setup Chinese font"""
+        """Setup Chinese font when none was cached (after the first frame, whose text is all Latin)"""
+        if self.fonts.resolved:
+            return
+        font = self.fonts.select()
+        if font and self._register_font(font):
+            self._refresh_fonts()
+    
+    def _register_font(self, path):
         try:
             from kivy.core.text import LabelBase
-            import os
-            
-            # Android system fonts
-            font_paths = [
-                '/system/fonts/NotoSansCJK-Regular.ttc',
-                '/system/fonts/NotoSansSC-Regular.otf',
-                '/system/fonts/DroidSansFallback.ttf',
-            ]
-            
-            for font_path in font_paths:
-                try:
-                    if os.path.exists(font_path):
-                        LabelBase.register(name='Roboto', fn_regular=font_path)
-                        print(f"Font registered: {font_path}")
-                        return
-                except:
-                    continue
+            LabelBase.register(name='Roboto', fn_regular=path)
+            log.info("Font registered: %s", path)
+            return True
         except Exception as e:
-            print(f"Font setup skipped: {e}")
-    
-    def update_translator_config(self):
-        if self.config_store.exists('settings'):
-            settings = self.config_store.get('settings')
-            self.translator.set_config(
-                api_key=settings.get('api_key', ''),
-                api_url=settings.get('api_url', 'https://api.siliconflow.cn'),
-                model=settings.get('model', 'Qwen/Qwen2.5-7B-Instruct'),
-                target_lang=settings.get('target_lang', 'Chinese')
-            )
+            log.warning("Font %s unavailable: %s", path, e)
+            return False
+    
+    def ensure_glyphs(self, text):
+        """Switch from the subset font to a full one the first time text needs it"""
+        if not self.fonts.is_subset:
+            return
+        missing = self.fonts.missing(text)
+        if missing:
+            font = self.fonts.fall_back()
+            if font and self._register_font(font):
+                log.info("[Font] %s characters outside the subset, switched to full font", len(missing))
+                self._refresh_fonts()
+    
+    def _refresh_fonts(self):
+        """Re-render text already on screen with the newly registered font"""
+        for widget in self.root.walk():
+            if hasattr(widget, 'font_name'):
+                widget.property('font_name').dispatch(widget)
+    
+    def update_translator_config(self, changes):
+        """Settings subscriber for the engine side; the translator subscribes itself"""
+        scope = getattr(self, '_fuzzy_scope', None)
+        if 'fuzzy_threshold' in changes:
+            self.engine.fuzzy.threshold = changes['fuzzy_threshold']
+        if 'keep_paragraphs' in changes:
+            self.engine.keep_paragraphs = changes['keep_paragraphs']
+        if 'speculative' in changes:
+            self.speculator.enabled = changes['speculative']
+        if 'debug_logging' in changes:
+            logs.set_debug(changes['debug_logging'])
+        # The first warm-up is deferred until after the first frame
+        if scope is not None and self.translator.config_scope() != scope:
+            self._warm_fuzzy()
+    
+    def _warm_fuzzy(self):
+        """Fill the fuzzy index from recent history for the current model/language"""
+        self._fuzzy_scope = self.translator.config_scope()
+        
+        def worker():
+            try:
+                count = self.engine.warm_fuzzy(self.history.recent(limit=5000))
+                log.debug("[Fuzzy] Loaded %s past translations", count)
+            except Exception as e:
+                log.warning("[Fuzzy] Warm-up error: %s", e)
+        
+        threading.Thread(target=worker, daemon=True).start()
     
     def is_bubble_enabled(self):
         """Check if floating bubble is enabled in settings"""
-        if self.config_store.exists('settings'):
-            return self.config_store.get('settings').get('enable_bubble', False)
-        return False
+        return self.settings.enable_bubble
+    
+    def on_stop(self):
+        """Flush pending settings, history writes, usage totals and queued log records"""
+        self.settings.close()
+        self.history.close()
+        self.usage.close()
+        logs.shutdown()
     
     def on_pause(self):
         """App going to background - keep monitoring"""
@@ -1591,18 +1840,31 @@ class ZoteroTranslatorApp(App):
     
     def on_resume(self):
         """App coming back to foreground"""
-        print("[App] on_resume called")
+        log.debug("[App] on_resume called")
         
         # Check if we need to read clipboard (fallback from bubble click when ClipboardBridgeActivity fails)
         if hasattr(self.floating_bubble, 'pending_clipboard_read') and self.floating_bubble.pending_clipboard_read:
             self.floating_bubble.pending_clipboard_read = False
-            print("[App] Fallback clipboard read requested")
+            log.debug("[App] Fallback clipboard read requested")
             Clock.schedule_once(self._read_clipboard_and_translate, 0.3)
+        elif self.speculator.enabled:
+            # The clipboard is readable while in the foreground
+            Clock.schedule_once(self._speculate_clipboard, 0.3)
+    
+    def _speculate_clipboard(self, dt):
+        """Start translating the clipboard now in case the bubble is tapped later"""
+        try:
+            text = Clipboard.paste()
+        except Exception as e:
+            log.warning("[App] Speculative clipboard read error: %s", e)
+            return
+        if self.speculator.offer(text):
+            log.debug("[App] Speculative translation started")
     
     def _read_clipboard_and_translate(self, dt):
         """Read clipboard after gaining focus, go back immediately, translate in background"""
-        print("[App] Reading clipboard with focus...")
-        print(f"[App] Bubble is_showing: {self.floating_bubble.is_showing}")
+        log.debug("[App] Reading clipboard with focus...")
+        log.debug("[App] Bubble is_showing: %s", self.floating_bubble.is_showing)
         
         # Show fallback progress
         self.floating_bubble.update_status("fallback")
@@ -1631,12 +1893,12 @@ class ZoteroTranslatorApp(App):
                         text = item.coerceToText(activity)
                         if text:
                             clipboard_text = str(text)
-                            print(f"[App] Got clipboard: {clipboard_text[:50]}...")
+                            log.debug("[App] Got clipboard: %.50s...", clipboard_text)
                             # Vibrate longer to indicate success
                             vibrator.vibrate(100)
                         
             except Exception as e:
-                print(f"[App] Android clipboard error: {e}")
+                log.warning("[App] Android clipboard error: %s", e)
                 import traceback
                 traceback.print_exc()
         
@@ -1644,9 +1906,9 @@ class ZoteroTranslatorApp(App):
         if not clipboard_text:
             try:
                 clipboard_text = Clipboard.paste()
-                print(f"[App] Kivy clipboard: {clipboard_text[:50] if clipboard_text else 'empty'}...")
+                log.debug("[App] Kivy clipboard: %.50s...", clipboard_text or 'empty')
             except Exception as e:
-                print(f"[App] Kivy clipboard error: {e}")
+                log.warning("[App] Kivy clipboard error: %s", e)
         
         if clipboard_text and len(clipboard_text.strip()) > 0:
             # Got text! Go back immediately, then translate in background and show via bubble overlay.
@@ -1675,7 +1937,7 @@ class ZoteroTranslatorApp(App):
     
     def _go_to_background_now(self):
         """Go back to home/previous app immediately with no animation"""
-        print("[App] Going to background immediately...")
+        log.debug("[App] Going to background immediately...")
         if platform == 'android':
             try:
                 from jnius import autoclass
@@ -1690,11 +1952,11 @@ class ZoteroTranslatorApp(App):
                 try:
                     activity.overridePendingTransition(0, 0)
                 except Exception as anim_err:
-                    print(f"[App] Could not disable animation: {anim_err}")
+                    log.warning("[App] Could not disable animation: %s", anim_err)
                 
-                print("[App] Moved to background")
+                log.debug("[App] Moved to background")
             except Exception as e:
-                print(f"[App] Go background error: {e}")
+                log.warning("[App] Go background error: %s", e)
 
 
 if __name__ == '__main__':
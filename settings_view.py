@@ -0,0 +1,288 @@
+"""
+Settings View - the settings popup
+
+Imported when the popup is first opened, so the switch and spinner
+widget modules are not loaded on the way to the first frame.
+"""
+
+import time
+
+from kivy.metrics import dp
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.spinner import Spinner
+from kivy.uix.switch import Switch
+from kivy.uix.textinput import TextInput
+from kivy.utils import platform
+
+from android_utils import show_toast
+from core.log import get_logger
+
+log = get_logger('settings_view')
+
+
+class SettingsPopup(Popup):
+    """Settings popup"""
+    
+    def __init__(self, app, **kwargs):
+        super().__init__(**kwargs)
+        self.app = app
+        self.title = "Settings"
+        self.size_hint = (0.9, 0.85)
+        
+        layout = BoxLayout(orientation='vertical', padding=dp(15), spacing=dp(12))
+        
+        # API Key
+        api_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
+        api_section.add_widget(Label(text="API Key:", size_hint_y=None, height=dp(25)))
+        self.api_key_input = TextInput(
+            text=self.app.settings.api_key,
+            multiline=False,
+            password=True,
+            size_hint_y=None,
+            height=dp(45),
+            hint_text="Enter SiliconFlow API Key"
+        )
+        api_section.add_widget(self.api_key_input)
+        layout.add_widget(api_section)
+        
+        # API URL
+        url_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
+        url_section.add_widget(Label(text="API URL:", size_hint_y=None, height=dp(25)))
+        self.api_url_input = TextInput(
+            text=self.app.settings.api_url,
+            multiline=False,
+            size_hint_y=None,
+            height=dp(45)
+        )
+        url_section.add_widget(self.api_url_input)
+        layout.add_widget(url_section)
+        
+        # Model
+        model_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
+        model_section.add_widget(Label(text="Model:", size_hint_y=None, height=dp(25)))
+        models = [
+            'Qwen/Qwen2.5-7B-Instruct',
+            'Qwen/Qwen2.5-14B-Instruct',
+            'Qwen/Qwen2.5-32B-Instruct',
+            'deepseek-ai/DeepSeek-V2.5',
+        ]
+        current_model = self.app.settings.model
+        self.model_spinner = Spinner(
+            text=current_model,
+            values=models,
+            size_hint_y=None,
+            height=dp(45)
+        )
+        model_section.add_widget(self.model_spinner)
+        layout.add_widget(model_section)
+        
+        # Auto translate
+        auto_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        auto_section.add_widget(Label(text="Auto Monitor:", size_hint_x=0.7))
+        self.auto_switch = Switch(
+            active=self.app.settings.auto_translate,
+            size_hint_x=0.3
+        )
+        auto_section.add_widget(self.auto_switch)
+        layout.add_widget(auto_section)
+        
+        # Speculative: with auto monitor off, translate copied text before the bubble tap
+        spec_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        spec_section.add_widget(Label(text="Pre-translate Copies:", size_hint_x=0.7))
+        self.spec_switch = Switch(
+            active=self.app.settings.speculative,
+            size_hint_x=0.3
+        )
+        spec_section.add_widget(self.spec_switch)
+        layout.add_widget(spec_section)
+        
+        # Keep paragraph breaks when cleaning up PDF line breaks
+        para_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        para_section.add_widget(Label(text="Keep Paragraphs:", size_hint_x=0.7))
+        self.para_switch = Switch(
+            active=self.app.settings.keep_paragraphs,
+            size_hint_x=0.3
+        )
+        para_section.add_widget(self.para_switch)
+        layout.add_widget(para_section)
+        
+        # Deterministic sampling: same text, same translation
+        det_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        det_section.add_widget(Label(text="Deterministic:", size_hint_x=0.7))
+        self.det_switch = Switch(
+            active=self.app.settings.deterministic,
+            size_hint_x=0.3
+        )
+        det_section.add_widget(self.det_switch)
+        layout.add_widget(det_section)
+        
+        # Target language
+        lang_section = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(80))
+        lang_section.add_widget(Label(text="Target:", size_hint_y=None, height=dp(25)))
+        languages = ['Chinese', 'English', 'Japanese']
+        current_lang = self.app.settings.target_lang
+        self.lang_spinner = Spinner(
+            text=current_lang,
+            values=languages,
+            size_hint_y=None,
+            height=dp(45)
+        )
+        lang_section.add_widget(self.lang_spinner)
+        layout.add_widget(lang_section)
+        
+        # Fuzzy translation memory: reuse translations of near-identical text
+        fuzzy_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        fuzzy_section.add_widget(Label(text="Reuse Similar:", size_hint_x=0.6))
+        current_fuzzy = self.app.settings.fuzzy_threshold
+        self.fuzzy_spinner = Spinner(
+            text=f"{current_fuzzy:.0%}" if current_fuzzy else 'Off',
+            values=['Off', '85%', '90%', '95%'],
+            size_hint_x=0.4
+        )
+        fuzzy_section.add_widget(self.fuzzy_spinner)
+        layout.add_widget(fuzzy_section)
+        
+        # Settle window: wait for repeated copies (adjusting a selection) to stop
+        settle_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        settle_section.add_widget(Label(text="Wait After Copy:", size_hint_x=0.6))
+        current_settle = self.app.settings.settle_delay
+        self.settle_spinner = Spinner(
+            text=f"{current_settle:g}s" if current_settle else 'Off',
+            values=['Off', '0.5s', '1s', '2s'],
+            size_hint_x=0.4
+        )
+        settle_section.add_widget(self.settle_spinner)
+        layout.add_widget(settle_section)
+        
+        # Floating bubble switch
+        bubble_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        bubble_section.add_widget(Label(text="Floating Bubble:", size_hint_x=0.7))
+        self.bubble_switch = Switch(
+            active=self.app.settings.enable_bubble,
+            size_hint_x=0.3
+        )
+        bubble_section.add_widget(self.bubble_switch)
+        layout.add_widget(bubble_section)
+        
+        # Debug logging: verbose records to the ring buffer and translator.log
+        debug_section = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        debug_section.add_widget(Label(text="Debug Log:", size_hint_x=0.7))
+        self.debug_switch = Switch(
+            active=self.app.settings.debug_logging,
+            size_hint_x=0.3
+        )
+        debug_section.add_widget(self.debug_switch)
+        layout.add_widget(debug_section)
+        
+        # Request overlay permission button
+        perm_btn = Button(
+            text="Request Overlay Permission",
+            size_hint_y=None,
+            height=dp(45),
+            background_color=(0.5, 0.5, 0.6, 1)
+        )
+        perm_btn.bind(on_press=self.request_overlay_permission)
+        layout.add_widget(perm_btn)
+        
+        layout.add_widget(BoxLayout(size_hint_y=0.05))
+        
+        # Token usage: today by source, plus all-time totals
+        today = self.app.usage.today()
+        by_source = self.app.usage.breakdown('source', day=time.strftime('%Y-%m-%d'))
+        total = self.app.usage.totals()
+        usage_lines = [
+            f"Today: {today['prompt_tokens']} in ({today['cached_tokens']} cached) / "
+            f"{today['completion_tokens']} out tokens, {today['requests']} requests",
+            "  " + ", ".join(f"{source or 'other'} {sums['prompt_tokens'] + sums['completion_tokens']}"
+                             for source, sums in sorted(by_source.items())) if by_source else "  No requests today",
+            f"All time: {total['prompt_tokens'] + total['completion_tokens']} tokens, {total['requests']} requests",
+            f"API calls skipped locally: {self.app.engine.calls_skipped}",
+            f"Pre-translated: {self.app.speculator.claimed} used, {self.app.speculator.wasted} unused"
+            + (" (paused)" if self.app.speculator.enabled and self.app.speculator.paused else ""),
+        ]
+        layout.add_widget(Label(
+            text="\n".join(usage_lines),
+            size_hint_y=None,
+            height=dp(85),
+            font_size=dp(12),
+            color=(0.7, 0.7, 0.7, 1)
+        ))
+        
+        # Save button
+        save_btn = Button(
+            text="Save",
+            size_hint_y=None,
+            height=dp(50),
+            background_color=(0.2, 0.7, 0.3, 1)
+        )
+        save_btn.bind(on_press=self.save_settings)
+        layout.add_widget(save_btn)
+        
+        self.content = layout
+    
+    def request_overlay_permission(self, instance):
+        """Request overlay permission on Android"""
+        if platform != 'android':
+            show_toast("Only available on Android")
+            return
+        
+        try:
+            from jnius import autoclass
+            
+            VERSION = autoclass('android.os.Build$VERSION')
+            Settings = autoclass('android.provider.Settings')
+            Intent = autoclass('android.content.Intent')
+            Uri = autoclass('android.net.Uri')
+            PythonActivity = autoclass('org.kivy.android.PythonActivity')
+            
+            activity = PythonActivity.mActivity
+            pkg_name = activity.getPackageName()
+            
+            log.debug("[Permission] Package: %s", pkg_name)
+            log.debug("[Permission] SDK: %s", VERSION.SDK_INT)
+            
+            if VERSION.SDK_INT >= 23:
+                has_perm = Settings.canDrawOverlays(activity)
+                log.debug("[Permission] Has overlay: %s", has_perm)
+                
+                if not has_perm:
+                    # Create intent to open overlay settings
+                    uri = Uri.parse("package:" + pkg_name)
+                    intent = Intent(Settings.ACTION_MANAGE_OVERLAY_PERMISSION, uri)
+                    intent.addFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
+                    activity.startActivity(intent)
+                    show_toast("Opening permission settings...")
+                else:
+                    show_toast("Permission already granted!")
+                    # Try to show bubble immediately
+                    self.app.floating_bubble.show("ready")
+            else:
+                show_toast("No permission needed")
+                self.app.floating_bubble.show("ready")
+                
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            show_toast(f"Error: {str(e)[:50]}")
+    
+    def save_settings(self, instance):
+        settings = {
+            'api_key': self.api_key_input.text,
+            'api_url': self.api_url_input.text,
+            'model': self.model_spinner.text,
+            'auto_translate': self.auto_switch.active,
+            'target_lang': self.lang_spinner.text,
+            'enable_bubble': self.bubble_switch.active,
+            'keep_paragraphs': self.para_switch.active,
+            'deterministic': self.det_switch.active,
+            'speculative': self.spec_switch.active,
+            'debug_logging': self.debug_switch.active,
+            'fuzzy_threshold': 0.0 if self.fuzzy_spinner.text == 'Off' else int(self.fuzzy_spinner.text.rstrip('%')) / 100,
+            'settle_delay': 0.0 if self.settle_spinner.text == 'Off' else float(self.settle_spinner.text.rstrip('s'))
+        }
+        # Subscribers (translator, engine, bubble) apply the changes; the file is written shortly after
+        self.app.settings.update(**settings)
+        self.dismiss()
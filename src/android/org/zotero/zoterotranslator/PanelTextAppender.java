@@ -0,0 +1,78 @@
+package org.zotero.zoterotranslator;
+
+import android.view.Choreographer;
+import android.widget.TextView;
+
+/**
+ * Coalesced text updates for the floating panel's TextView.
+ *
+ * Python calls append() once per streamed delta, from any thread. Deltas
+ * are collected here and applied on the next frame with TextView.append,
+ * so the text never crosses the JNI bridge again and at most one UI update
+ * runs per frame however many deltas arrive.
+ *
+ * Must be constructed on the UI thread (Choreographer is per-looper).
+ */
+public class PanelTextAppender implements Choreographer.FrameCallback {
+
+    private final TextView view;
+    private final Choreographer choreographer;
+    private final StringBuilder pending = new StringBuilder();
+    private boolean scheduled = false;
+    private boolean detached = false;
+
+    public PanelTextAppender(TextView view) {
+        this.view = view;
+        this.choreographer = Choreographer.getInstance();
+    }
+
+    /** Queue text to add at the end on the next frame. */
+    public void append(String delta) {
+        if (delta == null || delta.length() == 0) {
+            return;
+        }
+        synchronized (this) {
+            if (detached) {
+                return;
+            }
+            pending.append(delta);
+            schedule();
+        }
+    }
+
+    /** Stop updating the view, e.g. once the panel is removed. */
+    public void detach() {
+        synchronized (this) {
+            detached = true;
+            pending.setLength(0);
+            if (scheduled) {
+                choreographer.removeFrameCallback(this);
+                scheduled = false;
+            }
+        }
+    }
+
+    private void schedule() {
+        // Caller holds the lock; postFrameCallback is safe from any thread
+        if (!scheduled) {
+            scheduled = true;
+            choreographer.postFrameCallback(this);
+        }
+    }
+
+    @Override
+    public void doFrame(long frameTimeNanos) {
+        String text;
+        synchronized (this) {
+            scheduled = false;
+            if (detached) {
+                return;
+            }
+            text = pending.toString();
+            pending.setLength(0);
+        }
+        if (text.length() > 0) {
+            view.append(text);
+        }
+    }
+}
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# core/ is imported from the repository root, as the app and cli.py do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
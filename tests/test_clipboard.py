@@ -0,0 +1,26 @@
+from core.clipboard import ClipboardTracker
+
+
+def test_empty_read_does_not_record_stamp():
+    tracker = ClipboardTracker()
+    assert tracker.stamp_changed(5)
+    assert not tracker.is_new('', 5)
+    # The clip could not be read: it is fetched again on the next tick
+    assert tracker.stamp_changed(5)
+    assert tracker.is_new('text', 5)
+    assert not tracker.stamp_changed(5)
+
+
+def test_whitespace_only_change_is_not_new():
+    tracker = ClipboardTracker()
+    assert tracker.is_new('some text')
+    assert not tracker.is_new('some text')
+    assert not tracker.is_new('  some text\n')
+    assert tracker.is_new('other text')
+
+
+def test_remembered_text_is_not_new():
+    tracker = ClipboardTracker()
+    tracker.remember('translated')
+    assert not tracker.is_new('translated')
+    assert not tracker.is_new('translated ')
@@ -0,0 +1,48 @@
+import random
+
+from core.fuzzy import FuzzyIndex, bounded_levenshtein
+
+
+def levenshtein(a, b):
+    """Textbook dynamic programming reference"""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def test_bounded_levenshtein_matches_reference():
+    rng = random.Random(7)
+    for _ in range(2000):
+        a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 80)))
+        b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 80)))
+        expected = levenshtein(a, b)
+        for max_dist in (0, 1, 5, 20, 200):
+            assert bounded_levenshtein(a, b, max_dist) == min(expected, max_dist + 1), (a, b, max_dist)
+
+
+def test_bounded_levenshtein_long_strings():
+    # Longer than one machine word: the bit vectors are arbitrary-size ints
+    rng = random.Random(3)
+    a = "".join(rng.choice("ab ") for _ in range(300))
+    b = list(a)
+    for i in rng.sample(range(300), 12):
+        b[i] = 'x'
+    b = "".join(b)
+    assert bounded_levenshtein(a, b, 50) == levenshtein(a, b)
+    assert bounded_levenshtein(a, b, 5) == 6
+
+
+def test_lookup_tolerates_small_edits_only():
+    index = FuzzyIndex(threshold=0.9)
+    source = "The proposed method improves accuracy on all benchmark datasets we evaluated."
+    index.add('scope', source, "translation")
+    match = index.lookup('scope', source.replace("improves", "improved"))
+    assert match is not None and match.translation == "translation"
+    assert index.lookup('other scope', source) is None
+    # Numbers and negations must match exactly
+    assert index.lookup('scope', source.replace("all", "not all")) is None
+    assert index.lookup('scope', source + " See Table 2.") is None
@@ -0,0 +1,27 @@
+from core.glossary import Glossary
+
+
+def test_longest_term_wins_where_terms_overlap():
+    glossary = Glossary([("network", "网络"), ("neural network", "神经网络"), ("neural", "神经")])
+    assert glossary.find("A neural network and a network.") == [
+        ("neural network", "神经网络"), ("network", "网络")]
+
+
+def test_leftmost_match_wins_over_a_later_longer_one():
+    glossary = Glossary([("deep learning", "深度学习"), ("learning rate", "学习率")])
+    assert glossary.find("deep learning rate") == [("deep learning", "深度学习")]
+
+
+def test_terms_match_whole_words_case_insensitively():
+    glossary = Glossary([("Attention", "注意力"), ("net", "网")])
+    assert glossary.find("ATTENTION on the internet") == [("Attention", "注意力")]
+
+
+def test_cjk_terms_match_inside_words():
+    glossary = Glossary([("模型", "model")])
+    assert glossary.find("大模型训练") == [("模型", "model")]
+
+
+def test_missing_reports_untranslated_terms():
+    terms = [("neural network", "神经网络"), ("network", "网络")]
+    assert Glossary.missing("使用网络", terms) == [("neural network", "神经网络")]
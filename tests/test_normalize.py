@@ -0,0 +1,18 @@
+from core.normalize import normalize_text
+
+
+def test_crlf_is_one_line_break():
+    assert normalize_text('first line\r\nsecond') == 'first line second'
+    assert normalize_text('first\r\n\r\nsecond') == 'first\n\nsecond'
+
+
+def test_number_lines_inside_text_are_kept():
+    assert normalize_text('x = 1\n2019\ny') == 'x = 1 2019 y'
+    assert normalize_text('Table 1\n1\n2\n3\n4') == 'Table 1 1 2 3 4'
+
+
+def test_page_numbers_are_dropped():
+    assert normalize_text('Some text here\n\n12\n\nMore text') == 'Some text here\n\nMore text'
+    text = 'end of page one\n12\nstart of page two and\nmore\n13\nnext'
+    assert normalize_text(text) == 'end of page one start of page two and more next'
+    assert normalize_text('Page 3\n\nHello') == 'Hello'
@@ -0,0 +1,27 @@
+from core.placeholders import protect, restore
+
+
+def test_round_trip():
+    text = "As shown in [12], $E = mc^2$ holds (Smith et al., 2020); see https://example.org/a."
+    masked, spans = protect(text)
+    assert spans == ["[12]", "$E = mc^2$", "(Smith et al., 2020)", "https://example.org/a"]
+    assert masked == "As shown in ⟦1⟧, ⟦2⟧ holds ⟦3⟧; see ⟦4⟧."
+    assert restore(masked, spans) == (text, [])
+
+
+def test_repeated_span_shares_a_placeholder():
+    masked, spans = protect("[3] and again [3]")
+    assert masked == "⟦1⟧ and again ⟦1⟧"
+    assert spans == ["[3]"]
+
+
+def test_spaced_placeholders_are_restored():
+    _, spans = protect("Equation $x^2$ and [4].")
+    assert restore("公式 ⟦ 1 ⟧ 和 ⟦2 ⟧。", spans) == ("公式 $x^2$ 和 [4]。", [])
+
+
+def test_lost_and_unknown_placeholders_are_reported():
+    _, spans = protect("Equation $x^2$ and [4].")
+    restored, problems = restore("公式 ⟦1⟧ 和 ⟦7⟧。", spans)
+    assert restored == "公式 $x^2$ 和 ⟦7⟧。"
+    assert problems == ["⟦2⟧", "⟦7⟧"]
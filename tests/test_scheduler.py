@@ -0,0 +1,108 @@
+import threading
+
+from core.scheduler import PRIORITY_HIGH, PRIORITY_LOW, TranslationScheduler
+
+
+class FakeEngine:
+    """Translates by upper-casing; texts in `blocking` wait for release"""
+
+    def __init__(self, blocking=()):
+        self.blocking = set(blocking)
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def key_for(self, text):
+        return text
+
+    def translate(self, text, source="manual"):
+        from core.engine import TranslationResult
+        with self._lock:
+            self.calls.append((text, source))
+        if text in self.blocking:
+            self.started.set()
+            self.release.wait(5)
+        return TranslationResult(text, text.upper(), True, 'api')
+
+
+class Calls:
+    """on_done callback recording its jobs; wait(n) blocks until n calls arrived"""
+
+    def __init__(self):
+        self.jobs = []
+        self._changed = threading.Condition()
+
+    def __call__(self, job):
+        with self._changed:
+            self.jobs.append(job)
+            self._changed.notify_all()
+
+    def wait(self, n, timeout=5):
+        with self._changed:
+            return self._changed.wait_for(lambda: len(self.jobs) >= n, timeout)
+
+
+def busy_scheduler():
+    """A one-worker scheduler whose worker is held by a running job"""
+    engine = FakeEngine(blocking={"first"})
+    scheduler = TranslationScheduler(engine, workers=1)
+    running = scheduler.submit("first")
+    assert engine.started.wait(5)
+    return engine, scheduler, running
+
+
+def test_identical_requests_share_one_job():
+    engine, scheduler, running = busy_scheduler()
+    results = Calls()
+    first = scheduler.submit("second", on_done=results)
+    second = scheduler.submit("second", on_done=results)
+    assert first is second
+    engine.release.set()
+    assert first.wait(5).text == "SECOND"
+    assert results.wait(2)
+    assert engine.calls.count(("second", "manual")) == 1
+    assert results.jobs == [first, first]
+
+
+def test_cancelling_a_deduped_job_keeps_the_other_requester():
+    engine, scheduler, running = busy_scheduler()
+    mine, theirs = Calls(), Calls()
+    job = scheduler.submit("second", on_done=mine)
+    scheduler.submit("second", on_done=theirs)
+    assert scheduler.cancel(job, on_done=mine)
+    assert job.status == "queued"
+    engine.release.set()
+    assert job.wait(5).text == "SECOND"
+    assert theirs.wait(1)
+    assert theirs.jobs == [job] and mine.jobs == []
+
+
+def test_cancelling_the_last_requester_withdraws_the_job():
+    engine, scheduler, running = busy_scheduler()
+    callback = Calls()
+    job = scheduler.submit("second", on_done=callback)
+    assert scheduler.cancel(job, on_done=callback)
+    assert job.status == "cancelled"
+    assert not scheduler.cancel(job)
+    # A new request for the same text starts a new job
+    again = scheduler.submit("second")
+    assert again is not job
+    engine.release.set()
+    assert again.wait(5).text == "SECOND"
+    assert engine.calls.count(("second", "manual")) == 1
+
+
+def test_higher_priority_request_promotes_a_queued_job():
+    engine, scheduler, running = busy_scheduler()
+    background = scheduler.submit("later", source="monitor", priority=PRIORITY_LOW)
+    job = scheduler.submit("wanted", source="monitor", priority=PRIORITY_LOW)
+    assert scheduler.submit("wanted", source="manual", priority=PRIORITY_HIGH) is job
+    assert job.source == "manual"
+    engine.release.set()
+    background.wait(5)
+    job.wait(5)
+    texts = [text for text, _ in engine.calls]
+    assert texts.index("wanted") < texts.index("later")
+    assert ("wanted", "manual") in engine.calls
+    assert texts.count("wanted") == 1
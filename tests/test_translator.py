@@ -0,0 +1,14 @@
+from translator import TranslatorService
+
+
+def test_deterministic_profile_has_its_own_cache_keys():
+    translator = TranslatorService()
+    default_key = translator.cache_key('hello')
+    translator.apply_settings({'deterministic': True})
+    deterministic_key = translator.cache_key('hello')
+    assert deterministic_key != default_key
+    # Without the seed the output is no longer the same
+    translator.seed_supported = False
+    assert translator.cache_key('hello') not in (default_key, deterministic_key)
+    translator.apply_settings({'deterministic': False})
+    assert translator.cache_key('hello') == default_key
@@ -0,0 +1,186 @@
+"""
+Text View - virtualized display of long translations
+
+A single Label/TextInput lays out the whole text as one texture, which
+fails beyond the GPU texture limit and relayouts everything on each
+change. Here the text is split into paragraph blocks shown by a
+RecycleView, so only the blocks near the viewport exist as widgets, and
+append() re-splits just the open last paragraph.
+
+Labels cannot be selected like the old read-only TextInput; instead a
+double tap copies one paragraph (block_copy) and the Copy button copies
+everything.
+"""
+
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+from core.segment import split_point
+
+
+# Longest block laid out as one texture
+BLOCK_CHARS = 1500
+FONT_SIZE = 15
+
+
+def split_blocks(text):
+    """Raw pieces of text, cut after paragraph breaks or at BLOCK_CHARS; they join back to text"""
+    pieces = []
+    start = 0
+    while start < len(text):
+        brk = text.find('\n\n', start)
+        if brk != -1 and brk - start < BLOCK_CHARS:
+            end = brk + 2
+            while end < len(text) and text[end] == '\n':
+                end += 1
+        else:
+            end = split_point(text, start, BLOCK_CHARS)
+        pieces.append(text[start:end])
+        start = end
+    return pieces
+
+
+class TextBlock(RecycleDataViewBehavior, Label):
+    """One recycled paragraph; reports its real height back to the data"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.index = None
+        self.rv = None
+        self.halign = 'left'
+        self.valign = 'top'
+        self.font_size = dp(FONT_SIZE)
+        self.color = (0.9, 1.0, 0.9, 1)
+        self.size_hint_y = None
+        self.bind(width=self._update_text_size, texture_size=self._update_height)
+
+    def _update_text_size(self, instance, width):
+        self.text_size = (width - dp(12), None)
+
+    def _update_height(self, instance, texture_size):
+        height = texture_size[1] + dp(8)
+        if self.rv is None or self.index is None or self.index >= len(self.rv.data):
+            return
+        item = self.rv.data[self.index]
+        if item['text'] == self.text and abs(item['height'] - height) > 1:
+            # Only this item's size changed: one batched relayout, not a rebuild per block
+            item['height'] = height
+            self.rv.trigger_relayout()
+
+    def on_touch_down(self, touch):
+        if self.collide_point(*touch.pos) and touch.is_double_tap and self.rv is not None \
+                and self.rv.block_copy is not None:
+            self.rv.block_copy(self.text)
+            return True
+        return super().on_touch_down(touch)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this recycled widget to another block"""
+        self.rv = rv
+        self.index = index
+        return super().refresh_view_attrs(rv, index, data)
+
+
+class ScrollableLabel(RecycleView):
+    """Scrollable read-only text display with .text and append()"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.do_scroll_x = False
+        self.bar_width = dp(6)
+        self.viewclass = TextBlock
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(40)),
+            default_size_hint=(1, None),
+            padding=(dp(6), dp(4))
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+        with self.canvas.before:
+            Color(0.15, 0.18, 0.15, 1)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_bg, size=self._update_bg)
+
+        self._chunks = []           # appended pieces; joined lazily by .text
+        self._joined = ""
+        self._tail = ""             # last, still open piece
+        self._tail_count = 0        # data items shown for the tail
+        self.glyph_check = None     # called with each new piece before it is shown
+        self.block_copy = None      # called with a paragraph's text on double tap
+        self.trigger_relayout = Clock.create_trigger(lambda dt: self.refresh_from_layout())
+        self.text = ""
+
+    def _update_bg(self, *args):
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+
+    @property
+    def text(self):
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+            self._chunks = [self._joined] if self._joined else []
+        return self._joined
+
+    @text.setter
+    def text(self, value):
+        self._chunks = []
+        self._joined = ""
+        self._tail = ""
+        self._tail_count = 0
+        self.data = []
+        if value:
+            self._extend(value)
+        else:
+            self.data = [{'text': "Translation appears here...", 'height': dp(40), 'color': (0.5, 0.6, 0.5, 1)}]
+            self._tail_count = 1
+        # Scroll to top when new text is set
+        self.scroll_y = 1
+
+    def append(self, piece):
+        """Add text at the end; only the open last paragraph is re-split"""
+        if piece:
+            if not self._chunks and self._tail_count:
+                # Drop the placeholder
+                self.data = []
+                self._tail_count = 0
+            self._extend(piece)
+
+    def _extend(self, piece):
+        if self.glyph_check is not None:
+            self.glyph_check(piece)
+        self._chunks.append(piece)
+        self._joined = None
+        pieces = split_blocks(self._tail + piece)
+        self._tail = pieces[-1] if pieces else ""
+        items = [self._item(p) for p in pieces]
+        items = [item for item in items if item is not None]
+        self._replace_tail(items, 1 if items and self._item(self._tail) is not None else 0)
+
+    def _replace_tail(self, items, tail_count):
+        start = len(self.data) - self._tail_count
+        self.data[start:] = items
+        self._tail_count = tail_count
+
+    def _item(self, piece):
+        block = piece.strip('\n')
+        if not block:
+            return None
+        return {'text': block, 'height': self._estimate_height(block), 'color': (0.9, 1.0, 0.9, 1)}
+
+    def _estimate_height(self, block):
+        # Refined by TextBlock once the block is actually laid out
+        width = max(self.width - dp(24), dp(100))
+        char_width = dp(FONT_SIZE) * 0.55
+        lines = 0
+        for line in block.split('\n'):
+            chars = sum(2 if ord(ch) >= 0x1100 else 1 for ch in line)
+            lines += max(1, int(chars * char_width / width) + 1)
+        return lines * dp(FONT_SIZE) * 1.25 + dp(8)
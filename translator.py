@@ -2,10 +2,28 @@
 Translation Service - SiliconFlow API
 """
 
+import hashlib
 import json
+import socket
+import urllib.parse
 import urllib.request
 import urllib.error
 import ssl
+import threading
+
+from core.placeholders import protect, restore
+from core.log import get_logger
+from core.prompts import CURRENT_VERSION, SAMPLING_PROFILES, get_template
+
+log = get_logger('translator')
+
+
+ERROR_PREFIXES = ("Error:", "Translation failed:")
+
+
+def is_error_result(result):
+    """Check whether a translate() result is an error message"""
+    return not result or result.startswith(ERROR_PREFIXES)
 
 
 class TranslatorService:
@@ -16,11 +34,34 @@ class TranslatorService:
         self.api_url = "https://api.siliconflow.cn"
         self.model = "Qwen/Qwen2.5-7B-Instruct"
         self.target_lang = "Chinese"
-        
-        # SSL context - disable verification for Android compatibility
-        self.ssl_context = ssl.create_default_context()
-        self.ssl_context.check_hostname = False
-        self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Swap formulas, citations, URLs and DOIs for placeholders around the API call
+        self.protect_spans = True
+        self.prompt_version = CURRENT_VERSION
+        # 'default' or 'deterministic' (temperature 0 and a fixed seed)
+        self.profile = 'default'
+        self.seed_supported = True
+        # usage dicts of the current thread's API calls, see pop_usage()
+        self._local = threading.local()
+        # Created on first use (loading the CA store is slow), see warm_up()
+        self._ssl_context = None
+    
+    @property
+    def ssl_context(self):
+        """SSL context - disable verification for Android compatibility"""
+        if self._ssl_context is None:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+    
+    def warm_up(self):
+        """Prepare the first request off the UI thread: SSL context and DNS lookup of the API host"""
+        self.ssl_context
+        url = urllib.parse.urlparse(self.api_url)
+        if url.hostname and self.api_key:
+            port = url.port or (443 if url.scheme == 'https' else 80)
+            socket.getaddrinfo(url.hostname, port, type=socket.SOCK_STREAM)
     
     def set_config(self, api_key="", api_url="", model="", target_lang=""):
         """Set configuration"""
@@ -33,8 +74,61 @@ class TranslatorService:
         if target_lang:
             self.target_lang = target_lang
     
-    def translate(self, text):
-        """Translate text"""
+    # Settings this service follows, see apply_settings()
+    SETTINGS_KEYS = ('api_key', 'api_url', 'model', 'target_lang', 'deterministic')
+    
+    def apply_settings(self, changes):
+        """Settings subscriber: apply changed values from core.settings.Settings"""
+        self.set_config(
+            api_key=changes.get('api_key', ''),
+            api_url=changes.get('api_url', ''),
+            model=changes.get('model', ''),
+            target_lang=changes.get('target_lang', '')
+        )
+        if 'deterministic' in changes:
+            self.profile = 'deterministic' if changes['deterministic'] else 'default'
+    
+    def sampling(self):
+        """Sampling parameters of the current profile, as sent to the API"""
+        params = dict(SAMPLING_PROFILES.get(self.profile, SAMPLING_PROFILES['default']))
+        if not self.seed_supported:
+            params.pop('seed', None)
+        return params
+    
+    def config_scope(self):
+        """Settings that change the output for the same input text"""
+        parts = [self.model, self.target_lang, f"prompt-v{self.prompt_version}"]
+        if self.profile != 'default':
+            # Results sampled at the default temperature keep their existing keys
+            parts.append(self.profile)
+            seed = self.sampling().get('seed')
+            if seed is not None:
+                parts.append(f"seed-{seed}")
+        return "\x00".join(parts)
+    
+    def cache_key(self, text, terms=()):
+        """Key identifying a translation of text under the current config"""
+        material = self.config_scope() + "\x00" + text
+        if terms:
+            # Glossary terms injected into the prompt change the output too
+            material += "\x00" + "\x01".join(f"{source}\x02{target}" for source, target in terms)
+        return hashlib.sha1(material.encode('utf-8')).hexdigest()
+    
+    def pop_usage(self):
+        """Summed token usage of this thread's API calls since the last pop, or None"""
+        calls = getattr(self._local, 'usage', None)
+        self._local.usage = None
+        if not calls:
+            return None
+        total = {}
+        for usage in calls:
+            for name, value in usage.items():
+                if isinstance(value, (int, float)):
+                    total[name] = total.get(name, 0) + value
+        return total
+    
+    def translate(self, text, terms=None):
+        """Translate text; terms are (source, target) glossary pairs found in it"""
         if not self.api_key:
             return "Error: Please configure API Key in settings"
         
@@ -42,28 +136,31 @@ class TranslatorService:
             return "Error: No text to translate"
         
         system_prompt = self._build_system_prompt()
-        user_prompt = self._build_user_prompt(text)
+        use_placeholders = self.protect_spans and get_template(self.prompt_version).placeholders
+        masked, spans = protect(text) if use_placeholders else (text, [])
+        user_prompt = self._build_user_prompt(masked, terms)
         
         try:
             result = self._call_api(system_prompt, user_prompt)
+            if spans:
+                restored, problems = restore(result, spans)
+                if problems:
+                    # A placeholder was dropped or invented: resend unmasked rather than lose a span
+                    log.debug("[Translator] Placeholders not preserved %s, retrying unmasked", problems)
+                    result = self._call_api(system_prompt, self._build_user_prompt(text, terms))
+                else:
+                    result = restored
             return result
         except Exception as e:
             return f"Translation failed: {str(e)}"
     
     def _build_system_prompt(self):
         """Build system prompt"""
-        return f"""You are a professional academic translator. Translate the given text to {self.target_lang}.
-
-Rules:
-1. Accurate translation preserving academic terminology
-2. Natural and fluent output
-3. Keep professional terms, add original in brackets if needed
-4. Maintain paragraph structure
-5. Output translation only, no explanations"""
+        return get_template(self.prompt_version).system_prompt(self.target_lang)
     
-    def _build_user_prompt(self, text):
+    def _build_user_prompt(self, text, terms=None):
         """Build user prompt"""
-        return f"Translate to {self.target_lang}:\n\n{text}"
+        return get_template(self.prompt_version).user_prompt(text, self.target_lang, terms)
     
     def _call_api(self, system_prompt, user_prompt):
         """Call SiliconFlow API"""
@@ -80,10 +177,10 @@ Rules:
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            "temperature": 0.3,
             "max_tokens": 4096,
             "stream": False
         }
+        payload.update(self.sampling())
         
         data = json.dumps(payload).encode('utf-8')
         
@@ -98,6 +195,18 @@ Rules:
             with urllib.request.urlopen(request, context=self.ssl_context, timeout=60) as response:
                 result = json.loads(response.read().decode('utf-8'))
                 
+                usage = result.get('usage')
+                if isinstance(usage, dict):
+                    # Prefix-cache hits: OpenAI style, else DeepSeek/SiliconFlow style
+                    details = usage.get('prompt_tokens_details')
+                    cached = details.get('cached_tokens') if isinstance(details, dict) else None
+                    if cached is None:
+                        cached = usage.get('prompt_cache_hit_tokens')
+                    usage = dict(usage, cached_tokens=cached or 0)
+                    if getattr(self._local, 'usage', None) is None:
+                        self._local.usage = []
+                    self._local.usage.append(usage)
+                
                 if 'choices' in result and len(result['choices']) > 0:
                     return result['choices'][0]['message']['content']
                 else:
@@ -110,6 +219,10 @@ Rules:
                 error_msg = error_json.get('error', {}).get('message', str(e))
             except:
                 error_msg = error_body or str(e)
+            if e.code in (400, 422) and 'seed' in payload and 'seed' in error_msg.lower():
+                # Server does not accept a seed: keep temperature 0 and retry without it
+                self.seed_supported = False
+                return self._call_api(system_prompt, user_prompt)
             raise Exception(f"HTTP {e.code}: {error_msg}")
             
         except urllib.error.URLError as e: